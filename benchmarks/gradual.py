@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# Compares the latency other writers see while bfl removes one huge file, with a plain unlink and with
+# --gradual truncation. A probe thread keeps writing a small block to its own file and fdatasync'ing it
+# (the journal-bound kind of I/O an unlink stall hurts), while the file is burned in-process; the
+# probe's latencies during the burn are reported as percentiles, as JSON. The scratch directory must
+# be on a real disk filesystem: on tmpfs neither mode touches a journal and the numbers mean nothing.
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import bfl  # noqa: E402
+
+DEFAULT_SIZE = "8G"
+DEFAULT_REPEAT = 3
+PROBE_BLOCK_SIZE = 4096
+PROBE_INTERVAL = 0.005
+# The probe runs alone for this long first, and keeps going this long after the burn for deferred work.
+PROBE_LEAD_SECONDS = 0.5
+PROBE_TAIL_SECONDS = 1.0
+FILL_CHUNK_SIZE = 64 * 1024 * 1024
+PERCENTILES = (50, 99, 99.9)
+
+
+class WriteProbe:
+    # Small synced writes in a loop, each timed; records (start, seconds) pairs until stopped.
+    def __init__(self, path):
+        self.path = path
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        block = b"\xa5" * PROBE_BLOCK_SIZE
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            offset = 0
+            while not self._stop.is_set():
+                start = time.monotonic()
+                os.pwrite(fd, block, offset)
+                os.fdatasync(fd)
+                self.samples.append((start, time.monotonic() - start))
+                offset = (offset + PROBE_BLOCK_SIZE) % (256 * PROBE_BLOCK_SIZE)
+                time.sleep(PROBE_INTERVAL)
+        finally:
+            os.close(fd)
+            os.unlink(self.path)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+
+def _make_file(path, size, fill):
+    # Allocates extents without writing the data when the filesystem can (and fill is off); preallocated
+    # extents are few and large, so writing the data gives a more realistic extent count to release.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        allocated = False
+        if not fill and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                allocated = True
+            except OSError:
+                pass
+        if not allocated:
+            chunk = os.urandom(FILL_CHUNK_SIZE)
+            remaining = size
+            while remaining > 0:
+                remaining -= os.write(fd, chunk[:min(remaining, len(chunk))])
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _latency_summary(samples, since):
+    values = sorted(seconds for start, seconds in samples if start >= since)
+    summary = {"samples": len(values)}
+    for percent in PERCENTILES:
+        value = _percentile(values, percent)
+        summary[f"p{percent:g}_ms"] = round(value * 1000, 3) if value is not None else None
+    summary["max_ms"] = round(values[-1] * 1000, 3) if values else None
+    return summary
+
+
+def bench_mode(scratch_dir, size, remover, fill):
+    target = os.path.join(scratch_dir, "bfl-gradual-bench.dat")
+    _make_file(target, size, fill)
+    probe = WriteProbe(os.path.join(scratch_dir, "bfl-gradual-probe.dat"))
+    probe.start()
+    try:
+        time.sleep(PROBE_LEAD_SECONDS)
+        burn_start = time.monotonic()
+        result = bfl.burn_files([bfl.BurnTarget(target, size)], remover=remover)[0]
+        burn_seconds = time.monotonic() - burn_start
+        time.sleep(PROBE_TAIL_SECONDS)
+    finally:
+        probe.stop()
+    if not result.ok:
+        raise RuntimeError(f"could not burn the benchmark file: {result.error}")
+    return {"burn_seconds": round(burn_seconds, 3),
+            "baseline": _latency_summary([sample for sample in probe.samples if sample[0] < burn_start], 0.0),
+            "during_burn": _latency_summary(probe.samples, burn_start)}
+
+
+def _worst(runs, key):
+    # Across repeats, keep each percentile's worst value: tail latency is about the bad runs.
+    merged = dict(runs[0][key])
+    for run in runs[1:]:
+        for name, value in run[key].items():
+            if name.endswith("_ms") and value is not None:
+                merged[name] = max(merged[name] or 0.0, value)
+    merged["samples"] = sum(run[key]["samples"] for run in runs)
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare probe write latency during a plain and a gradual burn.")
+    parser.add_argument("--dir", default=tempfile.gettempdir(),
+                        help="Scratch directory on the filesystem to test (default: the temp directory).")
+    parser.add_argument("--size", default=DEFAULT_SIZE, help=f"Size of the burned file (default: {DEFAULT_SIZE}).")
+    parser.add_argument("--step", default=None, help="--gradual-step to use (default: bfl's).")
+    parser.add_argument("--pause", type=float, default=bfl.GRADUAL_DEFAULT_PAUSE,
+                        help=f"--gradual-pause to use (default: {bfl.GRADUAL_DEFAULT_PAUSE:g}).")
+    parser.add_argument("--fill", action="store_true",
+                        help="Write the file's data instead of preallocating it (slower to set up, more extents).")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per mode (default: {DEFAULT_REPEAT}).")
+    args = parser.parse_args()
+
+    size = bfl.parse_size(args.size)
+    step = bfl.parse_size(args.step) if args.step else bfl.GRADUAL_DEFAULT_STEP
+    modes = {
+        "unlink": lambda: bfl.UNLINK,
+        "gradual": lambda: bfl.GradualTruncator(threshold=0, step=step, pause=args.pause),
+    }
+    results = {"scratch_dir": os.path.abspath(args.dir), "bytes": size, "step": step, "pause": args.pause, "modes": {}}
+    for name, make_remover in modes.items():
+        runs = [bench_mode(args.dir, size, make_remover(), args.fill) for _ in range(max(1, args.repeat))]
+        results["modes"][name] = {
+            "burn_seconds": max(run["burn_seconds"] for run in runs),
+            "baseline": _worst(runs, "baseline"),
+            "during_burn": _worst(runs, "during_burn"),
+        }
+    sys.stdout.write(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# Measures bfl's per-invocation latency on the headless path (--yes --no-animation) against a bare
+# interpreter start, and fails when the overhead exceeds the target.
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Invoke bfl the way the console-script entry point does, so the module's cached bytecode is used.
+ENTRY_POINT = "import sys; sys.argv[0] = 'bfl'; from bfl import main_cli; main_cli()"
+DEFAULT_TARGET_MS = 35.0
+DEFAULT_RUNS = 20
+
+
+def _child_env():
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = REPO_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _time_command(command, env, setup=None):
+    if setup is not None:
+        setup()
+    start = time.perf_counter()
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check bfl headless startup latency against a target.")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS,
+                        help=f"Maximum median overhead over a bare interpreter start (default: {DEFAULT_TARGET_MS:g}).")
+    args = parser.parse_args()
+
+    env = _child_env()
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        victim = os.path.join(scratch_dir, "victim.txt")
+
+        def make_victim():
+            with open(victim, "w") as f:
+                f.write("worry\n")
+
+        bfl_command = [sys.executable, "-c", ENTRY_POINT, "--yes", "--no-animation", victim]
+        bare_command = [sys.executable, "-c", "pass"]
+        _time_command(bfl_command, env, make_victim)  # warm the bytecode cache
+
+        bare_ms = [_time_command(bare_command, env) for _ in range(args.runs)]
+        bfl_ms = [_time_command(bfl_command, env, make_victim) for _ in range(args.runs)]
+
+    bare_median = statistics.median(bare_ms)
+    bfl_median = statistics.median(bfl_ms)
+    overhead = bfl_median - bare_median
+    print(f"interpreter: {bare_median:.1f} ms  bfl --yes --no-animation: {bfl_median:.1f} ms  "
+          f"overhead: {overhead:.1f} ms (target {args.target_ms:g} ms)")
+    return 0 if overhead <= args.target_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
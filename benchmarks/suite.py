@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# Measures bfl's hot paths without a terminal: every CursesAnimator phase against a recording stand-in
+# for stdscr (on a virtual clock, so sleeps cost nothing and frame schedules are exact), across
+# filename lengths and terminal sizes, and the deletion path across file counts and sizes on tmpfs.
+# Prints the results as JSON. With --check, fails when cells per frame or wall time per phase exceed a
+# stored baseline (see benchmarks/baseline.json; wall times are machine-specific, so regenerate the
+# baseline with --write-baseline when moving to other hardware).
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+from unittest import mock
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import bfl  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+NAME_LENGTHS = (8, 32, 96)
+TERMINAL_SIZES = ((24, 80), (40, 120), (60, 240))
+# (file count, bytes per file)
+DELETE_CASES = ((1000, 0), (10000, 0), (1000, 4096), (100, 1024 * 1024))
+TMPFS_DIR = "/dev/shm"
+DEFAULT_REPEAT = 3
+# Allowed growth over the baseline before --check fails.
+DEFAULT_CELLS_TOLERANCE = 0.05
+DEFAULT_TIME_TOLERANCE = 1.0
+# Phases faster than this are below timer noise and are not compared.
+MIN_COMPARED_SECONDS = 0.001
+
+
+class VirtualClock:
+    # Stands in for time.monotonic/time.sleep: time only moves when the animator sleeps.
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+class RecordingScreen:
+    # The parts of a curses window the animator touches, counting what a terminal would receive.
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.addstr_calls = 0
+        self.bytes = 0
+        self.refreshes = 0
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def addstr(self, y, x, text, attr=0):
+        self.addstr_calls += 1
+        self.bytes += len(text.encode("utf-8"))
+
+    def noutrefresh(self):
+        self.refreshes += 1
+
+    def refresh(self):
+        self.refreshes += 1
+
+    def clear(self):
+        pass
+
+    def nodelay(self, flag):
+        pass
+
+    def getch(self):
+        return -1
+
+
+def _fake_curses():
+    # Just enough of the curses module for _init_colors and FrameBuffer, with no terminal behind it.
+    return types.SimpleNamespace(
+        error=RuntimeError, A_NORMAL=0, A_BOLD=1 << 21, COLORS=256,
+        COLOR_BLACK=0, COLOR_RED=1, COLOR_YELLOW=3, COLOR_CYAN=6, COLOR_WHITE=7,
+        start_color=lambda: None, use_default_colors=lambda: None, init_pair=lambda number, fg, bg: None,
+        color_pair=lambda number: number << 8, curs_set=lambda visibility: None, doupdate=lambda: None,
+    )
+
+
+def _snapshot(animator, screen):
+    counters = animator.stats.counters
+    return counters["frames"], counters["cells_written"], screen.addstr_calls, screen.bytes, screen.refreshes
+
+
+def bench_phases(name_len, height, width):
+    clock = VirtualClock()
+    virtual_time = types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep, time=time.time)
+    screen = RecordingScreen(height, width)
+    with mock.patch.object(bfl, "curses", _fake_curses()), mock.patch.object(bfl, "time", virtual_time):
+        animator = bfl.CursesAnimator(screen, "n" * name_len, quality=bfl.QUALITY_FULL)
+        animator.clock._time = clock.monotonic
+        animator.clock._sleep = clock.sleep
+        animator._init_colors()
+        if not animator._setup_dimensions():
+            return None
+        animator.timeline = bfl.build_timeline(animator.name_len, animator.animation_width, animator.seed)
+        phases = {}
+        for phase in bfl.PHASE_BUDGET_WEIGHTS:
+            before = _snapshot(animator, screen)
+            start = time.perf_counter()
+            animator._play_phase(phase)
+            seconds = time.perf_counter() - start
+            frames, cells, addstr_calls, num_bytes, refreshes = (
+                after - prior for after, prior in zip(_snapshot(animator, screen), before))
+            phases[phase] = {
+                "frames": frames, "cells": cells, "addstr_calls": addstr_calls, "bytes": num_bytes,
+                "refreshes": refreshes, "cells_per_frame": round(cells / frames, 3) if frames else 0.0,
+                "seconds": round(seconds, 6),
+            }
+    return {"name_len": animator.name_len, "height": height, "width": width, "phases": phases}
+
+
+def _best_of(repeat, run):
+    # Counts are deterministic; only the wall times vary, so keep the fastest of each.
+    best = None
+    for _ in range(repeat):
+        result = run()
+        if result is None:
+            return None
+        if best is None:
+            best = result
+            continue
+        for phase, stats in result["phases"].items():
+            best["phases"][phase]["seconds"] = min(best["phases"][phase]["seconds"], stats["seconds"])
+    return best
+
+
+def _make_files(directory, count, size):
+    payload = b"\0" * size
+    paths = []
+    for index in range(count):
+        path = os.path.join(directory, f"f{index:06d}")
+        with open(path, "wb") as f:
+            f.write(payload)
+        paths.append(path)
+    return [bfl.BurnTarget(path, size) for path in paths]
+
+
+def bench_delete(count, size, scratch_root, repeat):
+    best = None
+    for _ in range(repeat):
+        directory = tempfile.mkdtemp(prefix="bfl-bench-", dir=scratch_root)
+        try:
+            targets = _make_files(directory, count, size)
+            start = time.perf_counter()
+            results = bfl.burn_files(targets)
+            seconds = time.perf_counter() - start
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        if not all(result.ok for result in results):
+            raise RuntimeError(f"deletion benchmark failed to remove {count} files of {size} bytes")
+        best = seconds if best is None else min(best, seconds)
+    return {"files": count, "bytes_per_file": size, "seconds": round(best, 6),
+            "files_per_second": round(count / best) if best > 0 else None}
+
+
+def run_suite(repeat, skip_delete):
+    render = []
+    for height, width in TERMINAL_SIZES:
+        for name_len in NAME_LENGTHS:
+            result = _best_of(repeat, lambda: bench_phases(name_len, height, width))
+            if result is not None:
+                render.append(result)
+    results = {"version": 1, "python": sys.version.split()[0], "render": render}
+    if not skip_delete:
+        scratch_root = TMPFS_DIR if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK) else None
+        results["delete"] = {
+            "scratch_dir": scratch_root or tempfile.gettempdir(),
+            "tmpfs": scratch_root is not None,
+            "cases": [bench_delete(count, size, scratch_root, repeat) for count, size in DELETE_CASES],
+        }
+    return results
+
+
+def check_against(results, baseline, cells_tolerance, time_tolerance):
+    # Returns one message per regression.
+    regressions = []
+    baseline_cases = {(case["name_len"], case["height"], case["width"]): case for case in baseline.get("render", [])}
+    for case in results["render"]:
+        key = (case["name_len"], case["height"], case["width"])
+        reference = baseline_cases.get(key)
+        if reference is None:
+            continue
+        label = f"name_len={key[0]} {key[1]}x{key[2]}"
+        for phase, stats in case["phases"].items():
+            expected = reference["phases"].get(phase)
+            if expected is None:
+                continue
+            if stats["cells_per_frame"] > expected["cells_per_frame"] * (1 + cells_tolerance):
+                regressions.append(f"{label} {phase}: {stats['cells_per_frame']} cells/frame "
+                                   f"(baseline {expected['cells_per_frame']})")
+            limit = max(expected["seconds"], MIN_COMPARED_SECONDS) * (1 + time_tolerance)
+            if stats["seconds"] > limit:
+                regressions.append(f"{label} {phase}: {stats['seconds'] * 1000:.2f} ms "
+                                   f"(baseline {expected['seconds'] * 1000:.2f} ms)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bfl's animation phases and deletion path.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"Runs per case; the fastest wall time is kept (default: {DEFAULT_REPEAT}).")
+    parser.add_argument("--skip-delete", action="store_true", help="Only benchmark the animation phases.")
+    parser.add_argument("--output", metavar="PATH", help="Write the JSON results to PATH instead of stdout.")
+    parser.add_argument("--check", metavar="BASELINE", nargs="?", const=DEFAULT_BASELINE,
+                        help="Fail when a phase regresses past BASELINE (default: benchmarks/baseline.json).")
+    parser.add_argument("--write-baseline", metavar="PATH", nargs="?", const=DEFAULT_BASELINE,
+                        help="Store the results as the new baseline.")
+    parser.add_argument("--cells-tolerance", type=float, default=DEFAULT_CELLS_TOLERANCE,
+                        help=f"Allowed relative growth in cells per frame (default: {DEFAULT_CELLS_TOLERANCE:g}).")
+    parser.add_argument("--time-tolerance", type=float, default=DEFAULT_TIME_TOLERANCE,
+                        help=f"Allowed relative growth in wall time per phase (default: {DEFAULT_TIME_TOLERANCE:g}).")
+    args = parser.parse_args()
+
+    results = run_suite(max(1, args.repeat), args.skip_delete)
+    text = json.dumps(results, indent=2) + "\n"
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    if args.write_baseline:
+        with open(args.write_baseline, "w") as f:
+            f.write(json.dumps({"version": results["version"], "render": results["render"]}, indent=2) + "\n")
+
+    if args.check:
+        with open(args.check) as f:
+            baseline = json.load(f)
+        regressions = check_against(results, baseline, args.cells_tolerance, args.time_tolerance)
+        for regression in regressions:
+            sys.stderr.write(f"regression: {regression}\n")
+        if regressions:
+            return 1
+        sys.stderr.write("no regressions against the baseline\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,25 @@
 #!/usr/bin/env python3
-import curses
 import time
 import os
 import sys
-import itertools
 import argparse
+import bisect
+import collections
+import functools
+import stat
+import threading
+
+# curses, random and concurrent.futures are imported on first use so that headless runs
+# (cron jobs, cleanup hooks) do not pay for them at startup.
+curses = None
+
+
+def _load_curses():
+    global curses
+    if curses is None:
+        import curses as curses_module
+        curses = curses_module
+    return curses
 
 # --- ANSI Escape Codes for Pre-Curses Messages ---
 class ConfirmAnsiColors:
@@ -34,17 +49,573 @@ FLAME_CHARS = ["&", "*", "^", "✸", "✺", "✹", "✵", "#", "@", "W", "V", "M
 EMBER_CHARS = ['∴', '∵', '.', '*', '·', '°', ':']
 ASH_CHARS = ['.', '`', ' ', ':', '.', ' ', '~', '-']
 
+# --- Timing Constants ---
+DEFAULT_BURN_DURATION = 6.0
+DEFAULT_FPS = 15.0
+EXTINGUISHED_HOLD_SECONDS = 1.5
+# Share of the total burn duration given to each animation phase, in playing order.
+PHASE_BUDGET_WEIGHTS = {
+    "paper": 0.08,
+    "ignition": 0.07,
+    "consumption": 0.35,
+    "full_burn": 0.14,
+    "embers": 0.16,
+    "ashes": 0.16,
+    "settle": 0.04,
+}
+# Without known totals (recursive and streamed burns), consumption burns this far into its frames on
+# the time budget and then keeps burning there, stepping back and forth through the frames below
+# (offsets from that point) whenever more entries or bytes have been processed, until the work is done.
+UNKNOWN_TOTAL_BURN_FRACTION = 0.85
+UNKNOWN_TOTAL_FLICKER_OFFSETS = (0, 1, 2, 3, 2, 1)
+
+
+# --- Frame Clock ---
+class FrameClock:
+    def __init__(self, fps, time_fn=time.monotonic, sleep_fn=time.sleep, stats=None):
+        self.fps = fps
+        self._time = time_fn
+        self._sleep = sleep_fn
+        self.stats = stats
+        self.frames_shown = 0
+        self.frames_dropped = 0
+
+    def frames(self, duration, steps):
+        # Yields step indices in [0, steps) spread over `duration` seconds. Several steps are
+        # folded into one frame when steps outnumber the frame budget, render time is subtracted
+        # from each wait, and frames are dropped when rendering falls behind the deadline.
+        steps = max(1, steps)
+        if duration <= 0:
+            self.frames_shown += 1
+            yield steps - 1
+            return
+
+        frame_count = max(1, min(steps, int(round(duration * self.fps))))
+        period = duration / frame_count
+        start = self._time()
+        frame_index = 0
+        while frame_index < frame_count:
+            self.frames_shown += 1
+            yield ((frame_index + 1) * steps) // frame_count - 1
+
+            deadline = start + (frame_index + 1) * period
+            now = self._time()
+            if now < deadline:
+                self._sleep(deadline - now)
+                frame_index += 1
+                continue
+            if frame_index == frame_count - 1:
+                break
+            # Running late: jump to the slot we are actually in, but always show the final frame.
+            slot_index = min(int((now - start) / period), frame_count - 1)
+            next_index = max(frame_index + 1, slot_index)
+            dropped = next_index - frame_index - 1
+            self.frames_dropped += dropped
+            if dropped and self.stats is not None:
+                self.stats.count("frames_dropped", dropped)
+                self.stats.event("frame_drop", dropped=dropped, late_by=round(now - deadline, 6))
+            frame_index = next_index
+
+    def follow(self, duration, steps, fraction_fn):
+        # Like frames(), but never runs ahead of fraction_fn(), the completed share of the real work
+        # (0..1). Ends once both the time budget and the work are complete, so it may outlast `duration`.
+        steps = max(1, steps)
+        start = self._time()
+        next_deadline = start
+        while True:
+            # Read every frame: the animator may lower the frame rate mid-phase.
+            period = 1.0 / self.fps
+            now = self._time()
+            time_fraction = 1.0 if duration <= 0 else min(1.0, (now - start) / duration)
+            fraction = min(time_fraction, fraction_fn())
+            self.frames_shown += 1
+            yield min(steps - 1, int(fraction * steps))
+            if fraction >= 1.0:
+                return
+
+            next_deadline += period
+            now = self._time()
+            if now < next_deadline:
+                self._sleep(next_deadline - now)
+                continue
+            dropped = int((now - next_deadline) / period)
+            if dropped:
+                self.frames_dropped += dropped
+                if self.stats is not None:
+                    self.stats.count("frames_dropped", dropped)
+                    self.stats.event("frame_drop", dropped=dropped, late_by=round(now - next_deadline, 6))
+            next_deadline = now
+
+
+# --- Render Instrumentation ---
+TRACE_ENV_VAR = "BFL_TRACE"
+TRACE_EVENT_BUFFER_SIZE = 256
+# Only the most recent frames keep their own cell count; older ones live on in the aggregates below.
+TRACE_RECENT_FRAMES = 256
+# Upper bounds (inclusive) of the cells-per-frame histogram buckets; larger frames share a last bucket.
+TRACE_CELL_BUCKETS = (0, 16, 64, 256, 1024, 4096)
+TRACE_FORMAT_VERSION = 2
+
+
+class RenderStats:
+    # In-memory counters, per-phase timings and bounded ring buffers of events and of recent frames.
+    # Memory stays flat however long the animation runs. Nothing touches the filesystem until
+    # write_json() is called once at exit.
+    def __init__(self, event_buffer_size=TRACE_EVENT_BUFFER_SIZE, recent_frames=TRACE_RECENT_FRAMES):
+        self.counters = collections.Counter()
+        self.phase_timings = collections.OrderedDict()
+        self.max_cells_per_frame = 0
+        self.cell_histogram = [0] * (len(TRACE_CELL_BUCKETS) + 1)
+        self.recent_cells_per_frame = collections.deque(maxlen=recent_frames)
+        self.events = collections.deque(maxlen=event_buffer_size)
+        self.events_recorded = 0
+        self._start = time.monotonic()
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def event(self, kind, **fields):
+        fields["t"] = round(time.monotonic() - self._start, 6)
+        fields["kind"] = kind
+        self.events.append(fields)
+        self.events_recorded += 1
+
+    def record_frame(self, cells_written, bytes_emitted):
+        self.counters["frames"] += 1
+        self.counters["cells_written"] += cells_written
+        self.counters["bytes_emitted"] += bytes_emitted
+        self.counters["refreshes"] += 1
+        self.max_cells_per_frame = max(self.max_cells_per_frame, cells_written)
+        self.cell_histogram[bisect.bisect_left(TRACE_CELL_BUCKETS, cells_written)] += 1
+        self.recent_cells_per_frame.append(cells_written)
+
+    def record_phase(self, phase, seconds):
+        self.phase_timings[phase] = self.phase_timings.get(phase, 0.0) + seconds
+
+    def to_dict(self):
+        return {
+            "version": TRACE_FORMAT_VERSION,
+            "counters": dict(self.counters),
+            "phase_timings": {phase: round(seconds, 6) for phase, seconds in self.phase_timings.items()},
+            "cells_per_frame": {
+                "max": self.max_cells_per_frame,
+                "histogram": dict(zip([f"<={bound}" for bound in TRACE_CELL_BUCKETS] + [f">{TRACE_CELL_BUCKETS[-1]}"],
+                                      self.cell_histogram)),
+                "recent": list(self.recent_cells_per_frame),
+            },
+            "events": list(self.events),
+            "events_dropped": self.events_recorded - len(self.events),
+        }
+
+    def write_json(self, path):
+        import json
+        with open(path, "w") as trace_file:
+            json.dump(self.to_dict(), trace_file)
+            trace_file.write("\n")
+
+
+# --- Frame Buffer ---
+class FrameBuffer:
+    def __init__(self, height, width, blank_attr, stats=None):
+        self.height = height
+        self.width = width
+        self.blank_cell = (' ', blank_attr)
+        self.stats = stats if stats is not None else RenderStats()
+        # The screen is cleared before the first flush, so the previous frame starts blank.
+        self.prev_frame = [[self.blank_cell] * width for _ in range(height)]
+        self.next_frame = [[self.blank_cell] * width for _ in range(height)]
+        self._dirty_rows = set()
+        self.last_bytes_emitted = 0
+
+    def put(self, y, x, text, attr):
+        if not 0 <= y < self.height or x >= self.width:
+            return
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        text = text[:self.width - x]
+        if not text:
+            return
+        row = self.next_frame[y]
+        for offset, char in enumerate(text):
+            row[x + offset] = (char, attr)
+        self._dirty_rows.add(y)
+
+    def clear_region(self, y, x, height, width):
+        for line_y in range(y, y + height):
+            self.put(line_y, x, ' ' * width, self.blank_cell[1])
+
+    def invalidate(self):
+        # Called after something outside the buffer (e.g. stdscr.clear) touched the screen.
+        for y in range(self.height):
+            self.prev_frame[y] = [self.blank_cell] * self.width
+            self.next_frame[y] = [self.blank_cell] * self.width
+        self._dirty_rows.clear()
+
+    def _diff_runs(self, y):
+        prev_row = self.prev_frame[y]
+        next_row = self.next_frame[y]
+        x = 0
+        while x < self.width:
+            if next_row[x] == prev_row[x]:
+                x += 1
+                continue
+            run_start = x
+            attr = next_row[x][1]
+            x += 1
+            while x < self.width and next_row[x] != prev_row[x] and next_row[x][1] == attr:
+                x += 1
+            yield run_start, x, attr
+
+    def flush(self, stdscr):
+        cells_written = 0
+        bytes_emitted = 0
+        for y in sorted(self._dirty_rows):
+            prev_row = self.prev_frame[y]
+            next_row = self.next_frame[y]
+            for run_start, run_end, attr in self._diff_runs(y):
+                text = ''.join(cell[0] for cell in next_row[run_start:run_end])
+                try:
+                    stdscr.addstr(y, run_start, text, attr)
+                except curses.error:
+                    pass  # Writing the bottom-right cell moves the cursor off-screen.
+                prev_row[run_start:run_end] = next_row[run_start:run_end]
+                cells_written += run_end - run_start
+                bytes_emitted += len(text.encode("utf-8"))
+        self._dirty_rows.clear()
+        written = self._commit(stdscr)
+        if written is not None:
+            # The backend knows exactly what reached the terminal, escape sequences included.
+            bytes_emitted = written
+        self.stats.record_frame(cells_written, bytes_emitted)
+        self.last_bytes_emitted = bytes_emitted
+        return cells_written
+
+    def _commit(self, stdscr):
+        stdscr.noutrefresh()
+        curses.doupdate()
+
+
+# --- Animation Timeline ---
+# A frame is a tuple of ANIMATION_BOX_HEIGHT rows; each row is a tuple of (x, text, role) runs with x
+# relative to the box's left edge. ROLE_NAME runs carry a (start, stop) slice of the display name
+# instead of text, so timelines only depend on the name's length and can be shared between files.
+ROLE_BLANK = "blank"
+ROLE_BORDER = "border"
+ROLE_NAME = "name"
+ROLE_SPARK = "spark"
+ROLE_FLAME_RED = "flame_red"
+ROLE_FLAME_ORANGE = "flame_orange"
+ROLE_FLAME_YELLOW = "flame_yellow"
+ROLE_EMBER_RED = "ember_red"
+ROLE_EMBER_GREY = "ember_grey"
+ROLE_ASH_DARK = "ash_dark"
+ROLE_ASH_LIGHT = "ash_light"
+ROLE_ERROR = "error"
+
+FLAME_COLOR_ROLES = (ROLE_FLAME_RED, ROLE_FLAME_ORANGE, ROLE_FLAME_YELLOW, ROLE_FLAME_ORANGE)
+DEFAULT_GLYPH_SEED = 1
+TIMELINE_CACHE_SIZE = 64
+
+ANIMATION_BOX_NAME_OFFSET_X = ANIMATION_BOX_BORDER_THICKNESS + ANIMATION_BOX_PADDING_X
+
+BurnTimeline = collections.namedtuple(
+    "BurnTimeline", ["paper", "ignition", "consumption", "full_burn", "embers", "ashes", "settle", "extinguished"]
+)
+
+
+class GlyphStream:
+    def __init__(self, seed):
+        import random
+        self._rng = random.Random(seed)
+
+    def flame(self):
+        return self._rng.choice(FLAME_CHARS), self._rng.choice(FLAME_COLOR_ROLES)
+
+    def ember(self):
+        return self._rng.choice(EMBER_CHARS)
+
+    def ash(self):
+        return self._rng.choice(ASH_CHARS)
+
+
+class _FrameCanvas:
+    def __init__(self, width, height=ANIMATION_BOX_HEIGHT):
+        self.width = width
+        self.rows = [[None] * width for _ in range(height)]
+
+    def put(self, y, x, char, role):
+        if 0 <= y < len(self.rows) and 0 <= x < self.width:
+            self.rows[y][x] = (char, role)
+
+    def put_text(self, y, x, text, role):
+        for offset, char in enumerate(text):
+            self.put(y, x + offset, char, role)
+
+    def put_name(self, y, x, length):
+        for index in range(length):
+            self.put(y, x + index, index, ROLE_NAME)
+
+    def freeze(self):
+        frame = []
+        for row in self.rows:
+            runs = []
+            x = 0
+            while x < self.width:
+                if row[x] is None:
+                    x += 1
+                    continue
+                run_start = x
+                role = row[x][1]
+                x += 1
+                while x < self.width and row[x] is not None and row[x][1] == role:
+                    x += 1
+                if role == ROLE_NAME:
+                    runs.append((run_start, (row[run_start][0], row[x - 1][0] + 1), role))
+                else:
+                    runs.append((run_start, ''.join(cell[0] for cell in row[run_start:x]), role))
+            frame.append(tuple(runs))
+        return tuple(frame)
+
+
+def _paper_canvas(name_len, animation_width, border_role=ROLE_BORDER):
+    canvas = _FrameCanvas(animation_width)
+    inner_width = name_len + ANIMATION_BOX_PADDING_X * 2
+    canvas.put_text(0, 0, f"{BOX_TL}{BOX_HLINE * inner_width}{BOX_TR}", border_role)
+    canvas.put_text(1, 0, BOX_VLINE, border_role)
+    canvas.put_name(1, ANIMATION_BOX_NAME_OFFSET_X, name_len)
+    canvas.put_text(1, animation_width - ANIMATION_BOX_BORDER_THICKNESS, BOX_VLINE, border_role)
+    canvas.put_text(2, 0, f"{BOX_BL}{BOX_HLINE * inner_width}{BOX_BR}", border_role)
+    return canvas
+
+
+def _ignition_frames(name_len, animation_width, glyphs):
+    ignition_point_x = animation_width - ANIMATION_BOX_BORDER_THICKNESS - ANIMATION_BOX_PADDING_X
+    canvas = _paper_canvas(name_len, animation_width)
+    canvas.put(2, ignition_point_x, '.', ROLE_SPARK)
+    canvas.put(3, ignition_point_x + 1, "'", ROLE_SPARK)
+    spark_frame = canvas.freeze()
+
+    canvas.put(2, ignition_point_x, *glyphs.flame())
+    canvas.put(3, ignition_point_x, ' ', ROLE_BLANK)
+    canvas.put(3, ignition_point_x + 1, *glyphs.flame())
+    return (spark_frame, canvas.freeze())
+
+
+def _consumption_frames(name_len, animation_width, glyphs):
+    name_x = ANIMATION_BOX_NAME_OFFSET_X
+    frames = []
+    for i in range(1, name_len + 1):
+        canvas = _FrameCanvas(animation_width)
+        canvas.put_text(0, 0, f"{BOX_TL}{BOX_HLINE * (name_len + ANIMATION_BOX_PADDING_X * 2)}{BOX_TR}", ROLE_BORDER)
+        canvas.put_text(1, 0, BOX_VLINE, ROLE_BORDER)
+
+        unburnt_len = name_len - i
+        canvas.put_name(1, name_x, unburnt_len)
+        for char_idx in range(i):
+            canvas.put(1, name_x + unburnt_len + char_idx, *glyphs.flame())
+        canvas.put_text(1, animation_width - ANIMATION_BOX_BORDER_THICKNESS, BOX_VLINE, ROLE_BORDER)
+
+        # Bottom border burns ahead of the name, a quarter of its length in front.
+        canvas.put_text(2, 0, f"{BOX_BL}{BOX_HLINE * ANIMATION_BOX_PADDING_X}", ROLE_BORDER)
+        border_consumed_len = min(name_len, i + name_len // 4)
+        border_solid_part_len = name_len - border_consumed_len
+        canvas.put_text(2, name_x, BOX_HLINE * border_solid_part_len, ROLE_BORDER)
+        for k_flame in range(border_consumed_len):
+            canvas.put(2, name_x + border_solid_part_len + k_flame, *glyphs.flame())
+        canvas.put_text(2, name_x + name_len, f"{BOX_HLINE * ANIMATION_BOX_PADDING_X}{BOX_BR}", ROLE_BORDER)
+
+        flames_below_count = min(name_len // 2 + 2, i + 1)
+        flames_below_start_x = name_x + (name_len - flames_below_count) // 2
+        for k_flame in range(flames_below_count):
+            canvas.put(3, flames_below_start_x + k_flame, *glyphs.flame())
+        frames.append(canvas.freeze())
+    return tuple(frames)
+
+
+def _full_burn_frames(animation_width, glyphs):
+    frames = []
+    for i in range(6):
+        canvas = _FrameCanvas(animation_width)
+        offset1 = i % 2
+        offset2 = (i + 1) % 2
+        offset3 = i % 3
+        for row, offset in ((0, offset1), (1, offset2), (2, offset1)):
+            for k in range(animation_width - offset):
+                canvas.put(row, k + offset // 2, *glyphs.flame())
+
+        flames_l3_width = max(1, animation_width // 2 + 1 - offset3)
+        flames_l3_start_offset = (animation_width - flames_l3_width) // 2
+        for k_l3 in range(flames_l3_width):
+            canvas.put(3, flames_l3_start_offset + k_l3, *glyphs.flame())
+        frames.append(canvas.freeze())
+    return tuple(frames)
+
+
+def _ember_frames(animation_width, glyphs):
+    ember_area_start_x = ANIMATION_BOX_BORDER_THICKNESS
+    ember_area_width = animation_width - (ANIMATION_BOX_BORDER_THICKNESS * 2)
+    center_x = animation_width // 2
+    frames = []
+    for i in range(4):
+        canvas = _FrameCanvas(animation_width)
+        for row in (1, 2):
+            for k in range(ember_area_width):
+                is_red_ember = (k % (4 - i + 1) <= 1) or ((i < 2) and (k % 2 == 0))
+                canvas.put(row, ember_area_start_x + k, glyphs.ember(),
+                           ROLE_EMBER_RED if is_red_ember else ROLE_EMBER_GREY)
+        canvas.put(0, center_x, glyphs.ember(), ROLE_EMBER_GREY)
+        canvas.put(3, center_x - 1, glyphs.ember(), ROLE_EMBER_GREY)
+        canvas.put(3, center_x + 1, glyphs.ember(), ROLE_EMBER_GREY)
+        frames.append(canvas.freeze())
+    return tuple(frames)
+
+
+def _ash_frames(name_len, animation_width, glyphs):
+    ash_area_start_x = ANIMATION_BOX_BORDER_THICKNESS
+    base_ash_width = animation_width - (ANIMATION_BOX_BORDER_THICKNESS * 2)
+    ash_scatter_base_width = name_len // 2 + 1
+    frames = []
+    for i in range(5):
+        current_ash_width = max(0, base_ash_width - i * 2)
+        if current_ash_width <= 0 and i > 0:
+            continue
+        canvas = _FrameCanvas(animation_width)
+        if i == 0:
+            actual_width_to_draw, actual_start_x = base_ash_width, ash_area_start_x
+        else:
+            actual_width_to_draw = current_ash_width
+            actual_start_x = ash_area_start_x + (base_ash_width - current_ash_width) // 2
+        for row in (1, 2):
+            for k in range(actual_width_to_draw):
+                canvas.put(row, actual_start_x + k, glyphs.ash(), ROLE_ASH_DARK)
+
+        current_scatter_width = max(0, ash_scatter_base_width - i)
+        if current_scatter_width > 0:
+            scatter_offset_x = (ash_scatter_base_width - current_scatter_width) // 2
+            scatter_start_x = (animation_width // 2) - (ash_scatter_base_width // 2) + scatter_offset_x
+            for k in range(current_scatter_width):
+                canvas.put(3, scatter_start_x + k, glyphs.ash(), ROLE_ASH_LIGHT)
+            if i < 4:
+                canvas.put(3, animation_width // 2, '.', ROLE_ASH_DARK)
+        frames.append(canvas.freeze())
+    return tuple(frames)
+
+
+@functools.lru_cache(maxsize=TIMELINE_CACHE_SIZE)
+def build_timeline(name_len, animation_width, seed=DEFAULT_GLYPH_SEED):
+    glyphs = GlyphStream(seed)
+    return BurnTimeline(
+        paper=(_paper_canvas(name_len, animation_width).freeze(),),
+        ignition=_ignition_frames(name_len, animation_width, glyphs),
+        consumption=_consumption_frames(name_len, animation_width, glyphs),
+        full_burn=_full_burn_frames(animation_width, glyphs),
+        embers=_ember_frames(animation_width, glyphs),
+        ashes=_ash_frames(name_len, animation_width, glyphs),
+        settle=(_FrameCanvas(animation_width).freeze(),),
+        # Shown instead of the remaining phases when the real removal fails mid-burn.
+        extinguished=(_paper_canvas(name_len, animation_width, ROLE_ERROR).freeze(),),
+    )
+
+
+# --- Adaptive Quality ---
+# Render quality levels, cheapest last. Each level keeps the savings of the ones before it.
+QUALITY_FULL = 0        # every flame cell, cycling through the flame colors
+QUALITY_SPARSE = 1      # flames only in a central band of each row; the blank edges never repaint
+QUALITY_MONO = 2        # one flame color, so flame runs merge and need fewer attribute changes
+QUALITY_LOW_FPS = 3     # frame rate divided by QUALITY_LOW_FPS_DIVISOR
+QUALITY_STATIC = 4      # no flames at all: the name and the status line only
+QUALITY_NAMES = ("full", "sparse", "mono", "low-fps", "static")
+QUALITY_AUTO = "auto"
+QUALITY_LOW_FPS_DIVISOR = 3
+QUALITY_MIN_FPS = 2.0
+# A refresh that takes more than this share of the frame period means output is backing up.
+QUALITY_BEHIND_SHARE = 0.5
+# How far behind consecutive slow refreshes must add up, in multiples of the allowed refresh time,
+# before stepping down: a few slightly slow frames or one long stall, but not a single hiccup.
+QUALITY_PATIENCE_FRAMES = 4
+# Share of the box width that keeps its flames at QUALITY_SPARSE. A contiguous band rather than
+# scattered gaps, since curses repaints a one-cell gap instead of moving the cursor over it.
+SPARSE_FLAME_BAND_SHARE = 0.5
+
+FLAME_ROLES = frozenset(FLAME_COLOR_ROLES)
+
+
+class QualityGovernor:
+    # Watches how long each refresh takes and how many bytes it emitted, and steps the render quality
+    # down (never back up) while the terminal cannot keep up. A pinned level is never changed.
+    def __init__(self, fps, pinned=None, stats=None):
+        self.base_fps = fps
+        self.level = pinned if pinned is not None else QUALITY_FULL
+        self.pinned = pinned is not None
+        self.stats = stats if stats is not None else RenderStats()
+        self.bytes_per_second = None
+        self._behind = 0.0
+
+    @property
+    def name(self):
+        return QUALITY_NAMES[self.level]
+
+    @property
+    def fps(self):
+        if self.level >= QUALITY_LOW_FPS:
+            return max(QUALITY_MIN_FPS, min(self.base_fps, self.base_fps / QUALITY_LOW_FPS_DIVISOR))
+        return self.base_fps
+
+    def observe(self, seconds, bytes_emitted):
+        # Returns True when the level changed.
+        if seconds > 0 and bytes_emitted:
+            throughput = bytes_emitted / seconds
+            self.bytes_per_second = throughput if self.bytes_per_second is None else \
+                0.8 * self.bytes_per_second + 0.2 * throughput
+        if self.pinned or self.level == QUALITY_STATIC:
+            return False
+        allowed = QUALITY_BEHIND_SHARE / self.fps
+        if seconds <= allowed:
+            self._behind = 0.0
+            return False
+        self._behind += seconds / allowed
+        if self._behind < QUALITY_PATIENCE_FRAMES:
+            return False
+        self._behind = 0.0
+        self.level += 1
+        self.stats.count("quality_steps")
+        self.stats.event("quality", level=self.name, refresh_seconds=round(seconds, 6), bytes=bytes_emitted,
+                         bytes_per_second=round(self.bytes_per_second or 0))
+        return True
+
+
+def clip_to_flame_band(run_x, text, width):
+    # Clips a run (x relative to the box) to the central flame band; returns (x, text), text possibly empty.
+    margin = int(width * (1 - SPARSE_FLAME_BAND_SHARE) / 2)
+    start = max(run_x, margin)
+    stop = min(run_x + len(text), width - margin)
+    return start, text[start - run_x:max(start, stop) - run_x]
+
+
+def truncate_display_name(name, max_len):
+    if len(name) > max_len:
+        return name[:max_len - len(FILENAME_TRUNCATION_SUFFIX)] + FILENAME_TRUNCATION_SUFFIX
+    return name
+
 
 class CursesAnimator:
-    def __init__(self, stdscr, filename_to_burn):
+    def __init__(self, stdscr, filename_to_burn, duration=DEFAULT_BURN_DURATION, fps=DEFAULT_FPS,
+                 seed=DEFAULT_GLYPH_SEED, progress=None, stats=None, quality=None):
         self.stdscr = stdscr
         self.raw_filename_str_arg = filename_to_burn
+        self.duration = duration
+        self.progress = progress
+        self.stats = stats if stats is not None else RenderStats()
+        # quality pins one of the QUALITY_* levels; None adapts to how fast the terminal keeps up.
+        self.quality = QualityGovernor(fps, pinned=quality, stats=self.stats)
+        self.clock = FrameClock(self.quality.fps, stats=self.stats)
+        self.seed = seed
+        self.timeline = None
+        self.failed = False
+        self._animation_deadline = None
         self._initialized_pairs = {}
-
-        self.flame_chars_cycle = itertools.cycle(FLAME_CHARS)
-        self.ember_chars_cycle = itertools.cycle(EMBER_CHARS)
-        self.ash_chars_cycle = itertools.cycle(ASH_CHARS)
-        self.flame_color_pair_cycle = None
+        self._role_attrs = {}
 
         self.DEFAULT_PAIR = None
         self.PAPER_BORDER_COLOR = None
@@ -67,11 +638,7 @@ class CursesAnimator:
         self.animation_height = ANIMATION_BOX_HEIGHT
         self.start_y = 0
         self.start_x = 0
-
-    def _get_flame_char(self): return next(self.flame_chars_cycle)
-    def _get_flame_color_attr(self): return next(self.flame_color_pair_cycle)
-    def _get_ember_char(self): return next(self.ember_chars_cycle)
-    def _get_ash_char(self): return next(self.ash_chars_cycle)
+        self.frame = None
 
     def _safe_init_pair(self, pair_number, fg, bg):
         if self._initialized_pairs.get(pair_number) == (fg, bg):
@@ -112,32 +679,50 @@ class CursesAnimator:
         self.ASH_DARK_GREY = self.EMBER_DARK_GREY
         self.ASH_LIGHT_GREY = self.PAPER_BORDER_COLOR
         self.STATUS_TEXT_COLOR = self._safe_init_pair(pair_idx, curses.COLOR_CYAN, -1) | curses.A_BOLD; pair_idx += 1
-        
-        self.flame_color_pair_cycle = itertools.cycle([
-            self.FLAME_RED, self.FLAME_ORANGE, self.FLAME_YELLOW, self.FLAME_ORANGE
-        ])
-
-    def _safe_addstr(self, y, x, text, attr=None):
-        # --- Add this debugging block ---
-        # Calculate the first X coordinate that is *past* the paper's right edge
-        paper_right_edge_exclusive_x = self.start_x + self.animation_width 
-        
+        self._init_role_attrs()
+
+    def _init_role_attrs(self):
+        self._role_attrs = {
+            ROLE_BLANK: self.DEFAULT_PAIR,
+            ROLE_BORDER: self.PAPER_BORDER_COLOR,
+            ROLE_NAME: self.PAPER_TEXT_COLOR,
+            ROLE_SPARK: self._bold(self.FLAME_YELLOW),
+            ROLE_FLAME_RED: self.FLAME_RED,
+            ROLE_FLAME_ORANGE: self.FLAME_ORANGE,
+            ROLE_FLAME_YELLOW: self.FLAME_YELLOW,
+            ROLE_EMBER_RED: self.EMBER_RED,
+            ROLE_EMBER_GREY: self.EMBER_DARK_GREY,
+            ROLE_ASH_DARK: self.ASH_DARK_GREY,
+            ROLE_ASH_LIGHT: self.ASH_LIGHT_GREY,
+            ROLE_ERROR: self._bold(self.FLAME_RED),
+        }
+
+    def _bold(self, attr):
+        return attr | curses.A_BOLD
+
+    def _prepare_screen(self):
+        curses.curs_set(0)
+        self.stdscr.nodelay(False)
+
+    def _new_frame_buffer(self):
+        return FrameBuffer(self.term_height, self.term_width, self.DEFAULT_PAIR, self.stats)
+
+    def _safe_addstr(self, y, x, text, attr=None, box_origin=None, box_width=None):
+        box_y, box_x = box_origin if box_origin is not None else (self.start_y, self.start_x)
+        box_width = box_width if box_width is not None else self.animation_width
+        paper_right_edge_exclusive_x = box_x + box_width
         if x >= paper_right_edge_exclusive_x:
-            # This write is AT or BEYOND the calculated right border of the animation box
-            try:
-                with open("bfl_debug_overflow.log", "a") as debug_log:
-                    debug_log.write(
-                        f"Timestamp: {time.time():.2f}, " 
-                        f"Overflow attempt: y={y} (rel: {y - self.start_y}), x={x}, text='{text[0]}', "
-                        f"paper_box_x_range=[{self.start_x}-{paper_right_edge_exclusive_x -1}], "
-                        f"animation_width={self.animation_width}, name_len={self.name_len}\n"
-                    )
-            except Exception: 
-                pass # Avoid crashing the animation due to logging issues
-            # To strictly prevent drawing past the defined paper edge during debug:
-            # return 
-        # --- End of debugging block ---
+            self.stats.count("overflow_attempts")
+            self.stats.event("overflow", y=y, rel_y=y - box_y, x=x, text=text[:1],
+                             box_x_range=[box_x, paper_right_edge_exclusive_x - 1],
+                             animation_width=box_width, name_len=box_width - ANIMATION_BOX_TOTAL_HORIZONTAL_OVERHEAD)
+
+        if attr is None:
+            attr = self.DEFAULT_PAIR
+        self.frame.put(y, x, text, attr)
 
+    def _screen_addstr(self, y, x, text, attr=None):
+        # Direct write for one-off screens (e.g. the final message) that bypass the frame buffer.
         if attr is None:
             attr = self.DEFAULT_PAIR
         
@@ -150,21 +735,41 @@ class CursesAnimator:
         except curses.error:
             pass 
 
-    def _clear_animation_area(self):
-        for i in range(self.animation_height):
-            line_y = self.start_y + i
-            if 0 <= line_y < self.term_height:
-                self._safe_addstr(line_y, self.start_x, ' ' * self.animation_width, self.DEFAULT_PAIR)
+    def _present(self):
+        flush_start = time.monotonic()
+        self.frame.flush(self.stdscr)
+        if self.quality.observe(time.monotonic() - flush_start, self.frame.last_bytes_emitted):
+            self.clock.fps = self.quality.fps
+
+    def _phase_budget(self, phase):
+        # Each phase gets its share of the total duration, shrunk to whatever is left of the overall
+        # deadline when an earlier phase (e.g. consumption waiting on slow I/O) ran long.
+        nominal = self.duration * PHASE_BUDGET_WEIGHTS[phase]
+        if self._animation_deadline is None:
+            return nominal
+        phases = list(PHASE_BUDGET_WEIGHTS)
+        remaining_weight = sum(PHASE_BUDGET_WEIGHTS[name] for name in phases[phases.index(phase):])
+        remaining_time = max(0.0, self._animation_deadline - time.monotonic())
+        return min(nominal, remaining_time * PHASE_BUDGET_WEIGHTS[phase] / remaining_weight)
+
+    def _phase_frames(self, phase, steps):
+        return self.clock.frames(self._phase_budget(phase), steps)
+
+    def _work_fraction(self):
+        snapshot = self.progress.snapshot()
+        if snapshot.failures:
+            return 1.0
+        # fraction is None until a burn without known totals finishes (it is 1.0 from then on).
+        return UNKNOWN_TOTAL_BURN_FRACTION if snapshot.fraction is None else snapshot.fraction
+
+    def _burn_failed(self):
+        return self.progress is not None and self.progress.snapshot().failures > 0
 
     def _setup_dimensions(self):
         self.term_height, self.term_width = self.stdscr.getmaxyx()
+        self.frame = self._new_frame_buffer()
 
-        max_name_display_len = self.term_width - FILENAME_TRUNCATION_RESERVE
-        if len(self.raw_filename_str_arg) > max_name_display_len:
-            self.display_name = self.raw_filename_str_arg[:max_name_display_len - len(FILENAME_TRUNCATION_SUFFIX)] + FILENAME_TRUNCATION_SUFFIX
-        else:
-            self.display_name = self.raw_filename_str_arg
-        
+        self.display_name = truncate_display_name(self.raw_filename_str_arg, self.term_width - FILENAME_TRUNCATION_RESERVE)
         self.name_len = len(self.display_name)
         self.animation_width = (ANIMATION_BOX_BORDER_THICKNESS * 2) + \
                                (ANIMATION_BOX_PADDING_X * 2) + \
@@ -174,7 +779,7 @@ class CursesAnimator:
             self.stdscr.clear()
             msg = "Terminal too small for animation."
             color = self.FLAME_RED if self.FLAME_RED else self.DEFAULT_PAIR
-            self._safe_addstr(self.term_height // 2, (self.term_width - len(msg)) // 2, msg, color)
+            self._screen_addstr(self.term_height // 2, (self.term_width - len(msg)) // 2, msg, color)
             self.stdscr.refresh()
             time.sleep(2)
             return False
@@ -183,180 +788,128 @@ class CursesAnimator:
         self.start_x = (self.term_width - self.animation_width) // 2
         return True
 
+    def _draw_frame(self, frame, origin_y, origin_x, width, display_name):
+        self.frame.clear_region(origin_y, origin_x, self.animation_height, width)
+        level = self.quality.level
+        if level >= QUALITY_STATIC:
+            # The status line carries the progress; the paper is reduced to its unchanging name.
+            self._safe_addstr(origin_y + 1, origin_x + ANIMATION_BOX_NAME_OFFSET_X, display_name,
+                              self.PAPER_TEXT_COLOR, box_origin=(origin_y, origin_x), box_width=width)
+            return
+        for row_offset, runs in enumerate(frame):
+            line_y = origin_y + row_offset
+            for run_x, text, role in runs:
+                attr = self._role_attrs[role]
+                if role == ROLE_NAME:
+                    text = display_name[text[0]:text[1]]
+                elif role in FLAME_ROLES:
+                    if level >= QUALITY_MONO:
+                        attr = self._role_attrs[ROLE_FLAME_ORANGE]
+                    if level >= QUALITY_SPARSE:
+                        run_x, text = clip_to_flame_band(run_x, text, width)
+                        if not text:
+                            continue
+                self._safe_addstr(line_y, origin_x + run_x, text, attr,
+                                  box_origin=(origin_y, origin_x), box_width=width)
+
+    def _blit(self, frame):
+        self._draw_frame(frame, self.start_y, self.start_x, self.animation_width, self.display_name)
+        self._draw_status_line()
+        self._present()
+
+    def _draw_status_line(self):
+        status_y = self.start_y + self.animation_height + 1
+        if self.progress is None or status_y >= self.term_height:
+            return
+        snapshot = self.progress.snapshot()
+        text = f"{snapshot.entries_done:,} entr{'y' if snapshot.entries_done == 1 else 'ies'} · {format_size(snapshot.bytes_done)}"
+        if snapshot.fraction is not None:
+            text = f"{int(snapshot.fraction * 100)}% · {text}"
+        if snapshot.failures:
+            text += f" · {snapshot.failures:,} failed ({snapshot.error})"
+        text = text[:self.term_width]
+        self.frame.clear_region(status_y, 0, 1, self.term_width)
+        self.frame.put(status_y, (self.term_width - len(text)) // 2, text, self.STATUS_TEXT_COLOR)
+
+    def _play_phase(self, phase):
+        frames = getattr(self.timeline, phase)
+        if not frames:
+            return
+        phase_start = time.monotonic()
+        for step in self._phase_frames(phase, len(frames)):
+            self._blit(frames[step])
+        self.stats.record_phase(phase, time.monotonic() - phase_start)
+
     def _draw_initial_paper(self):
-        self._clear_animation_area()
-        self._safe_addstr(self.start_y, self.start_x,
-                          f"{BOX_TL}{BOX_HLINE * (self.name_len + ANIMATION_BOX_PADDING_X * 2)}{BOX_TR}",
-                          self.PAPER_BORDER_COLOR)
-        self._safe_addstr(self.start_y + 1, self.start_x, BOX_VLINE, self.PAPER_BORDER_COLOR)
-        self._safe_addstr(self.start_y + 1, self.start_x + ANIMATION_BOX_BORDER_THICKNESS + ANIMATION_BOX_PADDING_X,
-                          self.display_name, self.PAPER_TEXT_COLOR)
-        self._safe_addstr(self.start_y + 1, self.start_x + self.animation_width - ANIMATION_BOX_BORDER_THICKNESS,
-                          BOX_VLINE, self.PAPER_BORDER_COLOR)
-        self._safe_addstr(self.start_y + 2, self.start_x,
-                          f"{BOX_BL}{BOX_HLINE * (self.name_len + ANIMATION_BOX_PADDING_X * 2)}{BOX_BR}",
-                          self.PAPER_BORDER_COLOR)
-        self.stdscr.refresh()
-        time.sleep(0.6)
+        self._play_phase("paper")
 
     def _animate_ignition(self):
-        ignition_point_x = self.start_x + self.animation_width - ANIMATION_BOX_BORDER_THICKNESS - ANIMATION_BOX_PADDING_X
-        self._safe_addstr(self.start_y + 2, ignition_point_x, '.', self.FLAME_YELLOW | curses.A_BOLD)
-        self._safe_addstr(self.start_y + 3, ignition_point_x + 1, "'", self.FLAME_YELLOW | curses.A_BOLD)
-        self.stdscr.refresh()
-        time.sleep(0.25)
-
-        self._safe_addstr(self.start_y + 2, ignition_point_x, self._get_flame_char(), self._get_flame_color_attr())
-        self._safe_addstr(self.start_y + 3, ignition_point_x, " ") 
-        self._safe_addstr(self.start_y + 3, ignition_point_x + 1, self._get_flame_char(), self._get_flame_color_attr())
-        self.stdscr.refresh()
-        time.sleep(0.18)
+        self._play_phase("ignition")
 
     def _animate_consumption(self):
-        name_draw_start_x = self.start_x + ANIMATION_BOX_BORDER_THICKNESS + ANIMATION_BOX_PADDING_X
-
-        for i in range(1, self.name_len + 1): 
-            self._clear_animation_area()
-            
-            self._safe_addstr(self.start_y, self.start_x,
-                              f"{BOX_TL}{BOX_HLINE * (self.name_len + ANIMATION_BOX_PADDING_X * 2)}{BOX_TR}",
-                              self.PAPER_BORDER_COLOR)
-            self._safe_addstr(self.start_y + 1, self.start_x, BOX_VLINE, self.PAPER_BORDER_COLOR)
-
-            text_part_unburnt = self.display_name[:-i]
-            self._safe_addstr(self.start_y + 1, name_draw_start_x, text_part_unburnt, self.PAPER_TEXT_COLOR)
-            
-            flame_start_x_on_name_text = name_draw_start_x + len(text_part_unburnt)
-            for char_idx in range(i):
-                self._safe_addstr(self.start_y + 1, flame_start_x_on_name_text + char_idx,
-                                  self._get_flame_char(), self._get_flame_color_attr())
-
-            self._safe_addstr(self.start_y + 1, self.start_x + self.animation_width - ANIMATION_BOX_BORDER_THICKNESS,
-                              BOX_VLINE, self.PAPER_BORDER_COLOR)
-
-            # --- BOTTOM BORDER HANDLING (Segmented approach) ---
-            self._safe_addstr(self.start_y + 2, self.start_x,
-                              f"{BOX_BL}{BOX_HLINE * ANIMATION_BOX_PADDING_X}", self.PAPER_BORDER_COLOR)
-            
-            border_consumed_len = min(self.name_len, i + self.name_len // 4)
-            border_solid_part_len = self.name_len - border_consumed_len
-
-            if border_solid_part_len > 0:
-                self._safe_addstr(self.start_y + 2, name_draw_start_x,
-                                  BOX_HLINE * border_solid_part_len, self.PAPER_BORDER_COLOR)
-            
-            flame_start_x_on_bottom_border = name_draw_start_x + border_solid_part_len
-            for k_flame in range(border_consumed_len):
-                self._safe_addstr(self.start_y + 2, flame_start_x_on_bottom_border + k_flame,
-                                  self._get_flame_char(), self._get_flame_color_attr())
-            
-            right_padding_start_x = name_draw_start_x + self.name_len
-            self._safe_addstr(self.start_y + 2, right_padding_start_x,
-                              f"{BOX_HLINE * ANIMATION_BOX_PADDING_X}{BOX_BR}", self.PAPER_BORDER_COLOR)
-            # --- END OF SEGMENTED BOTTOM BORDER HANDLING ---
-
-            flames_below_count = min(self.name_len // 2 + 2, i + 1)
-            base_flame_line_start_x = name_draw_start_x
-            flame_line_offset = (self.name_len - flames_below_count) // 2
-            flames_below_start_x = base_flame_line_start_x + flame_line_offset
-            for k_flame in range(flames_below_count):
-                self._safe_addstr(self.start_y + 3, flames_below_start_x + k_flame,
-                                  self._get_flame_char(), self._get_flame_color_attr())
-            
-            self.stdscr.refresh()
-            sleep_duration = 0.18
-            if 0 < i < self.name_len and i % (max(1, self.name_len // 5 if self.name_len > 5 else 1)) == 0:
-                sleep_duration = 0.30
-            time.sleep(sleep_duration)
+        if self.progress is None:
+            self._play_phase("consumption")
+            return
+        frames = self.timeline.consumption
+        if not frames:
+            return
+        # The flames never run ahead of the real removal: each frame shows the lesser of the time
+        # budget's progress and the bytes (or files) actually completed.
+        phase_start = time.monotonic()
+        hold_step = min(len(frames) - 1, int(UNKNOWN_TOTAL_BURN_FRACTION * len(frames)))
+        flicker = 0
+        last_done = None
+        for step in self.clock.follow(self._phase_budget("consumption"), len(frames), self._work_fraction):
+            if self._burn_failed():
+                self.failed = True
+                break
+            snapshot = self.progress.snapshot()
+            if snapshot.fraction is None and step >= hold_step:
+                # Still working with no end in sight: the flames move only as the removal does.
+                done = (snapshot.entries_done, snapshot.bytes_done)
+                if done != last_done:
+                    flicker = (flicker + 1) % len(UNKNOWN_TOTAL_FLICKER_OFFSETS)
+                    last_done = done
+                step = max(0, hold_step - UNKNOWN_TOTAL_FLICKER_OFFSETS[flicker])
+            self._blit(frames[step])
+        self.stats.record_phase("consumption", time.monotonic() - phase_start)
+
+    def _show_extinguished(self):
+        for _ in self.clock.frames(EXTINGUISHED_HOLD_SECONDS, 1):
+            self._blit(self.timeline.extinguished[0])
 
     def _animate_full_burn(self):
-        for i in range(6): 
-            self._clear_animation_area()
-
-            offset1 = i % 2 
-            offset2 = (i + 1) % 2 
-            offset3 = i % 3
-
-            for k in range(self.animation_width - offset1):
-                self._safe_addstr(self.start_y + 0, self.start_x + k + offset1 // 2, 
-                                  self._get_flame_char(), self._get_flame_color_attr())
-            for k in range(self.animation_width - offset2):
-                self._safe_addstr(self.start_y + 1, self.start_x + k + offset2 // 2,
-                                  self._get_flame_char(), self._get_flame_color_attr())
-            for k in range(self.animation_width - offset1): 
-                self._safe_addstr(self.start_y + 2, self.start_x + k + offset1 // 2,
-                                  self._get_flame_char(), self._get_flame_color_attr())
-
-            flames_l3_width = max(1, self.animation_width // 2 + 1 - offset3)
-            flames_l3_start_offset = (self.animation_width - flames_l3_width) // 2
-            for k_l3 in range(flames_l3_width):
-                self._safe_addstr(self.start_y + 3, self.start_x + flames_l3_start_offset + k_l3,
-                                  self._get_flame_char(), self._get_flame_color_attr())
-            
-            self.stdscr.refresh()
-            time.sleep(0.18)
+        self._play_phase("full_burn")
 
     def _animate_embers(self):
-        ember_area_start_x = self.start_x + ANIMATION_BOX_BORDER_THICKNESS
-        ember_area_width = self.animation_width - (ANIMATION_BOX_BORDER_THICKNESS * 2)
-
-        for i in range(4): 
-            self._clear_animation_area()
-            for anim_line_y in [self.start_y + 1, self.start_y + 2]:
-                for k in range(ember_area_width):
-                    is_red_ember = (k % (4 - i + 1) <= 1) or ((i < 2) and (k % 2 == 0))
-                    ember_color = self.EMBER_RED if is_red_ember else self.EMBER_DARK_GREY
-                    self._safe_addstr(anim_line_y, ember_area_start_x + k, self._get_ember_char(), ember_color)
-            
-            center_x_animation = self.start_x + self.animation_width // 2
-            self._safe_addstr(self.start_y + 0, center_x_animation, self._get_ember_char(), self.EMBER_DARK_GREY)
-            self._safe_addstr(self.start_y + 3, center_x_animation - 1, self._get_ember_char(), self.EMBER_DARK_GREY)
-            self._safe_addstr(self.start_y + 3, center_x_animation + 1, self._get_ember_char(), self.EMBER_DARK_GREY)
-            
-            self.stdscr.refresh()
-            time.sleep(0.35 if i > 1 else 0.25)
+        self._play_phase("embers")
 
     def _animate_ashes(self):
-        ash_area_start_x = self.start_x + ANIMATION_BOX_BORDER_THICKNESS
-        base_ash_width = self.animation_width - (ANIMATION_BOX_BORDER_THICKNESS * 2)
-
-        for i in range(5): 
-            self._clear_animation_area()
-            current_ash_width = max(0, base_ash_width - i * 2)
-            if current_ash_width <= 0 and i > 0: continue
-            ash_draw_offset_x = (base_ash_width - current_ash_width) // 2
-            
-            actual_width_to_draw = base_ash_width if i == 0 else current_ash_width
-            actual_start_x = ash_area_start_x if i == 0 else ash_area_start_x + ash_draw_offset_x
-            
-            if actual_width_to_draw > 0 or i == 0:
-                 for anim_line_y in [self.start_y + 1, self.start_y + 2]:
-                    for k in range(actual_width_to_draw):
-                        self._safe_addstr(anim_line_y, actual_start_x + k, self._get_ash_char(), self.ASH_DARK_GREY)
-            
-            ash_scatter_base_width = self.name_len // 2 + 1
-            current_scatter_width = max(0, ash_scatter_base_width - i)
-            if current_scatter_width > 0:
-                scatter_offset_x = (ash_scatter_base_width - current_scatter_width) // 2
-                scatter_start_x = self.start_x + (self.animation_width // 2) - (ash_scatter_base_width // 2) + scatter_offset_x
-                for k in range(current_scatter_width):
-                    self._safe_addstr(self.start_y + 3, scatter_start_x + k, self._get_ash_char(), self.ASH_LIGHT_GREY)
-
-                if i < 4:
-                    center_dot_x = self.start_x + self.animation_width // 2
-                    self._safe_addstr(self.start_y + 3, center_dot_x, '.', self.ASH_DARK_GREY)
-            
-            self.stdscr.refresh()
-            time.sleep(0.35)
+        self._play_phase("ashes")
+
+    def _await_progress(self):
+        # Keeps the status line live until the background removal has finished.
+        if self.progress is None:
+            return
+        while not self.progress.snapshot().finished:
+            if self._burn_failed():
+                self.failed = True
+            idle_frame = self.timeline.extinguished[0] if self.failed else self.timeline.settle[0]
+            for _ in self.clock.frames(1.0 / self.clock.fps, 1):
+                self._blit(idle_frame)
+
+    def _failure_text(self):
+        return self.progress.snapshot().error if self.progress is not None else None
 
     def _display_final_message(self):
-        self._clear_animation_area() 
-        self.stdscr.refresh()
-        time.sleep(0.30)
         self.stdscr.clear() 
+        self.frame.invalidate()
 
         final_message1 = f"🔥 '{self.raw_filename_str_arg}' has been turned to digital ash. 🔥"
         final_message2 = "May your worries dissipate with it."
+        if self.failed:
+            final_message1 = f"'{self.raw_filename_str_arg}' could not be burned completely."
+            final_message2 = self._failure_text() or "Some of it remains; see the report below."
         
         msg1_y = self.term_height // 2 - 1
         msg2_y = self.term_height // 2
@@ -364,98 +917,2961 @@ class CursesAnimator:
         msg2_x = max(0, (self.term_width - len(final_message2)) // 2)
         
         msg_color = self.FINAL_MSG_FLAME_COLOR if self.FINAL_MSG_FLAME_COLOR else self.DEFAULT_PAIR
+        if self.failed:
+            msg_color = self.FLAME_RED
         text_color = self.PAPER_TEXT_COLOR if self.PAPER_TEXT_COLOR else self.DEFAULT_PAIR
 
-        self._safe_addstr(msg1_y, msg1_x, final_message1, msg_color | curses.A_BOLD)
-        self._safe_addstr(msg2_y, msg2_x, final_message2, text_color)
+        self._screen_addstr(msg1_y, msg1_x, final_message1, self._bold(msg_color))
+        self._screen_addstr(msg2_y, msg2_x, final_message2, text_color)
         
         self.stdscr.refresh()
         self.stdscr.nodelay(False) 
         self.stdscr.getch() 
 
     def run_animation(self):
-        curses.curs_set(0) 
-        self.stdscr.nodelay(False) 
-        
+        self._prepare_screen()
         self._init_colors() 
 
         if not self._setup_dimensions():
             return 
+        self.timeline = build_timeline(self.name_len, self.animation_width, self.seed)
 
         self.stdscr.clear() 
         self.stdscr.refresh()
+        self._animation_deadline = time.monotonic() + self.duration
 
         self._draw_initial_paper()
         self._animate_ignition()
         self._animate_consumption()
-        self._animate_full_burn()
-        self._animate_embers()
-        self._animate_ashes()
+        if self.failed:
+            self._show_extinguished()
+        else:
+            self._animate_full_burn()
+            self._animate_embers()
+            self._animate_ashes()
+        self._await_progress()
+        self._play_phase("settle")
         self._display_final_message()
 
 
-def main_cli():
-    parser = argparse.ArgumentParser(
-        description="bfl (Binary Flame Launcher) 🔥: Let go of digital files by simulating burning them.",
-        epilog="Inspired by the therapeutic practice of burning worries written on paper."
-    )
-    parser.add_argument("file_to_burn", help="The path to the file you want to digitally incinerate.")
-    args = parser.parse_args()
+# --- Burn Progress ---
+ProgressSnapshot = collections.namedtuple(
+    "ProgressSnapshot", ["entries_done", "bytes_done", "failures", "finished", "error", "fraction"]
+)
 
-    file_to_burn_path = args.file_to_burn
-    file_to_burn_basename = os.path.basename(file_to_burn_path)
 
-    if not os.path.exists(file_to_burn_path):
-        print(f"{ConfirmAnsiColors.RED}Error: File '{file_to_burn_path}' not found.{ConfirmAnsiColors.RESET}")
-        sys.exit(1)
-    if not os.path.isfile(file_to_burn_path):
-        print(f"{ConfirmAnsiColors.RED}Error: '{file_to_burn_path}' is not a file.{ConfirmAnsiColors.RESET}")
-        sys.exit(1)
+# Error recorded for entries that were left alone because the burn was cancelled.
+CANCELLED_ERROR = "cancelled"
+
+
+class BurnProgress:
+    # Thread-safe channel from removal workers to the animator. Totals are optional: recursive burns
+    # do not know their size up front, in which case fraction is None. The channel also carries
+    # cancellation the other way: once cancel() is called (on Ctrl-C), workers stop picking up new
+    # entries. Several channels (the tiles of a tiled burn) can share one cancel_event.
+    def __init__(self, total_entries=None, total_bytes=None, cancel_event=None):
+        self._lock = threading.Lock()
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self.total_entries = total_entries
+        self.total_bytes = total_bytes
+        self._entries_done = 0
+        self._bytes_done = 0
+        self._failures = 0
+        self._error = None
+        self._finished = False
+
+    def record(self, entries=0, num_bytes=0, failures=0, error=None):
+        with self._lock:
+            self._entries_done += entries
+            self._bytes_done += num_bytes
+            self._failures += failures
+            if error is not None and self._error is None:
+                self._error = error
+
+    def finish(self):
+        with self._lock:
+            self._finished = True
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check_cancelled(self):
+        # For removers with long per-file loops (shredding, gradual truncation, audit hashing).
+        if self.cancel_event.is_set():
+            import errno
+            raise OSError(errno.ECANCELED, CANCELLED_ERROR)
+
+    def _fraction(self):
+        if self._finished:
+            return 1.0
+        if self.total_bytes:
+            return min(1.0, self._bytes_done / self.total_bytes)
+        if self.total_entries:
+            return min(1.0, self._entries_done / self.total_entries)
+        return None
+
+    def snapshot(self):
+        with self._lock:
+            return ProgressSnapshot(self._entries_done, self._bytes_done, self._failures, self._finished,
+                                    self._error, self._fraction())
+
+
+class BurnJob:
+    def __init__(self, func, *args):
+        self.result = None
+        self.error = None
+        self._func = func
+        self._args = args
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        # Waited on instead of the thread itself: a Thread.join interrupted by Ctrl-C may return early
+        # when it is retried, before the job is done.
+        self._done = threading.Event()
+
+    def _run(self):
+        try:
+            self.result = self._func(*self._args)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self._done.set()
+
+    @property
+    def started(self):
+        return self._thread.ident is not None
+
+    def start(self):
+        self._thread.start()
+        return self
 
-    print(f"You are about to digitally incinerate: {ConfirmAnsiColors.BOLD}{file_to_burn_basename}{ConfirmAnsiColors.RESET}")
+    def join(self):
+        self._done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def join_cancelling(job, progress):
+    # Waits for a burn job. Ctrl-C cancels the burn and keeps waiting while the workers wind down,
+    # rather than leaving them running; returns (result, interrupted).
+    interrupted = False
+    while True:
+        try:
+            return job.join(), interrupted
+        except KeyboardInterrupt:
+            interrupted = True
+            progress.cancel()
+
+
+# --- File Removal ---
+BurnTarget = collections.namedtuple("BurnTarget", ["path", "size"])
+BurnResult = collections.namedtuple("BurnResult", ["path", "ok", "error"])
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# Files from one directory are split into chunks so a single huge directory still spreads across workers.
+UNLINK_CHUNK_SIZE = 256
+# A chunk is also closed once it holds this much remover work (bytes shredded, hashed or unlinked), so a
+# handful of large files in one directory are not processed one after another by a single worker.
+UNLINK_CHUNK_WORK_BYTES = 64 * 1024 * 1024
+
+
+def format_size(num_bytes):
+    size = float(num_bytes)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{int(size)} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def _open_dir_fd(dir_path):
+    if os.unlink not in os.supports_dir_fd:
+        return None
     try:
-        confirm = input(f"Are you sure you want to proceed? ({ConfirmAnsiColors.GREEN}yes{ConfirmAnsiColors.RESET}/{ConfirmAnsiColors.RED}no{ConfirmAnsiColors.RESET}): ").lower()
-    except EOFError: 
-        print("\nIncineration cancelled due to no input.")
-        sys.exit(0)
+        return os.open(dir_path or os.curdir, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return None
 
-    if confirm not in ['yes', 'y']:
-        print("Incineration cancelled.")
-        sys.exit(0)
 
-    file_deleted_successfully = False
-    animation_completed_without_curses_error = False
+class Unlinker:
+    outcome = "deleted"
+
+    def work_bytes(self, size):
+        return size
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        if dir_fd is not None:
+            os.unlink(name, dir_fd=dir_fd)
+        else:
+            os.remove(path)
+        progress.record(num_bytes=size)
+
+
+UNLINK = Unlinker()
+
+
+# --- Secure Shredding ---
+SHRED_BUFFER_SIZE = 4 * 1024 * 1024
+SHRED_NAME_BYTES = 8
+
+
+def _datasync(fd):
+    if hasattr(os, "fdatasync"):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+
+def _drop_page_cache(fd):
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
 
-    def curses_main_loop(stdscr, filename):
-        animator = CursesAnimator(stdscr, filename)
-        animator.run_animation()
 
+class Shredder:
+    # Overwrites a regular file `passes` times with random data before truncating it, renaming it to a
+    # random name and unlinking it. Each worker thread reuses one page-aligned mmap buffer across passes
+    # and files; data is synced once per pass and then dropped from the page cache.
+    outcome = "shredded"
+
+    def __init__(self, passes, buffer_size=SHRED_BUFFER_SIZE):
+        self.passes = passes
+        self.buffer_size = buffer_size
+        self.bytes_written = 0
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def seconds(self):
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self):
+        return self.bytes_written / self.seconds if self.seconds > 0 else 0.0
+
+    def work_bytes(self, size):
+        return size * self.passes
+
+    def _buffer(self):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            import mmap
+            buffer = mmap.mmap(-1, self.buffer_size)
+            self._local.buffer = buffer
+        return buffer
+
+    def _overwrite(self, fd, size, progress):
+        buffer = self._buffer()
+        view = memoryview(buffer)
+        try:
+            for _ in range(self.passes):
+                fill = min(size, len(buffer))
+                buffer[:fill] = os.urandom(fill)
+                os.lseek(fd, 0, os.SEEK_SET)
+                remaining = size
+                while remaining > 0:
+                    progress.check_cancelled()
+                    written = os.write(fd, view[:min(remaining, fill)])
+                    remaining -= written
+                    progress.record(num_bytes=written)
+                    with self._lock:
+                        self.bytes_written += written
+                _datasync(fd)
+                _drop_page_cache(fd)
+        finally:
+            view.release()
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        at_dir = {} if dir_fd is None else {"dir_fd": dir_fd}
+        target = path if dir_fd is None else name
+        if not stat.S_ISREG(os.stat(target, follow_symlinks=False, **at_dir).st_mode):
+            # Symlinks and special files have no contents of their own to overwrite.
+            UNLINK(dir_fd, name, path, 0, progress)
+            progress.record(num_bytes=self.work_bytes(size))
+            return
+
+        fd = os.open(target, os.O_WRONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_CLOEXEC", 0), **at_dir)
+        with self._lock:
+            if self.started_at is None:
+                self.started_at = time.monotonic()
+        try:
+            file_size = os.fstat(fd).st_size
+            self._overwrite(fd, file_size, progress)
+            os.ftruncate(fd, 0)
+            _datasync(fd)
+        finally:
+            os.close(fd)
+            with self._lock:
+                self.finished_at = time.monotonic()
+
+        scrambled_name = os.urandom(SHRED_NAME_BYTES).hex()
+        if dir_fd is not None:
+            os.rename(name, scrambled_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            os.unlink(scrambled_name, dir_fd=dir_fd)
+        else:
+            scrambled_path = os.path.join(os.path.dirname(path), scrambled_name)
+            os.rename(path, scrambled_path)
+            os.remove(scrambled_path)
+
+
+def _unlink_group(dir_path, entries, progress, remover=UNLINK):
+    # entries: (index, name, target) tuples that all live in dir_path.
+    results = []
+    dir_fd = _open_dir_fd(dir_path)
     try:
-        curses.wrapper(curses_main_loop, file_to_burn_basename)
-        animation_completed_without_curses_error = True
+        for index, name, target in entries:
+            if progress.cancelled:
+                results.append((index, BurnResult(target.path, False, CANCELLED_ERROR)))
+                continue
+            try:
+                remover(dir_fd, name, target.path, target.size, progress)
+                results.append((index, BurnResult(target.path, True, None)))
+                progress.record(entries=1)
+            except OSError as e:
+                error = e.strerror or str(e)
+                results.append((index, BurnResult(target.path, False, error)))
+                progress.record(failures=1, error=f"{name}: {error}")
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return results
+
+
+def _run_chunks(pool, chunks, progress, remover, results):
+    import concurrent.futures
+    futures = [pool.submit(_unlink_group, dir_path, chunk, progress, remover) for dir_path, chunk in chunks]
+    for future in concurrent.futures.as_completed(futures):
+        for index, result in future.result():
+            results[index] = result
+
+
+def burn_files(targets, workers=DEFAULT_WORKERS, progress=None, remover=UNLINK, executor=None):
+    # executor: an existing pool to share (e.g. the daemon's) instead of starting one per call.
+    if progress is None:
+        progress = BurnProgress()
+    groups = collections.OrderedDict()
+    for index, target in enumerate(targets):
+        dir_path, name = os.path.split(target.path)
+        groups.setdefault(dir_path, []).append((index, name, target))
+
+    chunks = []
+    for dir_path, entries in groups.items():
+        chunk = []
+        chunk_work = 0
+        for entry in entries:
+            if chunk and (len(chunk) >= UNLINK_CHUNK_SIZE or chunk_work >= UNLINK_CHUNK_WORK_BYTES):
+                chunks.append((dir_path, chunk))
+                chunk = []
+                chunk_work = 0
+            chunk.append(entry)
+            chunk_work += remover.work_bytes(entry[2].size)
+        chunks.append((dir_path, chunk))
+    results = [None] * len(targets)
+    if len(chunks) <= 1 or (workers <= 1 and executor is None):
+        # Not worth a thread pool (or its import) for a single chunk.
+        for dir_path, chunk in chunks:
+            for index, result in _unlink_group(dir_path, chunk, progress, remover):
+                results[index] = result
+        return results
+
+    if executor is not None:
+        _run_chunks(executor, chunks, progress, remover, results)
+        return results
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        _run_chunks(pool, chunks, progress, remover, results)
+    return results
+
+
+# --- Recursive Removal ---
+TreeReport = collections.namedtuple("TreeReport", ["path", "entries", "bytes", "failures", "failure_count"])
+
+MAX_REPORTED_FAILURES = 1000
+# Bounds how many unlink batches the walker may queue ahead of the workers.
+TREE_PENDING_BATCHES_PER_WORKER = 4
+# How many levels of the walk keep a directory descriptor (and a scandir iterator) open, and how many
+# directories queued unlink batches may hold descriptors for: together they bound the descriptors a
+# burn needs however deep the tree is.
+TREE_MAX_OPEN_DIRS = 8
+TREE_MAX_BATCH_DIRS = 16
+
+
+def refused_tree_root(path):
+    # Returns why a directory must not be burned, or None. Like rm, refuses "/" (however it is spelled,
+    # through symlinks too) and any path whose last component is "." or "..".
+    if os.path.basename(path.rstrip(os.sep) or os.sep) in (os.curdir, os.pardir):
+        return f"refusing to burn '{os.curdir}' or '{os.pardir}'"
+    if os.path.realpath(path) == os.path.realpath(os.sep):
+        return "refusing to burn the root directory"
+    return None
+
+
+class _DirNode:
+    # name is relative to the parent (the root's is the path it was given); ident is (st_dev, st_ino),
+    # checked whenever the directory is reopened. batch_fd is a descriptor shared by the node's queued
+    # unlink batches, closed by the last of them.
+    __slots__ = ("name", "parent", "ident", "pending", "scanned", "batch_fd", "batch_refs")
+
+    def __init__(self, name, parent, ident):
+        self.name = name
+        self.parent = parent
+        self.ident = ident
+        self.pending = 0
+        self.scanned = False
+        self.batch_fd = None
+        self.batch_refs = 0
+
+    def path(self):
+        # Only for reporting and as a fallback: the burn itself opens everything relative to a parent.
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return os.path.join(*reversed(names))
+
+
+def _dir_open_flags():
+    return (os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+            | getattr(os, "O_CLOEXEC", 0))
+
+
+class TreeBurner:
+    # Streams a directory tree with os.scandir and removes it with constant memory: files are unlinked
+    # in dir_fd-relative batches on a thread pool, and each directory is rmdir'ed as soon as it has been
+    # fully scanned and all of its children are gone. Symlinks are never followed and directories on
+    # another device than the root are left in place. An executor can be passed in to share a pool.
+    # Every directory is opened relative to its parent and no syscall takes a full path, so depth is
+    # limited neither by PATH_MAX nor by the descriptor limit: only the innermost TREE_MAX_OPEN_DIRS
+    # levels of the walk keep a descriptor and a scandir iterator open. An outer level's remaining
+    # entries are listed into memory when it leaves that window, and the directory is reopened through
+    # ".." from its child when the walk climbs back to it (checked against its device and inode, as
+    # fts does); removing directories on the way up climbs the same way.
+    def __init__(self, root, workers=DEFAULT_WORKERS, progress=None, remover=UNLINK, executor=None):
+        self.root = root
+        self.workers = max(1, workers)
+        self.progress = progress if progress is not None else BurnProgress()
+        self.remover = remover
+        self.executor = executor
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._batch_slots = threading.BoundedSemaphore(self.workers * TREE_PENDING_BATCHES_PER_WORKER)
+        self._dir_slots = threading.BoundedSemaphore(TREE_MAX_BATCH_DIRS)
+        self._pool = None
+        self._root_dev = None
+        self._entries = 0
+        self._bytes = 0
+        self._failures = []
+        self._failure_count = 0
+
+    def _record(self, entries=0, num_bytes=0):
+        # Byte progress is reported by the remover as it works; this tracks the tree's own totals.
+        with self._lock:
+            self._entries += entries
+            self._bytes += num_bytes
+        self.progress.record(entries=entries)
+
+    def _fail(self, path, error):
+        with self._lock:
+            self._failure_count += 1
+            if len(self._failures) < MAX_REPORTED_FAILURES:
+                self._failures.append(BurnResult(path, False, error))
+        self.progress.record(failures=1, error=f"{os.path.basename(path)}: {error}")
+
+    def _unlink_batch(self, node, dir_fd, batch):
+        try:
+            removed_bytes = 0
+            removed_count = 0
+            base = node.path()
+            for name, size in batch:
+                if self.progress.cancelled:
+                    # Entries already listed are reported like burn_files reports them; unscanned
+                    # ones are covered by the root's own "cancelled" failure.
+                    self._fail(os.path.join(base, name), CANCELLED_ERROR)
+                    continue
+                try:
+                    self.remover(dir_fd, name, os.path.join(base, name), size, self.progress)
+                    removed_count += 1
+                    removed_bytes += size
+                except OSError as e:
+                    self._fail(os.path.join(base, name), e.strerror or str(e))
+            self._record(entries=removed_count, num_bytes=removed_bytes)
+        finally:
+            self._batch_slots.release()
+            self._batch_done(node)
+
+    def _submit_batch(self, node, dir_fd, batch):
+        if not batch:
+            return
+        self._batch_slots.acquire()
+        with self._lock:
+            handle = node.batch_fd
+            if handle is not None:
+                node.batch_refs += 1
+                node.pending += 1
+        if handle is None:
+            # Queued batches outlive the walker's own descriptor for the directory, so they share a dup.
+            self._dir_slots.acquire()
+            try:
+                handle = os.dup(dir_fd)
+            except OSError as e:
+                self._dir_slots.release()
+                self._batch_slots.release()
+                for name, _ in batch:
+                    self._fail(os.path.join(node.path(), name), e.strerror or str(e))
+                return
+            with self._lock:
+                node.batch_fd = handle
+                node.batch_refs = 1
+                node.pending += 1
+        self._pool.submit(self._unlink_batch, node, handle, batch)
+
+    def _batch_done(self, node):
+        # The batch that leaves the directory ready is always its last, so it owns the shared descriptor.
+        with self._lock:
+            node.pending -= 1
+            node.batch_refs -= 1
+            handle = None
+            if node.batch_refs == 0:
+                handle, node.batch_fd = node.batch_fd, None
+            ready = node.scanned and node.pending == 0
+        try:
+            if ready:
+                self._remove_dirs_upward(node, handle)
+        finally:
+            if handle is not None:
+                os.close(handle)
+                self._dir_slots.release()
+
+    def _mark_scanned(self, node, dir_fd):
+        with self._lock:
+            node.scanned = True
+            ready = node.pending == 0
+        if ready:
+            self._remove_dirs_upward(node, dir_fd)
+
+    def _reopen(self, child_fd, node):
+        # Returns a descriptor for node, reached through ".." from its child or else by path; None if
+        # neither leads to the directory that was scanned.
+        flags = _dir_open_flags()
+        if child_fd is not None:
+            fd = self._checked_open(node, os.pardir, flags, child_fd)
+            if fd is not None:
+                return fd
+        return self._checked_open(node, node.path(), flags, None)
+
+    def _checked_open(self, node, path, flags, dir_fd):
+        try:
+            fd = os.open(path, flags, dir_fd=dir_fd)
+        except OSError:
+            return None
+        st = os.fstat(fd)
+        if (st.st_dev, st.st_ino) == node.ident:
+            return fd
+        os.close(fd)
+        return None
 
+    def _remove_dirs_upward(self, node, dir_fd):
+        # dir_fd: a descriptor for node, or None; it stays the caller's. Iterative so that deep trees do
+        # not hit the recursion limit, and each step up holds at most two descriptors. Once cancelled,
+        # directories are only accounted for, not removed, so that the walk still winds up at the root.
+        hop_fd = None
         try:
-            os.remove(file_to_burn_path)
-            file_deleted_successfully = True
+            while node is not None:
+                parent = node.parent
+                cancelled = self.progress.cancelled
+                parent_fd = self._reopen(dir_fd, parent) if parent is not None and not cancelled else None
+                if hop_fd is not None:
+                    os.close(hop_fd)
+                hop_fd = parent_fd
+                if not cancelled:
+                    try:
+                        if parent is None:
+                            os.rmdir(self.root)
+                        elif parent_fd is not None:
+                            os.rmdir(node.name, dir_fd=parent_fd)
+                        else:
+                            os.rmdir(node.path())
+                        self._record(entries=1)
+                    except OSError as e:
+                        self._fail(node.path(), e.strerror or str(e))
+                if parent is None:
+                    self._finished.set()
+                    return
+                with self._lock:
+                    parent.pending -= 1
+                    ready = parent.scanned and parent.pending == 0
+                node = parent if ready else None
+                dir_fd = parent_fd
+        finally:
+            if hop_fd is not None:
+                os.close(hop_fd)
+
+    def _listing(self, node, dir_fd):
+        # Yields (name, is_dir, lstat result) for each entry of node, reporting the ones that cannot be read.
+        try:
+            iterator = os.scandir(dir_fd)
         except OSError as e:
-            print(f"\n{ConfirmAnsiColors.RED}Animation complete, but failed to delete file '{file_to_burn_basename}': {e}{ConfirmAnsiColors.RESET}")
+            self._fail(node.path(), e.strerror or str(e))
+            return
+        with iterator:
+            while True:
+                try:
+                    entry = next(iterator, None)
+                except OSError as e:
+                    self._fail(node.path(), e.strerror or str(e))
+                    return
+                if entry is None:
+                    return
+                try:
+                    yield entry.name, entry.is_dir(follow_symlinks=False), entry.stat(follow_symlinks=False)
+                except OSError as e:
+                    self._fail(os.path.join(node.path(), entry.name), e.strerror or str(e))
 
-    except curses.error as e:
-        print(f"\n{ConfirmAnsiColors.RED}A curses error occurred during animation: {e}{ConfirmAnsiColors.RESET}")
-        print("The terminal might be in an unusual state. Try running 'reset'.")
-    except Exception as e:
-        print(f"\n{ConfirmAnsiColors.RED}An unexpected error occurred: {e}{ConfirmAnsiColors.RESET}")
-    finally:
-        sys.stdout.write("\033[?25h") 
-        sys.stdout.flush()
+    def _open_child(self, dir_fd, child):
+        import errno
+        fd = os.open(child.name, _dir_open_flags(), dir_fd=dir_fd)
+        st = os.fstat(fd)
+        if (st.st_dev, st.st_ino) != child.ident:
+            os.close(fd)
+            raise OSError(errno.ESTALE, "was replaced during the burn")
+        return fd
+
+    def _walk(self):
+        try:
+            root_fd = os.open(self.root, _dir_open_flags())
+        except OSError as e:
+            self._fail(self.root, e.strerror or str(e))
+            self._finished.set()
+            return
+        st = os.fstat(root_fd)
+        root_node = _DirNode(self.root, None, (st.st_dev, st.st_ino))
+        # Each level is [node, descriptor or None once it left the window, iterator over its entries].
+        stack = [[root_node, root_fd, self._listing(root_node, root_fd)]]
+        batch = []
+        batch_work = 0
+        while stack:
+            if self.progress.cancelled:
+                self._abandon(stack)
+                return
+            node, dir_fd, listing = stack[-1]
+            item = next(listing, None)
+            if item is None:
+                stack.pop()
+                self._submit_batch(node, dir_fd, batch)
+                batch = []
+                batch_work = 0
+                if stack and stack[-1][1] is None:
+                    parent = stack[-1]
+                    parent[1] = self._reopen(dir_fd, parent[0])
+                    if parent[1] is None:
+                        self._fail(parent[0].path(), "was moved during the burn")
+                        parent[2] = iter(())
+                self._mark_scanned(node, dir_fd)
+                if dir_fd is not None:
+                    os.close(dir_fd)
+                continue
+
+            name, is_dir, entry_stat = item
+            if not is_dir:
+                batch.append((name, entry_stat.st_size))
+                batch_work += self.remover.work_bytes(entry_stat.st_size)
+                if len(batch) >= UNLINK_CHUNK_SIZE or batch_work >= UNLINK_CHUNK_WORK_BYTES:
+                    self._submit_batch(node, dir_fd, batch)
+                    batch = []
+                    batch_work = 0
+                continue
+
+            if entry_stat.st_dev != self._root_dev:
+                self._fail(os.path.join(node.path(), name), "is on another filesystem, not crossing mount point")
+                continue
+            # The current batch only ever holds files of the directory on top of the stack.
+            self._submit_batch(node, dir_fd, batch)
+            batch = []
+            batch_work = 0
+            child = _DirNode(name, node, (entry_stat.st_dev, entry_stat.st_ino))
+            try:
+                child_fd = self._open_child(dir_fd, child)
+            except OSError as e:
+                # An unreadable directory can still be removed if it is empty.
+                try:
+                    os.rmdir(name, dir_fd=dir_fd)
+                    self._record(entries=1)
+                except OSError:
+                    self._fail(child.path(), e.strerror or str(e))
+                continue
+            with self._lock:
+                node.pending += 1
+            stack.append([child, child_fd, self._listing(child, child_fd)])
+            if len(stack) > TREE_MAX_OPEN_DIRS:
+                outer = stack[-TREE_MAX_OPEN_DIRS - 1]
+                if outer[1] is not None:
+                    outer[2] = iter(list(outer[2]))
+                    os.close(outer[1])
+                    outer[1] = None
+
+    def _abandon(self, stack):
+        # Stops a cancelled walk: the unsubmitted batch is dropped and every directory still being
+        # scanned is closed and marked done, innermost first.
+        while stack:
+            node, dir_fd, listing = stack.pop()
+            if hasattr(listing, "close"):
+                listing.close()
+            self._mark_scanned(node, dir_fd)
+            if dir_fd is not None:
+                os.close(dir_fd)
 
-        if animation_completed_without_curses_error:
-            if file_deleted_successfully:
-                print(f"\n{ConfirmAnsiColors.GREEN}'{file_to_burn_basename}' has been permanently deleted.{ConfirmAnsiColors.RESET}")
-            elif os.path.exists(file_to_burn_path):
-                print(f"\n{ConfirmAnsiColors.ORANGE}File '{file_to_burn_basename}' was NOT deleted (delete operation failed or was skipped after animation).{ConfirmAnsiColors.RESET}")
+    def run(self):
+        import concurrent.futures
+        self._root_dev = os.lstat(self.root).st_dev
+        if self.executor is not None:
+            self._pool = self.executor
+            self._walk()
+            # A shared pool cannot be shut down to wait; the root's removal marks the end instead.
+            self._finished.wait()
         else:
-            print(f"\n{ConfirmAnsiColors.ORANGE}Animation did not complete successfully. File '{file_to_burn_basename}' was NOT deleted.{ConfirmAnsiColors.RESET}")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+                self._pool = pool
+                self._walk()
+        self._pool = None
+        if self.progress.cancelled:
+            self._fail(self.root, CANCELLED_ERROR)
+        return TreeReport(self.root, self._entries, self._bytes, list(self._failures), self._failure_count)
+
+
+# --- Streaming Input ---
+STDIN_LABEL = "(stdin)"
+STREAM_READ_SIZE = 64 * 1024
+# Bounds how many batches the reader may queue ahead of the workers before it blocks.
+STREAM_PENDING_BATCHES_PER_WORKER = 4
+# A partial batch is handed over once it is this old, so a slow producer still sees steady progress.
+STREAM_BATCH_MAX_AGE = 0.1
+# How often a reader waiting on a quiet producer checks whether the burn was cancelled.
+STREAM_CANCEL_POLL_SECONDS = 0.1
+# Used when the system will not say how long a path may be.
+STREAM_DEFAULT_PATH_MAX = 4096
+# How much of an overlong entry is kept to name it in its failure.
+STREAM_OVERLONG_SHOWN = 64
+
+# What to do with a directory found in the input: refuse it, burn it with a TreeBurner, or hand it to
+# the remover as a single entry (smoldering moves whole directories).
+DIRS_REJECT = "reject"
+DIRS_TREE = "tree"
+DIRS_ENTRY = "entry"
+
+StreamInput = collections.namedtuple("StreamInput", ["file", "delimiter", "directories"])
+
+
+class StreamBurner:
+    # Reads delimiter-separated paths from a binary file and removes them while the input is still
+    # arriving. Each path is validated with a single lstat, batched by parent directory and handed to a
+    # fixed set of worker threads through a bounded queue, so a fast producer is held back instead of
+    # buffering. Only totals and the first MAX_REPORTED_FAILURES failures are kept: memory stays flat
+    # however many paths come in. Paths are not deduplicated; a repeated path fails as missing. An entry
+    # longer than PATH_MAX cannot name a file: it fails on its own and is skipped up to the next delimiter
+    # without being buffered, so input that never contains a delimiter cannot grow memory either.
+    def __init__(self, source, delimiter=b"\0", directories=DIRS_REJECT, workers=DEFAULT_WORKERS,
+                 progress=None, remover=UNLINK, label=STDIN_LABEL):
+        self.source = source
+        self.delimiter = delimiter
+        self.directories = directories
+        self.workers = max(1, workers)
+        self.progress = progress if progress is not None else BurnProgress()
+        self.remover = remover
+        self.label = label
+        self._lock = threading.Lock()
+        self._queue = None
+        self._entries = 0
+        self._bytes = 0
+        self._failures = []
+        self._failure_count = 0
+        self._batch_dir = None
+        self._batch = []
+        self._batch_work = 0
+        self._batch_started = 0.0
+
+    def _fail(self, path, error):
+        with self._lock:
+            self._failure_count += 1
+            if len(self._failures) < MAX_REPORTED_FAILURES:
+                self._failures.append(BurnResult(path, False, error))
+        self.progress.record(failures=1, error=f"{os.path.basename(path)}: {error}")
+
+    def _read_paths(self):
+        # Yields decoded paths, and None after each read so the caller can hand over stale batches.
+        fd = self.source.fileno()
+        try:
+            max_length = os.pathconf(os.sep, "PC_PATH_MAX") - 1  # PATH_MAX counts the terminating NUL.
+        except (OSError, ValueError):
+            max_length = STREAM_DEFAULT_PATH_MAX - 1
+        tail = b""
+        skipping = None  # The start of an overlong entry whose remainder is being skipped.
+        while self._wait_readable(fd):
+            chunk = os.read(fd, STREAM_READ_SIZE)
+            if not chunk:
+                break
+            pieces = (tail + chunk).split(self.delimiter)
+            tail = pieces.pop()
+            if skipping is not None:
+                if not pieces:
+                    tail = b""
+                    yield None
+                    continue
+                pieces.pop(0)
+                self._fail_overlong(skipping, max_length)
+                skipping = None
+            for piece in pieces:
+                if len(piece) > max_length:
+                    self._fail_overlong(piece, max_length)
+                elif piece:
+                    yield os.fsdecode(piece)
+            if len(tail) > max_length:
+                skipping = tail[:STREAM_OVERLONG_SHOWN]
+                tail = b""
+            yield None
+        if skipping is not None:
+            self._fail_overlong(skipping, max_length)
+        elif tail:
+            yield os.fsdecode(tail)
+
+    def _fail_overlong(self, start, max_length):
+        self._fail(os.fsdecode(start[:STREAM_OVERLONG_SHOWN]) + "...", f"path longer than {max_length} bytes")
+
+    def _wait_readable(self, fd):
+        # Returns False once the burn is cancelled, rather than sitting in a read on a quiet producer.
+        import select
+        while not self.progress.cancelled:
+            try:
+                if select.select([fd], [], [], STREAM_CANCEL_POLL_SECONDS)[0]:
+                    return True
+            except (OSError, ValueError):
+                return True  # Not selectable; fall back to a plain blocking read.
+        return False
+
+    def _flush_batch(self):
+        if self._batch:
+            self._queue.put((self._batch_dir, self._batch))
+        self._batch_dir = None
+        self._batch = []
+        self._batch_work = 0
+
+    def _add_file(self, path, size):
+        dir_path, name = os.path.split(path)
+        if (dir_path != self._batch_dir or len(self._batch) >= UNLINK_CHUNK_SIZE
+                or self._batch_work >= UNLINK_CHUNK_WORK_BYTES):
+            self._flush_batch()
+            self._batch_dir = dir_path
+            self._batch_started = time.monotonic()
+        self._batch.append((len(self._batch), name, BurnTarget(path, size)))
+        self._batch_work += self.remover.work_bytes(size)
+
+    def _submit(self, path):
+        try:
+            st = os.lstat(path)
+        except OSError as e:
+            self._fail(path, e.strerror or str(e))
+            return
+        if stat.S_ISDIR(st.st_mode):
+            refusal = refused_tree_root(path) if self.directories != DIRS_REJECT else None
+            if refusal is not None:
+                self._fail(path, refusal)
+            elif self.directories == DIRS_TREE:
+                self._flush_batch()
+                self._queue.put((path, None))
+            elif self.directories == DIRS_ENTRY:
+                self._add_file(path, 0)
+            else:
+                self._fail(path, "is a directory (use -r to burn it recursively)")
+            return
+        if not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+            self._fail(path, "not a regular file")
+            return
+        self._add_file(path, st.st_size if stat.S_ISREG(st.st_mode) else 0)
+
+    def _merge(self, entries, num_bytes, failures, failure_count):
+        # Failures passed here have already been reported to the progress channel.
+        with self._lock:
+            self._entries += entries
+            self._bytes += num_bytes
+            self._failures.extend(failures[:MAX_REPORTED_FAILURES - len(self._failures)])
+            self._failure_count += failure_count
+
+    def _burn_batch(self, dir_path, entries):
+        if entries is None:
+            report = TreeBurner(dir_path, workers=self.workers, progress=self.progress, remover=self.remover).run()
+            self._merge(report.entries, report.bytes, report.failures, report.failure_count)
+            return
+        results = [result for _, result in _unlink_group(dir_path, entries, self.progress, self.remover)]
+        failures = [result for result in results if not result.ok]
+        done_bytes = sum(entry[2].size for entry, result in zip(entries, results) if result.ok)
+        self._merge(len(results) - len(failures), done_bytes, failures, len(failures))
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self.progress.cancelled:
+                continue  # Keep draining so the reader is never left blocked on a full queue.
+            try:
+                self._burn_batch(*item)
+            except Exception as e:
+                # Keep draining the queue: a dead worker would leave the reader blocked on it.
+                self._fail(item[0], str(e))
+
+    def run(self):
+        import queue
+        self._queue = queue.Queue(maxsize=self.workers * STREAM_PENDING_BATCHES_PER_WORKER)
+        threads = [threading.Thread(target=self._work, name=f"bfl-stream-{index}", daemon=True)
+                   for index in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            for path in self._read_paths():
+                if self.progress.cancelled:
+                    break
+                if path is not None:
+                    self._submit(path)
+                elif self._batch and time.monotonic() - self._batch_started >= STREAM_BATCH_MAX_AGE:
+                    self._flush_batch()
+            self._flush_batch()
+        finally:
+            for _ in threads:
+                self._queue.put(None)
+            for thread in threads:
+                thread.join()
+        if self.progress.cancelled:
+            self._fail(self.label, CANCELLED_ERROR)
+        return TreeReport(self.label, self._entries, self._bytes, list(self._failures), self._failure_count)
+
+
+# --- Smolder (Trash) Mode ---
+# Each device gets its own trash so that smoldering is a single same-filesystem rename whatever the
+# file size: the home trash when the file lives on the same device as $XDG_DATA_HOME, otherwise a
+# per-user directory at the root of the file's mount point.
+TRASH_FILES_DIR = "files"
+# The index is a series of append-only segments: index.jsonl, then index.1.jsonl, index.2.jsonl, ...
+TRASH_INDEX_NAME = "index.jsonl"
+TRASH_SEGMENT_PREFIX = "index."
+TRASH_SEGMENT_SUFFIX = ".jsonl"
+# Appends go to a new segment once the newest one is this large.
+TRASH_SEGMENT_BYTES = 1024 * 1024
+# Appends hold a shared flock on this file and segment removal an exclusive one, so no process appends
+# to a segment while it is being removed.
+TRASH_LOCK_NAME = "index.lock"
+TRASH_ID_BYTES = 8
+TRASH_ID_CHARS = frozenset("0123456789abcdef")
+TRASH_KINDS = ("file", "dir")
+# Directories whose "is this inside the trash?" answer is remembered by a Trash.
+TRASH_PARENT_CACHE_SIZE = 4096
+AGE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+TrashEntry = collections.namedtuple("TrashEntry", ["id", "path", "trashed_at", "size", "kind"])
+
+
+def parse_age(text):
+    # "90s", "45m", "12h", "30d", "2w"; a bare number counts days.
+    import math
+    text = text.strip().lower()
+    unit = AGE_UNITS.get(text[-1:]) if text else None
+    number = text[:-1] if unit is not None else text
+    try:
+        value = float(number)
+    except ValueError:
+        raise ValueError(f"invalid age '{text}' (expected e.g. 30d, 12h, 45m)")
+    if not math.isfinite(value):
+        raise ValueError(f"invalid age '{text}' (must be a finite number)")
+    if value < 0:
+        raise ValueError(f"invalid age '{text}' (must not be negative)")
+    return value * (unit if unit is not None else AGE_UNITS["d"])
+
+
+def _home_trash_root():
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(data_home, "bfl", "trash")
+
+
+def _existing_ancestor(path):
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def _mount_point(path):
+    path = os.path.realpath(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def trash_root_for(path):
+    # path must exist; symlinks are judged by the directory holding the link, not by their target.
+    device = os.lstat(path).st_dev
+    home_root = _home_trash_root()
+    if os.stat(_existing_ancestor(home_root)).st_dev == device:
+        return home_root
+    mount = _mount_point(os.path.dirname(os.path.abspath(path)))
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(mount, f".bfl-trash-{uid}")
+
+
+def _unescape_mount_field(field):
+    # /proc/self/mounts octal-escapes spaces, tabs, newlines and backslashes.
+    for escaped, char in (("\\040", " "), ("\\011", "\t"), ("\\012", "\n"), ("\\134", "\\")):
+        field = field.replace(escaped, char)
+    return field
+
+
+def trash_root_problem(root):
+    # Returns why an existing trash directory must not be used, or None. Like the freedesktop trash spec,
+    # a trash (mount-root ones especially, which sit in directories other users can write to) is only
+    # trusted when it is a real directory, not a symlink, owned by us and closed to everyone else.
+    st = os.lstat(root)
+    if not stat.S_ISDIR(st.st_mode):
+        return "is not a directory"
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return "is owned by another user"
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        return f"has mode {stat.S_IMODE(st.st_mode):o} instead of 700"
+    return None
+
+
+def known_trash_roots():
+    roots = [_home_trash_root()]
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    try:
+        with open("/proc/self/mounts", encoding="utf-8", errors="replace") as mounts:
+            mount_points = [_unescape_mount_field(line.split()[1]) for line in mounts if len(line.split()) > 1]
+    except OSError:
+        # Not Linux: only the home trash is known.
+        mount_points = []
+    for mount in mount_points:
+        root = os.path.join(mount, f".bfl-trash-{uid}")
+        if root not in roots and os.path.lexists(root):
+            roots.append(root)
+    usable = []
+    for root in roots:
+        try:
+            problem = trash_root_problem(root)
+        except FileNotFoundError:
+            continue
+        if problem is not None:
+            sys.stderr.write(f"bfl: ignoring trash {root}: it {problem}\n")
+        else:
+            usable.append(root)
+    return usable
+
+
+def valid_trash_id(entry_id):
+    # Only ids of the form Smolderer generates are joined into payload paths.
+    return (isinstance(entry_id, str) and len(entry_id) == TRASH_ID_BYTES * 2
+            and TRASH_ID_CHARS.issuperset(entry_id))
+
+
+class Trash:
+    # A trash directory holds the moved entries under files/<id> and an append-only JSON-lines index.
+    # Smoldering appends one record per entry; restoring and purging append tombstones. No index file is
+    # ever rewritten: the index is split into segments, appends always go to the newest one and start a
+    # new one once it reaches TRASH_SEGMENT_BYTES, and after a restore or purge, older segments whose
+    # records are all dead are deleted whole. Lookups replay every segment, so they cost what the trash
+    # still holds plus at most one partly dead segment per live entry. Records with a malformed id,
+    # and a torn last line (e.g. after a crash), are skipped when reading.
+    def __init__(self, root):
+        self.root = root
+        self.files_dir = os.path.join(root, TRASH_FILES_DIR)
+        self.index_path = os.path.join(root, TRASH_INDEX_NAME)
+        self.lock_path = os.path.join(root, TRASH_LOCK_NAME)
+        self._lock = threading.Lock()
+        self._segment = None
+        self._real_root = None
+        self._parent_cache = {}
+
+    def ensure(self):
+        import errno
+        # makedirs only applies the mode to the leaf, so the trash root is created first.
+        os.makedirs(self.root, mode=0o700, exist_ok=True)
+        problem = trash_root_problem(self.root)
+        if problem is not None:
+            raise OSError(errno.EPERM, f"refusing to use trash {self.root}: it {problem}")
+        os.makedirs(self.files_dir, mode=0o700, exist_ok=True)
+
+    def payload_path(self, entry_id):
+        if not valid_trash_id(entry_id):
+            raise ValueError(f"invalid trash entry id {entry_id!r}")
+        return os.path.join(self.files_dir, entry_id)
+
+    def segment_path(self, number):
+        if number == 0:
+            return self.index_path
+        return os.path.join(self.root, f"{TRASH_SEGMENT_PREFIX}{number}{TRASH_SEGMENT_SUFFIX}")
+
+    def segments(self):
+        # Segment numbers present, oldest first.
+        numbers = []
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return numbers
+        for name in names:
+            if name == TRASH_INDEX_NAME:
+                numbers.append(0)
+            elif name.startswith(TRASH_SEGMENT_PREFIX) and name.endswith(TRASH_SEGMENT_SUFFIX):
+                number = name[len(TRASH_SEGMENT_PREFIX):-len(TRASH_SEGMENT_SUFFIX)]
+                if number.isdigit() and number == str(int(number)) and int(number) > 0:
+                    numbers.append(int(number))
+        return sorted(numbers)
+
+    def _inside(self, real_path):
+        if self._real_root is None:
+            self._real_root = os.path.realpath(self.root)
+        return real_path == self._real_root or real_path.startswith(self._real_root + os.sep)
+
+    def contains(self, path, is_dir=False):
+        # A file is judged by the directory holding it, whose answer is cached since a burn takes many
+        # files from the same few directories; a directory is judged by its own realpath.
+        if is_dir:
+            return self._inside(os.path.realpath(path))
+        parent = os.path.dirname(os.path.abspath(path))
+        inside = self._parent_cache.get(parent)
+        if inside is None:
+            if len(self._parent_cache) >= TRASH_PARENT_CACHE_SIZE:
+                self._parent_cache.clear()
+            inside = self._inside(os.path.realpath(parent))
+            self._parent_cache[parent] = inside
+        return inside
+
+    def _flock(self, exclusive):
+        # Returns the locked descriptor, or None where flock is unavailable.
+        try:
+            import fcntl
+        except ImportError:
+            return None
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        return fd
+
+    def _unlock(self, fd):
+        if fd is not None:
+            os.close(fd)  # Closing the descriptor releases its flock.
+
+    def _newest_segment(self):
+        # Another process may have started newer segments since this one last appended; a record
+        # written to an older segment would replay before records it must follow.
+        if self._segment is None:
+            self._segment = max(self.segments(), default=0)
+        while os.path.exists(self.segment_path(self._segment + 1)):
+            self._segment += 1
+        return self._segment
+
+    def append(self, records):
+        import json
+        if not records:
+            return
+        data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records).encode("utf-8")
+        with self._lock:
+            lock_fd = self._flock(exclusive=False)
+            try:
+                path = self.segment_path(self._newest_segment())
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o600)
+                try:
+                    # O_APPEND plus a single write keeps concurrent bfl processes from interleaving records.
+                    os.write(fd, data)
+                    full = os.fstat(fd).st_size >= TRASH_SEGMENT_BYTES
+                finally:
+                    os.close(fd)
+                if full:
+                    self._segment += 1
+                    os.close(os.open(self.segment_path(self._segment),
+                                     os.O_WRONLY | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o600))
+            finally:
+                self._unlock(lock_fd)
+
+    def _replay(self):
+        # Returns (id -> TrashEntry for live entries in insertion order, {segment: [smoldered ids]},
+        # {segment: [tombstoned ids]}, id -> segment its smolder record is in).
+        import json
+        entries = collections.OrderedDict()
+        smoldered = {}
+        tombstoned = {}
+        origin = {}
+        for number in self.segments():
+            smoldered[number] = []
+            tombstoned[number] = []
+            try:
+                segment = open(self.segment_path(number), "rb")
+            except FileNotFoundError:
+                continue
+            with segment:
+                for line in segment:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(record, dict) or not valid_trash_id(record.get("id")):
+                        continue
+                    entry_id = record["id"]
+                    if record.get("op") == "smolder":
+                        path, trashed_at = record.get("path"), record.get("at")
+                        size, kind = record.get("size", 0), record.get("kind", "file")
+                        if (not isinstance(path, str) or not isinstance(trashed_at, (int, float))
+                                or not isinstance(size, int) or kind not in TRASH_KINDS):
+                            continue
+                        entries[entry_id] = TrashEntry(entry_id, path, trashed_at, size, kind)
+                        smoldered[number].append(entry_id)
+                        origin[entry_id] = number
+                    else:
+                        entries.pop(entry_id, None)
+                        tombstoned[number].append(entry_id)
+        return entries, smoldered, tombstoned, origin
+
+    def live_entries(self):
+        # Replays the index into an insertion-ordered id -> TrashEntry map of entries still in the trash.
+        return self._replay()[0]
+
+    def live_by_path(self):
+        # Original path -> most recently smoldered live entry, for restoring by path.
+        by_path = {}
+        for entry in self.live_entries().values():
+            by_path[entry.path] = entry
+        return by_path
+
+    def drop_dead_segments(self):
+        # Deletes the segments, other than the newest, in which every smoldered entry is gone. A segment
+        # holding a tombstone for an entry smoldered in a segment that stays must stay too, or that
+        # entry would come back to life on the next replay. Returns the number of segments deleted.
+        lock_fd = self._flock(exclusive=True)
+        try:
+            numbers = self.segments()
+            if len(numbers) < 2:
+                return 0
+            entries, smoldered, tombstoned, origin = self._replay()
+            dropped = set()
+            for number in numbers[:-1]:
+                if any(entry_id in entries for entry_id in smoldered[number]):
+                    continue
+                if all(origin.get(entry_id, number) in dropped or origin.get(entry_id, number) == number
+                       for entry_id in tombstoned[number]):
+                    dropped.add(number)
+            for number in sorted(dropped):
+                try:
+                    os.unlink(self.segment_path(number))
+                except FileNotFoundError:
+                    pass
+            return len(dropped)
+        finally:
+            self._unlock(lock_fd)
+
+
+class Smolderer:
+    # Remover that moves entries into their device's trash with one rename instead of deleting them.
+    # The trash is looked up once per device rather than once per file: resolving it walks up to the
+    # mount point, which costs dozens of lstat calls.
+    outcome = "trashed"
+
+    def __init__(self):
+        self._trashes = {}
+        self._by_device = {}
+        self._lock = threading.Lock()
+
+    def work_bytes(self, size):
+        return size
+
+    def _trash_at(self, root):
+        with self._lock:
+            trash = self._trashes.get(root)
+            if trash is None:
+                trash = Trash(root)
+                trash.ensure()
+                self._trashes[root] = trash
+        return trash
+
+    def _trash_for(self, path, device):
+        trash = self._by_device.get(device)
+        if trash is None:
+            trash = self._trash_at(trash_root_for(path))
+            self._by_device[device] = trash
+        return trash
+
+    def _move(self, dir_fd, name, path, trash, entry_id):
+        if dir_fd is not None:
+            os.rename(name, trash.payload_path(entry_id), src_dir_fd=dir_fd)
+        else:
+            os.rename(path, trash.payload_path(entry_id))
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        import errno
+        if dir_fd is not None:
+            st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+        else:
+            st = os.lstat(path)
+        is_dir = stat.S_ISDIR(st.st_mode)
+        trash = self._trash_for(path, st.st_dev)
+        if trash.contains(path, is_dir):
+            raise OSError(errno.EINVAL, "already in the trash")
+        entry_id = os.urandom(TRASH_ID_BYTES).hex()
+        try:
+            self._move(dir_fd, name, path, trash, entry_id)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Another mount of the same device (a bind mount): use the trash at this path's own mount.
+            trash = self._trash_at(trash_root_for(path))
+            if trash.contains(path, is_dir):
+                raise OSError(errno.EINVAL, "already in the trash")
+            self._move(dir_fd, name, path, trash, entry_id)
+        trash.append([{"op": "smolder", "id": entry_id, "path": os.path.abspath(path),
+                       "at": round(time.time(), 3), "size": size, "kind": "dir" if is_dir else "file"}])
+        progress.record(num_bytes=size)
+
+
+RestoreResult = collections.namedtuple("RestoreResult", ["path", "ok", "error"])
+
+
+def restore_paths(paths):
+    # Each index is replayed once, however many paths are restored.
+    trashes = [Trash(root) for root in known_trash_roots()]
+    indexes = [(trash, trash.live_by_path()) for trash in trashes]
+    restored = set()
+    results = []
+    for path in paths:
+        original = os.path.abspath(path)
+        matches = [(by_path[original], trash, by_path) for trash, by_path in indexes if original in by_path]
+        if not matches:
+            results.append(RestoreResult(path, False, "not found in the trash"))
+            continue
+        entry, trash, by_path = max(matches, key=lambda match: match[0].trashed_at)
+        if os.path.lexists(original):
+            results.append(RestoreResult(path, False, "a file already exists at the original location"))
+            continue
+        try:
+            os.makedirs(os.path.dirname(original), exist_ok=True)
+            os.rename(trash.payload_path(entry.id), original)
+        except OSError as e:
+            results.append(RestoreResult(path, False, e.strerror or str(e)))
+            continue
+        trash.append([{"op": "restore", "id": entry.id, "at": round(time.time(), 3)}])
+        del by_path[original]
+        restored.add(trash)
+        results.append(RestoreResult(path, True, None))
+    for trash in restored:
+        trash.drop_dead_segments()
+    return results
+
+
+PurgeReport = collections.namedtuple("PurgeReport", ["trash", "purged", "bytes", "failures"])
+
+
+def purge_trash(max_age, workers=DEFAULT_WORKERS, now=None):
+    # Permanently removes every entry trashed more than max_age seconds ago from every known trash.
+    cutoff = (now if now is not None else time.time()) - max_age
+    reports = []
+    for root in known_trash_roots():
+        trash = Trash(root)
+        expired = [entry for entry in trash.live_entries().values() if entry.trashed_at < cutoff]
+        if not expired:
+            continue
+        progress = BurnProgress()
+        files = [entry for entry in expired if entry.kind != "dir"]
+        dirs = [entry for entry in expired if entry.kind == "dir"]
+        purged = []
+        purged_bytes = 0
+        failures = []
+        file_results = burn_files([BurnTarget(trash.payload_path(entry.id), entry.size) for entry in files],
+                                  workers=workers, progress=progress)
+        for entry, result in zip(files, file_results):
+            # A payload that is already gone has nothing left to purge.
+            if result.ok or not os.path.lexists(result.path):
+                purged.append(entry)
+                purged_bytes += entry.size if result.ok else 0
+            else:
+                failures.append(BurnResult(entry.path, False, result.error))
+        for entry in dirs:
+            payload = trash.payload_path(entry.id)
+            if not os.path.lexists(payload):
+                purged.append(entry)
+                continue
+            report = TreeBurner(payload, workers=workers, progress=progress).run()
+            if report.failure_count:
+                failures.append(BurnResult(entry.path, False, report.failures[0].error if report.failures else None))
+            else:
+                purged.append(entry)
+                purged_bytes += report.bytes
+        stamp = round(time.time(), 3)
+        trash.append([{"op": "purge", "id": entry.id, "at": stamp} for entry in purged])
+        trash.drop_dead_segments()
+        reports.append(PurgeReport(root, len(purged), purged_bytes, failures))
+    return reports
+
+
+# --- Gradual Truncation ---
+# Unlinking a huge file releases all of its extents at once, which can hold the filesystem journal long
+# enough to stall every other writer on the host. With --gradual, regular files of at least `threshold`
+# bytes are first shrunk from the end with ftruncate, `step` bytes at a time with a pause in between,
+# and only the empty file is unlinked. Each step reports the bytes it released as burn progress.
+GRADUAL_DEFAULT_THRESHOLD = 1024 ** 3
+GRADUAL_DEFAULT_STEP = 64 * 1024 ** 2
+GRADUAL_DEFAULT_PAUSE = 0.02
+SIZE_UNITS = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3, "t": 1024 ** 4}
+
+
+def parse_size(text):
+    # "4096", "512K", "256M", "1.5G", "2GiB"; units are binary and a bare number counts bytes.
+    import math
+    text = text.strip().lower()
+    number = text[:-2] if text.endswith("ib") else text[:-1] if text.endswith("b") else text
+    unit = SIZE_UNITS.get(number[-1:]) if number else None
+    if unit is not None:
+        number = number[:-1]
+    try:
+        value = float(number)
+    except ValueError:
+        raise ValueError(f"invalid size '{text}' (expected e.g. 4096, 512K, 256M, 1G)")
+    if not math.isfinite(value):
+        raise ValueError(f"invalid size '{text}' (must be a finite number)")
+    if value < 0:
+        raise ValueError(f"invalid size '{text}' (must not be negative)")
+    return int(value * (unit if unit is not None else 1))
+
+
+class GradualTruncator:
+    # Remover that shrinks large regular files step by step before unlinking them; smaller files are
+    # unlinked straight away. `rate` caps the bytes released per second by all the workers together:
+    # each step books its bytes on one schedule shared by the instance and waits for its slot, so
+    # shrinking several files at once splits the rate instead of multiplying it.
+    outcome = "deleted"
+
+    def __init__(self, threshold=GRADUAL_DEFAULT_THRESHOLD, step=GRADUAL_DEFAULT_STEP,
+                 pause=GRADUAL_DEFAULT_PAUSE, rate=None):
+        self.threshold = threshold
+        self.step = max(1, step)
+        self.pause = pause
+        self.rate = rate
+        self.files_shrunk = 0
+        self.steps = 0
+        self._lock = threading.Lock()
+        self._next_release = 0.0
+
+    def work_bytes(self, size):
+        return size
+
+    def _wait(self, seconds, progress):
+        if seconds > 0 and progress.cancel_event.wait(seconds):
+            progress.check_cancelled()
+
+    def _wait_for_rate(self, num_bytes, progress):
+        # Books num_bytes on the shared schedule and waits until the booked slot begins.
+        if not self.rate:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_release)
+            self._next_release = start + num_bytes / self.rate
+        self._wait(start - now, progress)
+
+    def _shrink(self, fd, progress):
+        # Returns the bytes released.
+        length = os.fstat(fd).st_size
+        released = 0
+        steps = 0
+        while length > 0:
+            progress.check_cancelled()
+            new_length = max(0, length - self.step)
+            self._wait_for_rate(length - new_length, progress)
+            os.ftruncate(fd, new_length)
+            progress.record(num_bytes=length - new_length)
+            released += length - new_length
+            steps += 1
+            length = new_length
+            if length > 0:
+                self._wait(self.pause, progress)
+        with self._lock:
+            self.files_shrunk += 1
+            self.steps += steps
+        return released
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        at_dir = {} if dir_fd is None else {"dir_fd": dir_fd}
+        target = path if dir_fd is None else name
+        st = os.stat(target, follow_symlinks=False, **at_dir)
+        if not stat.S_ISREG(st.st_mode) or st.st_size < self.threshold:
+            UNLINK(dir_fd, name, path, size, progress)
+            return
+        fd = os.open(target, os.O_WRONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_NONBLOCK", 0)
+                     | getattr(os, "O_CLOEXEC", 0), **at_dir)
+        try:
+            released = self._shrink(fd, progress)
+        finally:
+            os.close(fd)
+        UNLINK(dir_fd, name, path, max(0, size - released), progress)
+
+
+# --- Audit Log ---
+# With --audit, each file is hashed just before its remover runs and a JSON line with its path, size,
+# mtime, digest, kind and outcome is appended to the log. Hashing happens on the removal workers, so it
+# runs in parallel (hashlib releases the GIL on large updates) and behind the animation like the rest
+# of the burn; the hashed bytes count towards the burn's progress.
+AUDIT_DIGEST = "sha256"
+AUDIT_READ_SIZE = 4 * 1024 * 1024
+# Pending records are written and fsynced together once there are this many or the oldest is this old.
+AUDIT_BATCH_RECORDS = 512
+AUDIT_BATCH_SECONDS = 1.0
+
+
+class AuditLog:
+    # Append-only JSONL file. Each batch of records goes out as one O_APPEND write and one fsync
+    # instead of a write and a sync per file. A batch that cannot be written or synced stays pending
+    # and is retried with the next one; the failure is kept in error and raised by close(), so a full
+    # disk fails the run at the end instead of turning removals that already happened into failures.
+    def __init__(self, path, batch_records=AUDIT_BATCH_RECORDS, batch_seconds=AUDIT_BATCH_SECONDS):
+        self.path = path
+        self.batch_records = batch_records
+        self.batch_seconds = batch_seconds
+        self.records_written = 0
+        self.error = None
+        self._pending = []
+        self._unsynced = 0
+        self._oldest = 0.0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o600)
+
+    @property
+    def records_pending(self):
+        return len(self._pending) + self._unsynced
+
+    def add(self, record):
+        with self._lock:
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append(record)
+            due = (len(self._pending) >= self.batch_records
+                   or time.monotonic() - self._oldest >= self.batch_seconds)
+        if due:
+            try:
+                self.flush()
+            except OSError:
+                pass  # Kept in self.error; the records stay pending for the next flush.
+
+    def flush(self):
+        import json
+        # Holding the write lock keeps batches in order; other workers can still add records meanwhile.
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if self._fd is None or not (batch or self._unsynced):
+                with self._lock:
+                    self._pending[:0] = batch
+                return
+            lines = [(json.dumps(record) + "\n").encode("utf-8") for record in batch]
+            data = memoryview(b"".join(lines))
+            try:
+                while data:
+                    data = data[os.write(self._fd, data):]
+            except OSError as e:
+                # Records written whole are kept; the rest, including a torn one, go back to the front.
+                written = len(data.obj) - len(data)
+                sent = 0
+                while sent < len(lines) and written >= len(lines[sent]):
+                    written -= len(lines[sent])
+                    sent += 1
+                with self._lock:
+                    self._pending[:0] = batch[sent:]
+                self._unsynced += sent
+                self.error = e
+                raise
+            self._unsynced += len(batch)
+            try:
+                os.fsync(self._fd)
+            except OSError as e:
+                self.error = e
+                raise
+            self.records_written += self._unsynced
+            self._unsynced = 0
+            self.error = None
+
+    def close(self):
+        # Raises OSError when records could not be written or synced, after closing the file.
+        try:
+            self.flush()
+        finally:
+            with self._write_lock:
+                if self._fd is not None:
+                    os.close(self._fd)
+                    self._fd = None
+
+
+def _entry_kind(mode):
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISLNK(mode):
+        return "symlink"
+    return "other"
+
+
+class Auditor:
+    # Remover that wraps another one: it hashes a regular file through its own O_NOFOLLOW descriptor
+    # with a large per-thread read buffer, lets the wrapped remover run, and logs the outcome. A file
+    # that cannot be read is left in place, since it could not be accounted for. Symlinks and
+    # directories (smoldered whole) are logged without a digest.
+    def __init__(self, inner, log, read_size=AUDIT_READ_SIZE):
+        self.inner = inner
+        self.log = log
+        self.read_size = read_size
+        self._local = threading.local()
+
+    def work_bytes(self, size):
+        return size + self.inner.work_bytes(size)
+
+    def _buffer(self):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = bytearray(self.read_size)
+            self._local.buffer = buffer
+        return buffer
+
+    def _hash(self, fd, progress):
+        import hashlib
+        import io
+        digest = hashlib.new(AUDIT_DIGEST)
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        view = memoryview(self._buffer())
+        try:
+            with io.FileIO(fd, closefd=False) as reader:
+                while True:
+                    progress.check_cancelled()
+                    count = reader.readinto(view)
+                    if not count:
+                        break
+                    digest.update(view[:count])
+                    progress.record(num_bytes=count)
+        finally:
+            view.release()
+        return f"{AUDIT_DIGEST}:{digest.hexdigest()}"
+
+    def _inspect(self, st, dir_fd, target, size, progress):
+        # Returns (size, mtime, digest, kind) as found just before removal.
+        digest = None
+        if stat.S_ISREG(st.st_mode):
+            flags = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_NONBLOCK", 0) | getattr(os, "O_CLOEXEC", 0)
+            fd = os.open(target, flags, **({} if dir_fd is None else {"dir_fd": dir_fd}))
+            try:
+                st = os.fstat(fd)
+                if stat.S_ISREG(st.st_mode):
+                    digest = self._hash(fd, progress)
+            finally:
+                os.close(fd)
+        if digest is None:
+            progress.record(num_bytes=size)
+        return st.st_size, round(st.st_mtime, 6), digest, _entry_kind(st.st_mode)
+
+    def _log(self, path, details, outcome, error=None):
+        file_size, mtime, digest, kind = details
+        record = {"path": os.path.abspath(path), "size": file_size, "mtime": mtime, "digest": digest,
+                  "kind": kind, "outcome": outcome, "at": round(time.time(), 3)}
+        if error is not None:
+            record["error"] = error
+        self.log.add(record)
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        target = path if dir_fd is None else name
+        try:
+            st = os.stat(target, follow_symlinks=False, **({} if dir_fd is None else {"dir_fd": dir_fd}))
+        except OSError as e:
+            self._log(path, (size, None, None, None), "failed", e.strerror or str(e))
+            raise
+        try:
+            details = self._inspect(st, dir_fd, target, size, progress)
+        except OSError as e:
+            error = f"could not be hashed: {e.strerror or e}"
+            self._log(path, (st.st_size, round(st.st_mtime, 6), None, _entry_kind(st.st_mode)), "failed", error)
+            raise OSError(e.errno, error) from e
+        try:
+            self.inner(dir_fd, name, path, size, progress)
+        except OSError as e:
+            self._log(path, details, "failed", e.strerror or str(e))
+            raise
+        self._log(path, details, self.inner.outcome)
+
+
+def _unwrap_remover(remover):
+    return remover.inner if isinstance(remover, Auditor) else remover
+
+
+# --- Daemon ---
+# `bfl --serve` keeps one process listening on a Unix domain socket so that frequent callers skip
+# interpreter startup. The protocol is one JSON object per line in each direction: a request such as
+#   {"op": "burn", "paths": ["/abs/path"], "mode": "unlink"|"shred"|"smolder", "passes": 3, "recursive": false}
+# (an unlink may add "gradual": {"threshold": bytes, "step": bytes, "pause": seconds, "rate": bytes per second})
+# is answered with the same JSON lines headless mode prints, ending with the "summary" line
+# ({"op": "ping"} gets {"type": "pong"}). Any client that can write a line to the socket will do.
+SOCKET_ENV_VAR = "BFL_SOCKET"
+DAEMON_PROTOCOL_VERSION = 1
+DAEMON_LISTEN_BACKLOG = 128
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+BURN_MODES = ("unlink", "shred", "smolder")
+# Response lines that end a reply.
+FINAL_RESPONSE_TYPES = ("summary", "error", "pong")
+
+
+def default_socket_path():
+    if os.environ.get(SOCKET_ENV_VAR):
+        return os.environ[SOCKET_ENV_VAR]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], "bfl.sock")
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(os.environ.get("TMPDIR", "/tmp"), f"bfl-{uid}.sock")
+
+
+class RequestError(ValueError):
+    pass
+
+
+def _plan_gradual(options):
+    import math
+    if not isinstance(options, dict):
+        raise RequestError("'gradual' must be an object")
+    values = {"threshold": GRADUAL_DEFAULT_THRESHOLD, "step": GRADUAL_DEFAULT_STEP,
+              "pause": GRADUAL_DEFAULT_PAUSE, "rate": None}
+    for key, value in options.items():
+        if key not in values:
+            raise RequestError(f"unknown 'gradual' option '{key}'")
+        if key == "rate" and value is None:
+            continue
+        positive = key in ("step", "rate")
+        if (isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0
+                or (positive and value == 0)):
+            raise RequestError(f"'gradual.{key}' must be a {'positive' if positive else 'non-negative'} number")
+        values[key] = value
+    return GradualTruncator(int(values["threshold"]), int(values["step"]), values["pause"], values["rate"])
+
+
+def _plan_request(request):
+    # Validates a burn request; returns (targets, tree_roots, rejected results, remover).
+    paths = request.get("paths")
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        raise RequestError("'paths' must be a list of strings")
+    mode = request.get("mode", "unlink")
+    if mode not in BURN_MODES:
+        raise RequestError(f"'mode' must be one of {', '.join(BURN_MODES)}")
+    recursive = request.get("recursive", False)
+    if not isinstance(recursive, bool):
+        raise RequestError("'recursive' must be true or false")
+    if mode == "shred":
+        passes = request.get("passes", 1)
+        if isinstance(passes, bool) or not isinstance(passes, int) or passes < 1:
+            raise RequestError("'passes' must be a positive integer")
+        remover = Shredder(passes)
+    elif mode == "smolder":
+        remover = Smolderer()
+    else:
+        remover = UNLINK
+    if request.get("gradual") is not None:
+        if mode != "unlink":
+            raise RequestError("'gradual' only applies to mode 'unlink'")
+        remover = _plan_gradual(request["gradual"])
+
+    targets = []
+    tree_roots = []
+    rejected = []
+    for path in paths:
+        if not os.path.isabs(path):
+            # The daemon's working directory means nothing to the client.
+            rejected.append(BurnResult(path, False, "path must be absolute"))
+            continue
+        try:
+            st = os.lstat(path)
+        except OSError as e:
+            rejected.append(BurnResult(path, False, e.strerror or str(e)))
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            refusal = refused_tree_root(path) if recursive else "is a directory (set 'recursive' to burn it)"
+            if refusal is not None:
+                rejected.append(BurnResult(path, False, refusal))
+            elif mode == "smolder":
+                targets.append(BurnTarget(path, 0))
+            else:
+                tree_roots.append(path)
+        elif stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode):
+            targets.append(BurnTarget(path, st.st_size if stat.S_ISREG(st.st_mode) else 0))
+        else:
+            rejected.append(BurnResult(path, False, "is not a file"))
+    return targets, tree_roots, rejected, remover
+
+
+class BurnDaemon:
+    # Accepts connections on a Unix domain socket, one thread each, and runs every request's removals
+    # on a single shared worker pool. Only the daemon's own user may connect. With an audit log, every
+    # request's removals are audited into it.
+    def __init__(self, socket_path, workers=DEFAULT_WORKERS, audit_log=None):
+        self.socket_path = socket_path
+        self.workers = max(1, workers)
+        self.audit_log = audit_log
+        self.pool = None
+        self._socket = None
+
+    def _bind(self):
+        import errno
+        import socket
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError as e:
+                if e.errno not in (errno.ECONNREFUSED, errno.ENOENT):
+                    raise
+                os.unlink(self.socket_path)  # left behind by a daemon that died
+            else:
+                raise OSError(errno.EADDRINUSE, "another daemon is already listening there")
+            finally:
+                probe.close()
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(previous_umask)
+        server.listen(DAEMON_LISTEN_BACKLOG)
+        return server
+
+    def _peer_allowed(self, conn):
+        import socket
+        import struct
+        if not hasattr(socket, "SO_PEERCRED"):
+            return True  # The socket's 0600 mode is the only guard here.
+        credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+        return uid == os.getuid()
+
+    def handle(self, request, stream):
+        # Writes the response lines for one request to stream.
+        import json
+        if not isinstance(request, dict):
+            raise RequestError("request must be a JSON object")
+        op = request.get("op", "burn")
+        if op == "ping":
+            stream.write(json.dumps({"type": "pong", "version": DAEMON_PROTOCOL_VERSION}) + "\n")
+            return
+        if op != "burn":
+            raise RequestError(f"unknown op '{op}'")
+        targets, tree_roots, rejected, remover = _plan_request(request)
+        if self.audit_log is not None:
+            remover = Auditor(remover, self.audit_log)
+        progress = BurnProgress()
+        results = burn_files(targets, workers=self.workers, progress=progress, remover=remover,
+                             executor=self.pool) if targets else []
+        tree_reports = [TreeBurner(root, workers=self.workers, progress=progress, remover=remover,
+                                   executor=self.pool).run() for root in tree_roots]
+        _write_json_report(rejected + results, tree_reports, stream=stream, **_json_report_options(remover))
+
+    def _serve_connection(self, conn):
+        import json
+        try:
+            if not self._peer_allowed(conn):
+                return
+            reader = conn.makefile("rb")
+            writer = conn.makefile("w", encoding="utf-8")
+            while True:
+                line = reader.readline(MAX_REQUEST_BYTES)
+                if not line:
+                    return
+                if not line.strip():
+                    continue
+                try:
+                    self.handle(json.loads(line), writer)
+                except Exception as e:
+                    # Bad requests and failed burns alike are reported, and the connection stays usable.
+                    writer.write(json.dumps({"type": "error", "error": str(e)}) + "\n")
+                writer.flush()
+        except OSError:
+            pass  # The client went away.
+        finally:
+            conn.close()
+
+    def serve_forever(self):
+        import concurrent.futures
+        self._socket = self._bind()
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while True:
+                conn, _ = self._socket.accept()
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            self.close()
+
+    def close(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+            self.pool = None
+
+
+def client_request(request, socket_path=None):
+    # Sends one request to a running daemon and returns its response lines as dicts.
+    import json
+    import socket
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path or default_socket_path())
+        conn.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        responses = []
+        for line in conn.makefile("rb"):
+            responses.append(json.loads(line))
+            if responses[-1].get("type") in FINAL_RESPONSE_TYPES:
+                break
+        return responses
+    finally:
+        conn.close()
+
+
+# --- Tiled Animation ---
+TILE_MAX_NAME_LEN = 24
+TILE_GAP_X = 2
+TILE_GAP_Y = 1
+TILE_PHASES = tuple(PHASE_BUDGET_WEIGHTS)
+
+
+class _BurnTile:
+    # One paper box in the grid and the state machine that walks it through the burn phases. The
+    # consumption phase never runs ahead of this file's own removal progress.
+    def __init__(self, target, display_name, origin_y, origin_x, timeline, duration):
+        self.target = target
+        self.display_name = display_name
+        self.origin_y = origin_y
+        self.origin_x = origin_x
+        self.width = len(display_name) + ANIMATION_BOX_TOTAL_HORIZONTAL_OVERHEAD
+        self.timeline = timeline
+        self.duration = duration
+        self.progress = None
+        self.result = None
+        self.phase_index = 0
+        self.phase_started = None
+        self.failed_at = None
+        self.done = False
+
+    def _phase_fraction(self, phase, now):
+        budget = self.duration * PHASE_BUDGET_WEIGHTS[phase]
+        fraction = 1.0 if budget <= 0 else (now - self.phase_started) / budget
+        if phase == "consumption":
+            work_fraction = self.progress.snapshot().fraction
+            fraction = min(fraction, 1.0 if work_fraction is None else work_fraction)
+        return fraction
+
+    def advance(self, now):
+        if self.phase_started is None:
+            self.phase_started = now
+        snapshot = self.progress.snapshot()
+        if self.failed_at is None and snapshot.failures:
+            self.failed_at = now
+        if self.failed_at is not None:
+            self.done = snapshot.finished and now - self.failed_at >= EXTINGUISHED_HOLD_SECONDS
+            return self.timeline.extinguished[0]
+
+        while True:
+            phase = TILE_PHASES[self.phase_index]
+            frames = getattr(self.timeline, phase)
+            fraction = self._phase_fraction(phase, now)
+            if phase == TILE_PHASES[-1]:
+                self.done = fraction >= 1.0 and snapshot.finished
+                return frames[-1]
+            if fraction < 1.0 and frames:
+                return frames[min(len(frames) - 1, int(fraction * len(frames)))]
+            self.phase_index += 1
+            self.phase_started = now
+
+
+def _burn_tile_target(tile, remover):
+    try:
+        tile.result = burn_files([tile.target], workers=1, progress=tile.progress, remover=remover)[0]
+        return tile.result
+    finally:
+        tile.progress.finish()
+
+
+class TiledAnimator(CursesAnimator):
+    # Burns several files side by side: one paper box per file laid out in a grid, each advancing its
+    # own phase state machine on a single asyncio event loop while its removal runs on a thread pool.
+    # All tiles are composited into the frame buffer and pushed with one refresh per tick.
+    def __init__(self, stdscr, targets, label, remover=UNLINK, workers=DEFAULT_WORKERS,
+                 duration=DEFAULT_BURN_DURATION, fps=DEFAULT_FPS, seed=DEFAULT_GLYPH_SEED, stats=None, quality=None,
+                 cancel_event=None):
+        super().__init__(stdscr, label, duration=duration, fps=fps, seed=seed, stats=stats, quality=quality)
+        self.targets = targets
+        self.remover = remover
+        self.workers = max(1, workers)
+        # Shared by every tile's progress channel, so one cancel stops all of the removals.
+        self.cancel_event = cancel_event if cancel_event is not None else threading.Event()
+        self.tiles = []
+        self.status_y = 0
+        self.results = None
+
+    def _layout(self):
+        self.term_height, self.term_width = self.stdscr.getmaxyx()
+        names = [truncate_display_name(os.path.basename(target.path), TILE_MAX_NAME_LEN) or "?"
+                 for target in self.targets]
+        cell_width = max(len(name) for name in names) + ANIMATION_BOX_TOTAL_HORIZONTAL_OVERHEAD + TILE_GAP_X
+        cell_height = ANIMATION_BOX_HEIGHT + TILE_GAP_Y
+        columns = min(len(names), self.term_width // cell_width)
+        if columns < 1:
+            return False
+        rows = -(-len(names) // columns)
+        grid_height = rows * cell_height
+        # One blank line and one status line under the grid.
+        if grid_height + 2 > self.term_height:
+            return False
+
+        top = (self.term_height - grid_height - 2) // 2
+        left = (self.term_width - columns * cell_width) // 2 + TILE_GAP_X // 2
+        for index, (target, name) in enumerate(zip(self.targets, names)):
+            row, column = divmod(index, columns)
+            box_width = len(name) + ANIMATION_BOX_TOTAL_HORIZONTAL_OVERHEAD
+            origin_x = left + column * cell_width + (cell_width - TILE_GAP_X - box_width) // 2
+            timeline = build_timeline(len(name), box_width, self.seed)
+            self.tiles.append(_BurnTile(target, name, top + row * cell_height, origin_x, timeline, self.duration))
+        self.status_y = top + grid_height + 1
+        self.frame = self._new_frame_buffer()
+        return True
+
+    def _draw_status_line(self):
+        snapshots = [tile.progress.snapshot() for tile in self.tiles]
+        burned = sum(1 for snapshot in snapshots if snapshot.finished and not snapshot.failures)
+        failed = sum(1 for snapshot in snapshots if snapshot.failures)
+        text = f"{burned} of {len(self.tiles)} files burned · {format_size(sum(s.bytes_done for s in snapshots))}"
+        if failed:
+            text += f" · {failed} failed"
+        text = text[:self.term_width]
+        self.frame.clear_region(self.status_y, 0, 1, self.term_width)
+        self.frame.put(self.status_y, (self.term_width - len(text)) // 2, text, self.STATUS_TEXT_COLOR)
+
+    def _failure_text(self):
+        for tile in self.tiles:
+            error = tile.progress.snapshot().error
+            if error:
+                return error
+        return None
+
+    async def _render(self):
+        import asyncio
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            period = 1.0 / self.clock.fps
+            tick_start = time.monotonic()
+            for tile in self.tiles:
+                self._draw_frame(tile.advance(tick_start), tile.origin_y, tile.origin_x, tile.width, tile.display_name)
+            self._draw_status_line()
+            self._present()
+            if all(tile.done for tile in self.tiles):
+                return
+
+            next_tick += period
+            delay = next_tick - loop.time()
+            if delay < 0:
+                dropped = int(-delay / period)
+                if dropped:
+                    self.clock.frames_dropped += dropped
+                    self.stats.count("frames_dropped", dropped)
+                    self.stats.event("frame_drop", dropped=dropped, late_by=round(-delay, 6))
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+    async def _burn_all(self):
+        import asyncio
+        import concurrent.futures
+        loop = asyncio.get_running_loop()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers) as pool:
+            removals = []
+            for tile in self.tiles:
+                tile.progress = BurnProgress(total_entries=1, total_bytes=self.remover.work_bytes(tile.target.size),
+                                             cancel_event=self.cancel_event)
+                removals.append(loop.run_in_executor(pool, _burn_tile_target, tile, self.remover))
+            try:
+                render_start = time.monotonic()
+                await self._render()
+                self.stats.record_phase("tiled", time.monotonic() - render_start)
+                return list(await asyncio.gather(*removals))
+            except BaseException:
+                # Interrupted: the pool is about to wait for its tasks, so make the pending ones no-ops.
+                self.cancel_event.set()
+                raise
+
+    def run_animation(self):
+        # Returns the per-file results, or None without touching any file when the grid does not fit.
+        self._prepare_screen()
+        self._init_colors()
+        if not self._layout():
+            return None
+
+        self.stdscr.clear()
+        self.stdscr.refresh()
+        import asyncio
+        self.results = asyncio.run(self._burn_all())
+        self.failed = not all(result.ok for result in self.results)
+        self._display_final_message()
+        return self.results
+
+
+# --- Raw ANSI Backend ---
+# Renders the same timeline without curses or terminfo: frames become minimal escape sequences that
+# only move the cursor relative to where it is, change SGR attributes only when the color changes and
+# reach the terminal in one os.write per frame. Attributes are SGR parameter strings ("" = reset).
+ANSI_ENTER = "\x1b[?1049h\x1b[?25l\x1b[H\x1b[2J"
+ANSI_EXIT = "\x1b[0m\x1b[?25h\x1b[?1049l"
+ASCIICAST_VERSION = 2
+ANSI_UNATTENDED_HOLD_SECONDS = 2.0
+
+
+def _has_wide_chars(text):
+    import unicodedata
+    return any(unicodedata.east_asian_width(char) in ("W", "F") for char in text)
+
+
+class AnsiScreen:
+    # The subset of a curses window the animators use, backed by a file descriptor. Output queues up
+    # until refresh(), which hands it to the terminal (and the asciicast recording) in one write.
+    def __init__(self, fd=None, cast_path=None):
+        self.fd = fd if fd is not None else sys.stdout.fileno()
+        self.cast_path = cast_path
+        self._cast = None
+        self._pending = []
+        self._attr = None
+        self._cursor_y = 0
+        self._cursor_x = 0
+        self._saved_tty = None
+        self._start = None
+        import shutil
+        columns, lines = shutil.get_terminal_size()
+        self.height, self.width = lines, columns
+        self.writes = 0
+
+    def getmaxyx(self):
+        return self.height, self.width
+
+    def _interactive(self):
+        return os.isatty(self.fd) and sys.stdin.isatty()
+
+    def open(self):
+        self._start = time.monotonic()
+        if self.cast_path:
+            import json
+            self._cast = open(self.cast_path, "w", encoding="utf-8")
+            self._cast.write(json.dumps({
+                "version": ASCIICAST_VERSION, "width": self.width, "height": self.height,
+                "timestamp": int(time.time()), "env": {"TERM": os.environ.get("TERM", "")},
+            }) + "\n")
+        if self._interactive():
+            try:
+                import termios
+                import tty
+                self._saved_tty = termios.tcgetattr(sys.stdin.fileno())
+                # Keys pressed during the burn must not echo into the picture.
+                tty.setcbreak(sys.stdin.fileno())
+            except (ImportError, OSError):
+                self._saved_tty = None
+        # The one absolute move: everything after is relative to this home position.
+        self._pending.append(ANSI_ENTER)
+        self.refresh()
+
+    def close(self):
+        self._pending.append(ANSI_EXIT)
+        self.refresh()
+        if self._saved_tty is not None:
+            import termios
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, self._saved_tty)
+            self._saved_tty = None
+        if self._cast is not None:
+            self._cast.close()
+            self._cast = None
+
+    def nodelay(self, flag):
+        pass
+
+    def clear(self):
+        # Erasing keeps the cursor where it is, so relative moves stay valid.
+        self._pending.append("\x1b[0m\x1b[2J")
+        self._attr = ""
+
+    def _move(self, y, x):
+        moves = []
+        if y != self._cursor_y:
+            distance = y - self._cursor_y
+            count = "" if abs(distance) == 1 else str(abs(distance))
+            moves.append(f"\x1b[{count}{'B' if distance > 0 else 'A'}")
+        if self._cursor_x is None or (x == 0 and self._cursor_x != 0):
+            moves.append("\r")
+            self._cursor_x = 0
+        if x != self._cursor_x:
+            distance = x - self._cursor_x
+            count = "" if abs(distance) == 1 else str(abs(distance))
+            moves.append(f"\x1b[{count}{'C' if distance > 0 else 'D'}")
+        self._pending.append("".join(moves))
+        self._cursor_y, self._cursor_x = y, x
+
+    def _sgr(self, attr):
+        # Every colored attribute sets its own foreground, so a reset is only needed to drop bold or
+        # to go back to the default.
+        def bold(sgr):
+            return sgr == "1" or sgr.endswith(";1")
+        if not attr:
+            return "\x1b[0m"
+        if attr == "1" or (self._attr and bold(self._attr) and not bold(attr)):
+            return f"\x1b[0;{attr}m"
+        return f"\x1b[{attr}m"
+
+    def addstr(self, y, x, text, attr=""):
+        if not 0 <= y < self.height or not 0 <= x < self.width:
+            return
+        text = text[:self.width - x]
+        if not text:
+            return
+        self._move(y, x)
+        if attr != self._attr:
+            self._pending.append(self._sgr(attr))
+            self._attr = attr
+        self._pending.append(text)
+        if x + len(text) >= self.width or (not text.isascii() and _has_wide_chars(text)):
+            # Pending wrap at the right edge, or wide glyphs: the column is no longer known for sure.
+            self._cursor_x = None
+        else:
+            self._cursor_x = x + len(text)
+
+    def noutrefresh(self):
+        pass
+
+    def refresh(self):
+        if not self._pending:
+            return 0
+        text = "".join(self._pending)
+        self._pending = []
+        data = text.encode("utf-8")
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.fd, view):]
+        self.writes += 1
+        if self._cast is not None:
+            import json
+            self._cast.write(json.dumps([round(time.monotonic() - self._start, 6), "o", text]) + "\n")
+        return len(data)
+
+    def getch(self):
+        self.refresh()
+        if not self._interactive():
+            # Nobody can press a key; leave the last screen up long enough to be seen (or recorded).
+            time.sleep(ANSI_UNATTENDED_HOLD_SECONDS)
+            return -1
+        key = os.read(sys.stdin.fileno(), 1)
+        return key[0] if key else -1
+
+
+class AnsiFrameBuffer(FrameBuffer):
+    def _commit(self, screen):
+        return screen.refresh()
+
+
+class _AnsiRendering:
+    # Mixed into an animator in place of its curses calls.
+    def _prepare_screen(self):
+        pass
+
+    def _bold(self, attr):
+        return f"{attr};1" if attr else "1"
+
+    def _new_frame_buffer(self):
+        return AnsiFrameBuffer(self.term_height, self.term_width, self.DEFAULT_PAIR, self.stats)
+
+    def _init_colors(self):
+        # Same palette as _init_colors picks through curses, guessed from $TERM instead of terminfo.
+        term = os.environ.get("TERM", "")
+        many_colors = "256color" in term or os.environ.get("COLORTERM") in ("truecolor", "24bit")
+        self.DEFAULT_PAIR = ""
+        self.PAPER_BORDER_COLOR = "37"
+        self.PAPER_TEXT_COLOR = self._bold("37")
+        self.FLAME_RED = "31"
+        self.FLAME_ORANGE = "38;5;208" if many_colors else "33"
+        self.FINAL_MSG_FLAME_COLOR = self.FLAME_ORANGE
+        self.FLAME_YELLOW = "33"
+        self.EMBER_RED = "31"
+        self.EMBER_DARK_GREY = "90" if many_colors else "30"
+        self.ASH_DARK_GREY = self.EMBER_DARK_GREY
+        self.ASH_LIGHT_GREY = self.PAPER_BORDER_COLOR
+        self.STATUS_TEXT_COLOR = self._bold("36")
+        self._init_role_attrs()
+
+
+class AnsiAnimator(_AnsiRendering, CursesAnimator):
+    pass
+
+
+class AnsiTiledAnimator(_AnsiRendering, TiledAnimator):
+    pass
+
+
+def run_ansi(main_loop, *args, cast_path=None):
+    # Counterpart of curses.wrapper for the raw ANSI backend.
+    screen = AnsiScreen(cast_path=cast_path)
+    screen.open()
+    try:
+        return main_loop(screen, *args)
+    finally:
+        screen.close()
+
+
+def format_frame_stats(stats, frames_dropped=0):
+    frame_count = stats.counters["frames"]
+    if not frame_count:
+        return "Frame stats: no frames rendered."
+    total_cells = stats.counters["cells_written"]
+    return (f"Frame stats: {frame_count} frames, {total_cells} cells written "
+            f"(avg {total_cells / frame_count:.1f}/frame, max {stats.max_cells_per_frame}/frame), "
+            f"{frames_dropped} frames dropped")
+
+
+def _collect_targets(paths, recursive=False):
+    # Returns (targets, tree_roots, rejected): paths that cannot be burned become failed results.
+    targets = []
+    tree_roots = []
+    rejected = []
+    seen = set()
+    for path in paths:
+        # One lstat per path: symlinks are burned as links, never followed.
+        try:
+            st = os.lstat(path)
+        except OSError as e:
+            rejected.append(BurnResult(path, False, e.strerror or str(e)))
+            continue
+        if stat.S_ISDIR(st.st_mode):
+            refusal = refused_tree_root(path) if recursive else "is a directory (use -r to burn it recursively)"
+            if refusal is not None:
+                rejected.append(BurnResult(path, False, refusal))
+                continue
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                tree_roots.append(path)
+            continue
+        if not (stat.S_ISREG(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+            rejected.append(BurnResult(path, False, "is not a file"))
+            continue
+        key = os.path.abspath(path)
+        if key in seen:
+            continue
+        seen.add(key)
+        targets.append(BurnTarget(path, st.st_size if stat.S_ISREG(st.st_mode) else 0))
+    return targets, tree_roots, rejected
+
+
+def _describe_targets(targets, tree_roots=()):
+    if len(targets) == 1 and not tree_roots:
+        return os.path.basename(targets[0].path)
+    if len(tree_roots) == 1 and not targets:
+        return os.path.basename(os.path.normpath(tree_roots[0]))
+    parts = []
+    if targets:
+        total_bytes = sum(target.size for target in targets)
+        parts.append(f"{len(targets)} file{'s' if len(targets) != 1 else ''} ({format_size(total_bytes)})")
+    if tree_roots:
+        parts.append(f"{len(tree_roots)} director{'ies' if len(tree_roots) != 1 else 'y'}")
+    return " and ".join(parts)
+
+
+def _run_burn(targets, tree_roots, workers, progress, remover=UNLINK, stream_input=None):
+    try:
+        results = burn_files(targets, workers=workers, progress=progress, remover=remover) if targets else []
+        tree_reports = [TreeBurner(root, workers=workers, progress=progress, remover=remover).run()
+                        for root in tree_roots]
+        if stream_input is not None:
+            tree_reports.append(StreamBurner(stream_input.file, delimiter=stream_input.delimiter,
+                                             directories=stream_input.directories, workers=workers,
+                                             progress=progress, remover=remover).run())
+        return results, tree_reports
+    except Exception as e:
+        progress.record(failures=1, error=str(e))
+        raise
+    finally:
+        progress.finish()
+
+
+def _report_tree(report):
+    color = ConfirmAnsiColors.GREEN if not report.failure_count else ConfirmAnsiColors.ORANGE
+    print(f"{color}removed{ConfirmAnsiColors.RESET}  {report.path}: {report.entries:,} entries ({format_size(report.bytes)})")
+    for failure in report.failures:
+        print(f"{ConfirmAnsiColors.RED}FAILED{ConfirmAnsiColors.RESET}   {failure.path}: {failure.error}")
+    if report.failure_count > len(report.failures):
+        print(f"{ConfirmAnsiColors.RED}... and {report.failure_count - len(report.failures):,} more failures{ConfirmAnsiColors.RESET}")
+
+
+def _report_results(results, tree_reports=(), smoldered=False):
+    done_text = "moved to the trash" if smoldered else "permanently deleted"
+    restore_hint = "Run 'bfl --restore PATH' to put a trashed file back where it was."
+    if len(results) == 1 and not tree_reports:
+        result = results[0]
+        basename = os.path.basename(result.path)
+        if result.ok:
+            print(f"\n{ConfirmAnsiColors.GREEN}'{basename}' has been {done_text}.{ConfirmAnsiColors.RESET}")
+            if smoldered:
+                print(restore_hint)
+        else:
+            print(f"\n{ConfirmAnsiColors.RED}Animation complete, but failed to delete file '{basename}': {result.error}{ConfirmAnsiColors.RESET}")
+        return
+
+    print()
+    for result in results:
+        if result.ok:
+            print(f"{ConfirmAnsiColors.GREEN}{'trashed' if smoldered else 'deleted'}{ConfirmAnsiColors.RESET}  {result.path}")
+        else:
+            print(f"{ConfirmAnsiColors.RED}FAILED{ConfirmAnsiColors.RESET}   {result.path}: {result.error}")
+    for report in tree_reports:
+        _report_tree(report)
+    if results:
+        deleted_count = sum(1 for result in results if result.ok)
+        summary_color = ConfirmAnsiColors.GREEN if deleted_count == len(results) else ConfirmAnsiColors.ORANGE
+        print(f"\n{summary_color}{deleted_count} of {len(results)} files have been {done_text}.{ConfirmAnsiColors.RESET}")
+        if smoldered and deleted_count:
+            print(restore_hint)
+
+
+def _shred_summary(shredder):
+    return {
+        "passes": shredder.passes, "bytes_written": shredder.bytes_written,
+        "seconds": round(shredder.seconds, 6), "bytes_per_second": round(shredder.throughput),
+    }
+
+
+def _report_shred(shredder):
+    print(f"Shredded {format_size(shredder.bytes_written)} in {shredder.passes} pass{'es' if shredder.passes != 1 else ''} "
+          f"over {shredder.seconds:.2f}s ({format_size(shredder.throughput)}/s).")
+
+
+def _report_audit(audit_log):
+    print(f"Audit log: {audit_log.records_written} record{'s' if audit_log.records_written != 1 else ''} "
+          f"appended to {audit_log.path}.")
+
+
+def _close_audit_log(audit_log):
+    # Returns False, after saying so on stderr, if some records never made it to disk.
+    try:
+        audit_log.close()
+    except OSError as e:
+        sys.stderr.write(f"bfl: cannot write audit log {audit_log.path}: {e.strerror or e}; "
+                         f"{audit_log.records_pending} record{'s' if audit_log.records_pending != 1 else ''} "
+                         f"not logged\n")
+        return False
+    return True
+
+
+def _open_audit_log(path):
+    try:
+        return AuditLog(path)
+    except OSError as e:
+        sys.stderr.write(f"bfl: cannot open audit log {path}: {e.strerror or e}\n")
+        sys.exit(1)
+
+
+def _gradual_summary(truncator):
+    return {"files_shrunk": truncator.files_shrunk, "steps": truncator.steps}
+
+
+def _report_gradual(truncator):
+    if truncator.files_shrunk:
+        print(f"Shrunk {truncator.files_shrunk} large file{'s' if truncator.files_shrunk != 1 else ''} "
+              f"in {truncator.steps} step{'s' if truncator.steps != 1 else ''} before unlinking.")
+
+
+def _json_report_options(remover):
+    base_remover = _unwrap_remover(remover)
+    return {"shredder": base_remover if isinstance(base_remover, Shredder) else None,
+            "smoldered": isinstance(base_remover, Smolderer),
+            "truncator": base_remover if isinstance(base_remover, GradualTruncator) else None,
+            "audit_log": remover.log if isinstance(remover, Auditor) else None}
+
+
+def _write_json_report(results, tree_reports, stream=None, shredder=None, smoldered=False, truncator=None,
+                       audit_log=None):
+    import json
+    stream = stream if stream is not None else sys.stdout
+    lines = []
+    for result in results:
+        lines.append({"type": "file", "path": result.path, "ok": result.ok, "error": result.error})
+    for report in tree_reports:
+        lines.append({
+            "type": "stream" if report.path == STDIN_LABEL else "tree", "path": report.path, "ok": not report.failure_count,
+            "entries": report.entries, "bytes": report.bytes, "failure_count": report.failure_count,
+            "failures": [{"path": failure.path, "error": failure.error} for failure in report.failures],
+        })
+    deleted_count = sum(1 for result in results if result.ok)
+    summary = {
+        "type": "summary", "files": len(results), "deleted": deleted_count,
+        "failed": len(results) - deleted_count + sum(report.failure_count for report in tree_reports),
+    }
+    if shredder is not None:
+        summary["shred"] = _shred_summary(shredder)
+    if smoldered:
+        summary["trashed"] = True
+    if truncator is not None:
+        summary["gradual"] = _gradual_summary(truncator)
+    if audit_log is not None:
+        # The summary vouches for the audit records, so they must be on disk first.
+        try:
+            audit_log.flush()
+            summary["audit_log"] = audit_log.path
+        except OSError as e:
+            summary["audit_error"] = f"cannot write {audit_log.path}: {e.strerror or e}"
+    lines.append(summary)
+    stream.write("".join(json.dumps(line) + "\n" for line in lines))
+    stream.flush()
+
+
+def _write_trace(trace_path, stats):
+    if not trace_path:
+        return
+    try:
+        stats.write_json(trace_path)
+    except OSError as e:
+        sys.stderr.write(f"bfl: could not write trace to '{trace_path}': {e}\n")
+
+
+def _burn_headless(targets, tree_roots, workers, stats, remover=UNLINK, stream_input=None, rejected=()):
+    # rejected: results for paths that were refused up front, reported along with the rest.
+    remove_start = time.monotonic()
+    progress = BurnProgress()
+    job = BurnJob(_run_burn, targets, tree_roots, workers, progress, remover, stream_input).start()
+    (results, tree_reports), interrupted = join_cancelling(job, progress)
+    stats.record_phase("remove", time.monotonic() - remove_start)
+    results = list(rejected) + results
+    _write_json_report(results, tree_reports, **_json_report_options(remover))
+    if interrupted:
+        return 130
+    if not all(result.ok for result in results) or any(report.failure_count for report in tree_reports):
+        return 1
+    return 0
+
+
+def _restore_cli(paths, headless):
+    import json
+    results = restore_paths(paths)
+    for result in results:
+        if headless:
+            sys.stdout.write(json.dumps({"type": "restore", "path": result.path, "ok": result.ok, "error": result.error}) + "\n")
+        elif result.ok:
+            print(f"{ConfirmAnsiColors.GREEN}restored{ConfirmAnsiColors.RESET} {result.path}")
+        else:
+            print(f"{ConfirmAnsiColors.RED}FAILED{ConfirmAnsiColors.RESET}   {result.path}: {result.error}")
+    return 0 if all(result.ok for result in results) else 1
+
+
+def _purge_cli(max_age, workers, headless):
+    import json
+    reports = purge_trash(max_age, workers=workers)
+    for report in reports:
+        if headless:
+            sys.stdout.write(json.dumps({
+                "type": "purge", "trash": report.trash, "purged": report.purged, "bytes": report.bytes,
+                "failures": [{"path": failure.path, "error": failure.error} for failure in report.failures],
+            }) + "\n")
+            continue
+        print(f"{ConfirmAnsiColors.GREEN}purged{ConfirmAnsiColors.RESET}   {report.trash}: "
+              f"{report.purged:,} entries ({format_size(report.bytes)})")
+        for failure in report.failures:
+            print(f"{ConfirmAnsiColors.RED}FAILED{ConfirmAnsiColors.RESET}   {failure.path}: {failure.error}")
+    if not reports and not headless:
+        print("Nothing in the trash is old enough to purge.")
+    return 1 if any(report.failures for report in reports) else 0
+
+
+def _serve_cli(socket_path, workers, audit_log=None):
+    import signal
+    daemon = BurnDaemon(socket_path, workers=workers, audit_log=audit_log)
+
+    def stop(signum, frame):
+        raise SystemExit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    sys.stderr.write(f"bfl: serving burn requests on {socket_path}\n")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except OSError as e:
+        sys.stderr.write(f"bfl: cannot serve on {socket_path}: {e.strerror or e}\n")
+        return 1
+    finally:
+        if audit_log is not None and not _close_audit_log(audit_log):
+            return 1
+    return 0
+
+
+def _client_cli(request, socket_path):
+    import json
+    try:
+        responses = client_request(request, socket_path)
+    except OSError as e:
+        sys.stderr.write(f"bfl: no daemon reachable on {socket_path} ({e.strerror or e}); start one with bfl --serve\n")
+        return 1
+    sys.stdout.write("".join(json.dumps(response) + "\n" for response in responses))
+    final = responses[-1] if responses else {}
+    if final.get("type") != "summary":
+        return 1
+    return 1 if final.get("failed") else 0
+
+
+def _confirm_or_exit(action, label, headless):
+    if not sys.stdout.isatty() or (headless and not sys.stdin.isatty()):
+        sys.stderr.write("bfl: refusing to burn without confirmation when not attached to a terminal; pass --yes.\n")
+        sys.exit(2)
+
+    print(f"You are about to {action}: {ConfirmAnsiColors.BOLD}{label}{ConfirmAnsiColors.RESET}")
+    try:
+        confirm = input(f"Are you sure you want to proceed? ({ConfirmAnsiColors.GREEN}yes{ConfirmAnsiColors.RESET}/{ConfirmAnsiColors.RED}no{ConfirmAnsiColors.RESET}): ").lower()
+    except EOFError: 
+        print("\nIncineration cancelled due to no input.")
+        sys.exit(0)
+
+    if confirm not in ['yes', 'y']:
+        print("Incineration cancelled.")
+        sys.exit(0)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(
+        description="bfl (Binary Flame Launcher) 🔥: Let go of digital files by simulating burning them.",
+        epilog="Inspired by the therapeutic practice of burning worries written on paper."
+    )
+    parser.add_argument("files_to_burn", nargs="*", metavar="file_to_burn",
+                        help="The path(s) to the file(s) you want to digitally incinerate (or restore, with --restore).")
+    parser.add_argument("--from-stdin", action="store_true",
+                        help="Read the paths to burn from stdin (one per line) and start burning while they arrive. Requires --yes.")
+    parser.add_argument("-0", "--null", action="store_true",
+                        help="With --from-stdin, paths are separated by NUL bytes (as from find -print0).")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="Burn directories and their contents. Symlinks are not followed and mount points are not crossed.")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_WORKERS,
+                        help=f"Number of parallel unlink workers when burning several files (default: {DEFAULT_WORKERS}).")
+    parser.add_argument("--duration", type=float, default=DEFAULT_BURN_DURATION, metavar="SECONDS",
+                        help=f"Total length of the burn animation, whatever the filename length (default: {DEFAULT_BURN_DURATION:g}).")
+    parser.add_argument("--fps", type=float, default=DEFAULT_FPS,
+                        help=f"Maximum animation frame rate (default: {DEFAULT_FPS:g}).")
+    parser.add_argument("--quality", choices=(QUALITY_AUTO,) + QUALITY_NAMES, default=QUALITY_AUTO,
+                        help="Pin the render quality instead of stepping down automatically when the terminal "
+                             "falls behind (default: auto).")
+    parser.add_argument("--backend", choices=("curses", "ansi"), default=None,
+                        help="Draw with curses (default) or with raw ANSI escape sequences, which needs no terminfo "
+                             "and keeps animating when stdout is piped (e.g. into a terminal recorder).")
+    parser.add_argument("--asciicast", metavar="PATH",
+                        help="Also record the animation to PATH as an asciicast v2 file (implies --backend ansi).")
+    parser.add_argument("--frame-stats", action="store_true",
+                        help="After the animation, report how many terminal cells were written per frame.")
+    parser.add_argument("--shred", type=int, metavar="N", default=0,
+                        help="Overwrite each file N times with random data before truncating, renaming and unlinking it.")
+    parser.add_argument("--smolder", action="store_true",
+                        help="Move files into a per-device trash with a single rename instead of deleting them.")
+    parser.add_argument("--gradual", action="store_true",
+                        help="Shrink large files step by step with ftruncate before unlinking them, so that huge "
+                             "deletions do not stall other I/O on the filesystem.")
+    parser.add_argument("--gradual-threshold", metavar="SIZE",
+                        help=f"Only shrink files of at least SIZE (default: {format_size(GRADUAL_DEFAULT_THRESHOLD)}).")
+    parser.add_argument("--gradual-step", metavar="SIZE",
+                        help=f"Bytes released per step (default: {format_size(GRADUAL_DEFAULT_STEP)}).")
+    parser.add_argument("--gradual-pause", type=float, metavar="SECONDS",
+                        help=f"Pause between steps (default: {GRADUAL_DEFAULT_PAUSE:g}).")
+    parser.add_argument("--gradual-rate", metavar="SIZE",
+                        help="Release at most SIZE per second in total across all workers, lengthening the pauses as needed.")
+    parser.add_argument("--restore", action="store_true",
+                        help="Move the given original paths back out of the trash.")
+    parser.add_argument("--purge-older-than", metavar="AGE",
+                        help="Permanently remove trash entries older than AGE (e.g. 30d, 12h, 45m; a bare number means days).")
+    parser.add_argument("--audit", metavar="LOG",
+                        help="Hash each file before burning it and append a JSON record of it and the outcome to LOG.")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run as a daemon that burns files on request over a Unix domain socket.")
+    parser.add_argument("--client", action="store_true",
+                        help="Send the burn to a running bfl --serve daemon and print its JSON results.")
+    parser.add_argument("--socket", metavar="PATH", default=None,
+                        help=f"Socket for --serve and --client (default: ${SOCKET_ENV_VAR}, "
+                             "else $XDG_RUNTIME_DIR/bfl.sock, else /tmp/bfl-UID.sock).")
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="Do not ask for confirmation.")
+    parser.add_argument("--no-animation", action="store_true",
+                        help="Delete right away and print one JSON object per line. Implied when stdout is not a terminal.")
+    parser.add_argument("--trace", metavar="PATH", default=os.environ.get(TRACE_ENV_VAR),
+                        help=f"Write render counters, phase timings and recent events as JSON to PATH at exit (default: ${TRACE_ENV_VAR}).")
+    args = parser.parse_args()
+    if args.duration < 0:
+        parser.error("--duration must not be negative")
+    if args.fps <= 0:
+        parser.error("--fps must be positive")
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.shred < 0:
+        parser.error("--shred must not be negative")
+    if args.shred and args.smolder:
+        parser.error("--shred and --smolder cannot be combined")
+    if args.restore and args.purge_older_than is not None:
+        parser.error("--restore and --purge-older-than cannot be combined")
+    gradual_options = {"threshold": args.gradual_threshold, "step": args.gradual_step,
+                       "pause": args.gradual_pause, "rate": args.gradual_rate}
+    if not args.gradual and any(value is not None for value in gradual_options.values()):
+        parser.error("the --gradual-* options need --gradual")
+    if args.gradual and (args.shred or args.smolder):
+        # Shredding must overwrite blocks before they are released, and smoldering releases nothing.
+        parser.error("--gradual cannot be combined with --shred or --smolder")
+    for key in ("threshold", "step", "rate"):
+        if gradual_options[key] is not None:
+            try:
+                gradual_options[key] = parse_size(gradual_options[key])
+            except ValueError as e:
+                parser.error(f"--gradual-{key}: {e}")
+    if gradual_options["step"] == 0 or gradual_options["rate"] == 0:
+        parser.error("--gradual-step and --gradual-rate must be positive")
+    if gradual_options["pause"] is not None and not 0 <= gradual_options["pause"] < float("inf"):
+        parser.error("--gradual-pause must be a finite, non-negative number")
+    gradual_options = {key: value for key, value in gradual_options.items() if value is not None}
+    max_age = None
+    if args.purge_older_than is not None:
+        try:
+            max_age = parse_age(args.purge_older_than)
+        except ValueError as e:
+            parser.error(f"--purge-older-than: {e}")
+    if args.null and not args.from_stdin:
+        parser.error("-0 only applies to --from-stdin")
+    if args.from_stdin:
+        if args.files_to_burn:
+            parser.error("--from-stdin does not take file arguments")
+        if args.restore or max_age is not None:
+            parser.error("--from-stdin only applies to burning")
+        if not args.yes:
+            parser.error("--from-stdin needs --yes, since stdin carries the paths rather than the answer")
+    elif not args.files_to_burn and max_age is None and not args.serve:
+        parser.error("the following arguments are required: file_to_burn")
+    if args.serve and args.client:
+        parser.error("--serve and --client cannot be combined")
+    if (args.serve or args.client) and (args.from_stdin or args.restore or max_age is not None):
+        parser.error("--serve and --client only apply to burning named files")
+    if args.serve and args.files_to_burn:
+        parser.error("--serve does not take file arguments")
+    if args.audit and (args.restore or max_age is not None):
+        parser.error("--audit only applies to burning")
+    if args.audit and args.client:
+        parser.error("--audit is set on the daemon: start it with bfl --serve --audit LOG")
+    socket_path = args.socket or default_socket_path()
+    if args.serve:
+        sys.exit(_serve_cli(socket_path, args.jobs, _open_audit_log(args.audit) if args.audit else None))
+
+    if args.asciicast and args.backend == "curses":
+        parser.error("--asciicast requires --backend ansi")
+    backend = args.backend or ("ansi" if args.asciicast else "curses")
+    headless = args.no_animation or (backend == "curses" and not sys.stdout.isatty())
+    if args.restore:
+        sys.exit(_restore_cli(args.files_to_burn, headless))
+    if max_age is not None:
+        if args.files_to_burn:
+            parser.error("--purge-older-than does not take file arguments")
+        if not args.yes:
+            _confirm_or_exit("permanently purge trash entries older than", args.purge_older_than, headless)
+        sys.exit(_purge_cli(max_age, args.jobs, headless))
+
+    if args.client:
+        if not args.yes:
+            _confirm_or_exit("digitally incinerate (via the daemon)", " ".join(args.files_to_burn), True)
+        mode = "shred" if args.shred else "smolder" if args.smolder else "unlink"
+        request = {"op": "burn", "paths": [os.path.abspath(path) for path in args.files_to_burn],
+                   "mode": mode, "recursive": args.recursive}
+        if args.shred:
+            request["passes"] = args.shred
+        if args.gradual:
+            request["gradual"] = gradual_options
+        sys.exit(_client_cli(request, socket_path))
+
+    targets, tree_roots, rejected = _collect_targets(args.files_to_burn, recursive=args.recursive)
+    if rejected and not headless:
+        for result in rejected:
+            print(f"{ConfirmAnsiColors.RED}Error: Cannot burn '{result.path}': {result.error}.{ConfirmAnsiColors.RESET}")
+        sys.exit(1)
+    if args.smolder:
+        # A whole directory goes to the trash with the same single rename as a file.
+        targets += [BurnTarget(root, 0) for root in tree_roots]
+        tree_roots = []
+
+    stream_input = None
+    if args.from_stdin:
+        if not args.recursive:
+            directories = DIRS_REJECT
+        else:
+            directories = DIRS_ENTRY if args.smolder else DIRS_TREE
+        stream_input = StreamInput(sys.stdin.buffer, b"\0" if args.null else b"\n", directories)
+        burn_label = "paths from stdin"
+    else:
+        burn_label = _describe_targets(targets, tree_roots)
+    shredder = Shredder(args.shred) if args.shred else None
+    if shredder is not None:
+        remover = shredder
+    elif args.smolder:
+        remover = Smolderer()
+    elif args.gradual:
+        remover = GradualTruncator(**gradual_options)
+    else:
+        remover = UNLINK
+
+    if not args.yes:
+        if shredder:
+            action = f"shred ({args.shred} pass{'es' if args.shred != 1 else ''}) and incinerate"
+        elif args.smolder:
+            action = "smolder (move to the trash)"
+        else:
+            action = "digitally incinerate"
+        _confirm_or_exit(action, burn_label, headless)
+
+    audit_log = None
+    if args.audit:
+        audit_log = _open_audit_log(args.audit)
+        remover = Auditor(remover, audit_log)
+
+    trace_path = args.trace
+    stats = RenderStats()
+    quality = None if args.quality == QUALITY_AUTO else QUALITY_NAMES.index(args.quality)
+
+    if headless:
+        exit_code = _burn_headless(targets, tree_roots, args.jobs, stats, remover, stream_input, rejected)
+        if audit_log is not None and not _close_audit_log(audit_log) and exit_code == 0:
+            exit_code = 1
+        _write_trace(trace_path, stats)
+        sys.exit(exit_code)
+
+    if backend == "ansi":
+        animator_class, tiled_animator_class = AnsiAnimator, AnsiTiledAnimator
+        render_error = ()
+    else:
+        _load_curses()
+        animator_class, tiled_animator_class = CursesAnimator, TiledAnimator
+        render_error = curses.error
+
+    results = None
+    tree_reports = []
+    animation_completed_without_curses_error = False
+
+    # Removal runs on a background worker while the animation plays; its progress drives the flames.
+    # Tree and stream sizes are unknown up front, so those burns only feed the status line.
+    if tree_roots or stream_input is not None:
+        progress = BurnProgress()
+    else:
+        progress = BurnProgress(total_entries=len(targets),
+                                total_bytes=sum(remover.work_bytes(target.size) for target in targets))
+    job = BurnJob(_run_burn, targets, tree_roots, args.jobs, progress, remover, stream_input)
+
+    animators = []
+
+    def curses_main_loop(stdscr, filename):
+        if len(targets) > 1 and not tree_roots:
+            # Several plain files burn side by side, one paper each, when the grid fits the terminal.
+            tiled = tiled_animator_class(stdscr, targets, filename, remover=remover, workers=args.jobs,
+                                         duration=args.duration, fps=args.fps, stats=stats, quality=quality,
+                                         cancel_event=progress.cancel_event)
+            animators.append(tiled)
+            if tiled.run_animation() is not None:
+                return
+            animators.pop()
+        animator = animator_class(stdscr, filename, duration=args.duration, fps=args.fps, progress=progress,
+                                  stats=stats, quality=quality)
+        animators.append(animator)
+        job.start()
+        animator.run_animation()
+
+    interrupted = False
+    try:
+        if backend == "ansi":
+            run_ansi(curses_main_loop, burn_label, cast_path=args.asciicast)
+        else:
+            curses.wrapper(curses_main_loop, burn_label)
+        animation_completed_without_curses_error = True
+
+        if animators and isinstance(animators[0], TiledAnimator):
+            results = animators[0].results
+        else:
+            remove_start = time.monotonic()
+            if not job.started:
+                # The animation bailed out before starting the work (e.g. terminal too small).
+                job.start()
+            (results, tree_reports), interrupted = join_cancelling(job, progress)
+            stats.record_phase("remove", time.monotonic() - remove_start)
+
+    except KeyboardInterrupt:
+        # Removal may already be under way; stop it where it is and report what was burned.
+        interrupted = True
+        progress.cancel()
+    except render_error as e:
+        print(f"\n{ConfirmAnsiColors.RED}A curses error occurred during animation: {e}{ConfirmAnsiColors.RESET}")
+        print("The terminal might be in an unusual state. Try running 'reset'.")
+    except Exception as e:
+        print(f"\n{ConfirmAnsiColors.RED}An unexpected error occurred: {e}{ConfirmAnsiColors.RESET}")
+    finally:
+        sys.stdout.write("\033[?25h") 
+        sys.stdout.flush()
+
+        if results is None and job.started:
+            # Removal was already under way when the animation failed; report what it did.
+            try:
+                (results, tree_reports), joined_interrupted = join_cancelling(job, progress)
+                interrupted = interrupted or joined_interrupted
+            except Exception as e:
+                print(f"\n{ConfirmAnsiColors.RED}An unexpected error occurred while burning: {e}{ConfirmAnsiColors.RESET}")
+        elif results is None and animators and isinstance(animators[0], TiledAnimator):
+            finished_results = [tile.result for tile in animators[0].tiles if tile.result is not None]
+            results = finished_results or None
+        audit_failed = audit_log is not None and not _close_audit_log(audit_log)
+
+        if results is not None:
+            _report_results(results, tree_reports, smoldered=args.smolder)
+            if shredder is not None:
+                _report_shred(shredder)
+            if args.gradual:
+                _report_gradual(_unwrap_remover(remover))
+            if audit_log is not None and not audit_failed:
+                _report_audit(audit_log)
+        elif animation_completed_without_curses_error:
+            print(f"\n{ConfirmAnsiColors.ORANGE}'{burn_label}' was NOT deleted (delete operation failed or was skipped after animation).{ConfirmAnsiColors.RESET}")
+        else:
+            print(f"\n{ConfirmAnsiColors.ORANGE}Animation did not complete successfully. '{burn_label}' was NOT deleted.{ConfirmAnsiColors.RESET}")
+
+        if interrupted:
+            print(f"{ConfirmAnsiColors.ORANGE}Interrupted: the burn was cancelled and anything not yet reached was left in place.{ConfirmAnsiColors.RESET}")
+
+        if args.frame_stats and animators and animators[0].frame is not None:
+            print(format_frame_stats(animators[0].stats, animators[0].clock.frames_dropped))
+
+        _write_trace(trace_path, stats)
+
+    if interrupted:
+        sys.exit(130)
+
+    if (results is None or audit_failed or not all(result.ok for result in results)
+            or any(report.failure_count for report in tree_reports)):
+        sys.exit(1)
 
 if __name__ == "__main__":
     main_cli()
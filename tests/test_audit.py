@@ -0,0 +1,55 @@
+import errno
+import json
+import os
+
+import pytest
+
+import bfl
+
+
+def _records(path):
+    with open(path) as log:
+        return [json.loads(line) for line in log]
+
+
+def _fail_once(monkeypatch, name):
+    real = getattr(os, name)
+    calls = []
+
+    def flaky(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise OSError(errno.ENOSPC, os.strerror(errno.ENOSPC))
+        return real(*args)
+
+    monkeypatch.setattr(os, name, flaky)
+
+
+@pytest.mark.parametrize("failing_call", ["write", "fsync"])
+def test_failed_flush_keeps_the_batch(tmp_path, monkeypatch, failing_call):
+    log = bfl.AuditLog(str(tmp_path / "audit.jsonl"), batch_records=2)
+    _fail_once(monkeypatch, failing_call)
+    log.add({"index": 0})
+    log.add({"index": 1})
+    assert log.error is not None and log.records_written == 0
+    log.add({"index": 2})  # Retries the kept batch along with the new record.
+    log.close()
+    assert [record["index"] for record in _records(log.path)] == [0, 1, 2]
+    assert log.records_written == 3 and log.error is None
+
+
+def test_close_raises_when_records_are_lost(tmp_path):
+    log = bfl.AuditLog("/dev/full", batch_records=1)
+    log.add({"index": 0})
+    assert log.records_pending == 1
+    with pytest.raises(OSError):
+        log.close()
+
+
+def test_log_failure_does_not_fail_a_removal(tmp_path):
+    victim = tmp_path / "victim"
+    victim.write_bytes(b"data")
+    log = bfl.AuditLog("/dev/full", batch_records=1)
+    result = bfl.burn_files([bfl.BurnTarget(str(victim), 4)], remover=bfl.Auditor(bfl.UNLINK, log))[0]
+    assert result.ok and not victim.exists()
+    assert log.error is not None and log.records_pending == 1
@@ -0,0 +1,73 @@
+import os
+
+import bfl
+
+
+class _CancellingUnlinker(bfl.Unlinker):
+    # Unlinks `limit` entries, then cancels the burn as Ctrl-C would.
+    def __init__(self, limit):
+        self.limit = limit
+        self.removed = 0
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        super().__call__(dir_fd, name, path, size, progress)
+        self.removed += 1
+        if self.removed == self.limit:
+            progress.cancel()
+
+
+def _targets(directory, count):
+    directory.mkdir(parents=True)
+    targets = []
+    for index in range(count):
+        path = directory / f"f{index}"
+        path.write_bytes(b"xy")
+        targets.append(bfl.BurnTarget(str(path), 2))
+    return targets
+
+
+def test_burn_files_leaves_the_rest_cancelled(tmp_path):
+    targets = _targets(tmp_path / "a", 10)
+    progress = bfl.BurnProgress(total_entries=10)
+    results = bfl.burn_files(targets, workers=1, progress=progress, remover=_CancellingUnlinker(3))
+    assert [result.ok for result in results] == [True] * 3 + [False] * 7
+    assert all(result.error == bfl.CANCELLED_ERROR for result in results[3:])
+    assert [os.path.exists(target.path) for target in targets] == [False] * 3 + [True] * 7
+    assert progress.snapshot().entries_done == 3
+
+
+def test_burn_files_cancelled_across_workers(tmp_path):
+    targets = [target for directory in "abcd" for target in _targets(tmp_path / directory, 5)]
+    progress = bfl.BurnProgress()
+    progress.cancel()
+    results = bfl.burn_files(targets, workers=4, progress=progress)
+    assert {result.error for result in results} == {bfl.CANCELLED_ERROR}
+    assert all(os.path.exists(target.path) for target in targets)
+
+
+def test_shredding_stops_mid_file_when_cancelled(tmp_path):
+    class CancelAfterFirstWrite(bfl.BurnProgress):
+        def record(self, entries=0, num_bytes=0, failures=0, error=None):
+            super().record(entries, num_bytes, failures, error)
+            if num_bytes:
+                self.cancel()
+
+    path = tmp_path / "victim"
+    path.write_bytes(b"x" * 65536)
+    progress = CancelAfterFirstWrite()
+    shredder = bfl.Shredder(3, buffer_size=4096)
+    (result,) = bfl.burn_files([bfl.BurnTarget(str(path), 65536)], progress=progress, remover=shredder)
+    assert result == bfl.BurnResult(str(path), False, bfl.CANCELLED_ERROR)
+    assert shredder.bytes_written == 4096 and path.exists()
+
+
+def test_tree_burner_reports_the_rest_cancelled(tmp_path):
+    root = tmp_path / "tree"
+    _targets(root / "nested", 150)
+    report = bfl.TreeBurner(str(root), workers=1, remover=_CancellingUnlinker(20)).run()
+    assert report.entries == 20
+    assert len(os.listdir(root / "nested")) == 130
+    # The whole directory is one queued batch: each file it leaves behind is reported, then the root.
+    assert report.failure_count == 130 + 1
+    assert {failure.error for failure in report.failures} == {bfl.CANCELLED_ERROR}
+    assert report.failures[-1] == bfl.BurnResult(str(root), False, bfl.CANCELLED_ERROR)
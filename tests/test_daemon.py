@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+import bfl
+
+
+def _file(tmp_path, name="victim", data=b"x" * 10):
+    path = tmp_path / name
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.mark.parametrize("request_, message", [
+    ({}, "'paths' must be a list of strings"),
+    ({"paths": "/tmp/x"}, "'paths' must be a list of strings"),
+    ({"paths": ["/tmp/x", 3]}, "'paths' must be a list of strings"),
+    ({"paths": [], "mode": "vaporize"}, "'mode' must be one of"),
+    ({"paths": [], "recursive": "false"}, "'recursive' must be true or false"),
+    ({"paths": [], "recursive": 1}, "'recursive' must be true or false"),
+    ({"paths": [], "mode": "shred", "passes": True}, "'passes' must be a positive integer"),
+    ({"paths": [], "mode": "shred", "passes": 0}, "'passes' must be a positive integer"),
+    ({"paths": [], "mode": "shred", "passes": 1.5}, "'passes' must be a positive integer"),
+    ({"paths": [], "mode": "shred", "gradual": {}}, "'gradual' only applies to mode 'unlink'"),
+    ({"paths": [], "gradual": []}, "'gradual' must be an object"),
+    ({"paths": [], "gradual": {"speed": 1}}, "unknown 'gradual' option 'speed'"),
+    ({"paths": [], "gradual": {"step": 0}}, "'gradual.step' must be a positive number"),
+    ({"paths": [], "gradual": {"pause": True}}, "'gradual.pause' must be a non-negative number"),
+    ({"paths": [], "gradual": {"threshold": -1}}, "'gradual.threshold' must be a non-negative number"),
+    ({"paths": [], "gradual": {"rate": float("inf")}}, "'gradual.rate' must be a positive number"),
+    ({"paths": [], "gradual": {"pause": float("nan")}}, "'gradual.pause' must be a non-negative number"),
+])
+def test_plan_request_rejects_invalid_requests(request_, message):
+    with pytest.raises(bfl.RequestError, match=message):
+        bfl._plan_request(request_)
+
+
+def test_plan_request_picks_the_remover():
+    assert bfl._plan_request({"paths": []})[3] is bfl.UNLINK
+    shredder = bfl._plan_request({"paths": [], "mode": "shred", "passes": 3})[3]
+    assert isinstance(shredder, bfl.Shredder) and shredder.passes == 3
+    assert isinstance(bfl._plan_request({"paths": [], "mode": "smolder"})[3], bfl.Smolderer)
+    truncator = bfl._plan_request({"paths": [], "gradual": {"threshold": 0, "step": 4096, "rate": None}})[3]
+    assert isinstance(truncator, bfl.GradualTruncator) and truncator.step == 4096
+
+
+def test_plan_request_sorts_paths(tmp_path):
+    victim = _file(tmp_path)
+    link = str(tmp_path / "link")
+    os.symlink("/nonexistent", link)
+    subdir = tmp_path / "dir"
+    subdir.mkdir()
+    targets, tree_roots, rejected, _ = bfl._plan_request(
+        {"paths": [victim, link, str(subdir), "relative", str(tmp_path / "missing")]})
+    assert targets == [bfl.BurnTarget(victim, 10), bfl.BurnTarget(link, 0)]
+    assert tree_roots == []
+    assert [(result.path, result.error) for result in rejected] == [
+        (str(subdir), "is a directory (set 'recursive' to burn it)"),
+        ("relative", "path must be absolute"),
+        (str(tmp_path / "missing"), os.strerror(2)),
+    ]
+    assert not any(result.ok for result in rejected)
+
+
+def test_plan_request_recursive_directories(tmp_path):
+    subdir = tmp_path / "dir"
+    subdir.mkdir()
+    assert bfl._plan_request({"paths": [str(subdir)], "recursive": True})[1] == [str(subdir)]
+    targets = bfl._plan_request({"paths": [str(subdir)], "recursive": True, "mode": "smolder"})[0]
+    assert targets == [bfl.BurnTarget(str(subdir), 0)]
+
+
+@pytest.mark.parametrize("path", ["/", "//", "/tmp/..", "/tmp/."])
+def test_plan_request_refuses_root_and_dot_paths(path):
+    _, tree_roots, rejected, _ = bfl._plan_request({"paths": [path], "recursive": True})
+    assert tree_roots == []
+    assert rejected[0].error.startswith("refusing to burn")
+
+
+@pytest.mark.parametrize("text", ["inf", "-inf", "nan", "1e400", "infM"])
+def test_parse_size_rejects_non_finite_sizes(text):
+    with pytest.raises(ValueError, match="must be a finite number"):
+        bfl.parse_size(text)
+
+
+@pytest.mark.parametrize("text", ["inf", "nan", "1e400d"])
+def test_parse_age_rejects_non_finite_ages(text):
+    with pytest.raises(ValueError, match="must be a finite number"):
+        bfl.parse_age(text)
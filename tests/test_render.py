@@ -0,0 +1,202 @@
+import os
+import sys
+import types
+from unittest import mock
+
+import pytest
+
+import bfl
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+import suite  # noqa: E402
+
+
+@pytest.fixture
+def virtual_clock():
+    clock = suite.VirtualClock()
+    virtual_time = types.SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep, time=bfl.time.time)
+    with mock.patch.object(bfl, "curses", suite._fake_curses()), mock.patch.object(bfl, "time", virtual_time):
+        yield clock
+
+
+def _animator(clock, name="burn-me.txt", progress=None, height=24, width=80):
+    animator = bfl.CursesAnimator(suite.RecordingScreen(height, width), name, progress=progress,
+                                  quality=bfl.QUALITY_FULL)
+    animator.clock._time = clock.monotonic
+    animator.clock._sleep = clock.sleep
+    animator._init_colors()
+    assert animator._setup_dimensions()
+    animator.timeline = bfl.build_timeline(animator.name_len, animator.animation_width, animator.seed)
+    return animator
+
+
+class _LoggingScreen(suite.RecordingScreen):
+    def __init__(self, height, width):
+        super().__init__(height, width)
+        self.writes = []
+
+    def addstr(self, y, x, text, attr=0):
+        super().addstr(y, x, text, attr)
+        self.writes.append((y, x, text, attr))
+
+
+def test_build_timeline_frames_fit_the_box():
+    timeline = bfl.build_timeline(12, 30)
+    for phase in timeline:
+        assert phase
+        for frame in phase:
+            assert len(frame) == bfl.ANIMATION_BOX_HEIGHT
+            for row in frame:
+                for x, text, role in row:
+                    width = text[1] - text[0] if role == bfl.ROLE_NAME else len(text)
+                    assert 0 <= x and x + width <= 30
+
+
+def test_build_timeline_reuses_cached_timelines():
+    bfl.build_timeline.cache_clear()
+    first = bfl.build_timeline(12, 30)
+    assert bfl.build_timeline(12, 30) is first
+    assert bfl.build_timeline.cache_info().hits == 1
+    assert bfl.build_timeline(12, 30, seed=2) is not first
+    for name_len in range(bfl.TIMELINE_CACHE_SIZE + 1):
+        bfl.build_timeline(name_len, 30, seed=3)
+    # Least recently used entries go first; the cache never grows past its size.
+    assert bfl.build_timeline.cache_info().currsize == bfl.TIMELINE_CACHE_SIZE
+    assert bfl.build_timeline(12, 30) is not first
+
+
+def test_build_timeline_depends_only_on_the_seed():
+    bfl.build_timeline.cache_clear()
+    first = bfl.build_timeline(12, 30, seed=7)
+    bfl.build_timeline.cache_clear()
+    assert bfl.build_timeline(12, 30, seed=7) == first
+    assert bfl.build_timeline(12, 30, seed=8) != first
+
+
+def test_frame_buffer_writes_only_changed_cells(virtual_clock):
+    screen = _LoggingScreen(3, 10)
+    buffer = bfl.FrameBuffer(3, 10, 0)
+    buffer.put(1, 2, "abc", 5)
+    assert buffer.flush(screen) == 3
+    assert screen.writes == [(1, 2, "abc", 5)]
+
+    screen.writes.clear()
+    buffer.put(1, 2, "abc", 5)
+    assert buffer.flush(screen) == 0
+    assert screen.writes == []
+
+    buffer.put(1, 2, "abd", 5)
+    assert buffer.flush(screen) == 1
+    assert screen.writes == [(1, 4, "d", 5)]
+    assert buffer.stats.counters["frames"] == 3
+    assert buffer.stats.counters["cells_written"] == 4
+
+
+def test_frame_buffer_merges_runs_by_attribute(virtual_clock):
+    screen = _LoggingScreen(2, 12)
+    buffer = bfl.FrameBuffer(2, 12, 0)
+    buffer.put(0, 0, "xxxx", 1)
+    buffer.put(0, 4, "yy", 2)
+    buffer.put(0, 7, "zz", 2)
+    assert buffer.flush(screen) == 8
+    # One run per attribute change, and a new run after an unchanged cell.
+    assert screen.writes == [(0, 0, "xxxx", 1), (0, 4, "yy", 2), (0, 7, "zz", 2)]
+
+    screen.writes.clear()
+    # Text is clipped to the screen, and cells that already show the right thing are skipped.
+    buffer.put(0, -2, "--xxab", 1)
+    buffer.put(1, 10, "long", 3)
+    buffer.flush(screen)
+    assert screen.writes == [(0, 2, "ab", 1), (1, 10, "lo", 3)]
+
+
+def test_render_stats_stay_bounded():
+    stats = bfl.RenderStats(recent_frames=4)
+    for cells in [0, 10, 5000] + [20] * 1000:
+        stats.record_frame(cells, cells)
+    trace = stats.to_dict()["cells_per_frame"]
+    assert trace["recent"] == [20] * 4
+    assert trace["max"] == 5000
+    assert trace["histogram"] == {"<=0": 1, "<=16": 1, "<=64": 1000, "<=256": 0, "<=1024": 0, "<=4096": 0,
+                                  ">4096": 1}
+    assert stats.counters["frames"] == 1003
+    assert bfl.format_frame_stats(stats, 2) == \
+        "Frame stats: 1003 frames, 25010 cells written (avg 24.9/frame, max 5000/frame), 2 frames dropped"
+
+
+def test_frame_clock_spreads_steps_over_the_duration(virtual_clock):
+    clock = bfl.FrameClock(10, time_fn=virtual_clock.monotonic, sleep_fn=virtual_clock.sleep)
+    steps = list(clock.frames(2.0, 100))
+    # Twenty frames at 10 fps fold a hundred steps, always ending on the last one.
+    assert len(steps) == 20 and steps == sorted(steps) and steps[-1] == 99
+    assert virtual_clock.now == pytest.approx(2.0)
+    assert clock.frames_dropped == 0
+
+    virtual_clock.now = 0.0
+    assert list(bfl.FrameClock(10, time_fn=virtual_clock.monotonic, sleep_fn=virtual_clock.sleep).frames(2.0, 5)) == \
+        [0, 1, 2, 3, 4]
+    assert virtual_clock.now == pytest.approx(2.0)
+
+
+def test_frame_clock_drops_frames_when_rendering_falls_behind(virtual_clock):
+    stats = bfl.RenderStats()
+    clock = bfl.FrameClock(10, time_fn=virtual_clock.monotonic, sleep_fn=virtual_clock.sleep, stats=stats)
+    steps = []
+    for step in clock.frames(2.0, 20):
+        steps.append(step)
+        virtual_clock.sleep(0.25)  # each frame takes two and a half periods to render
+    assert steps[-1] == 19 and len(steps) < 20
+    assert clock.frames_dropped == 20 - len(steps)
+    assert stats.counters["frames_dropped"] == clock.frames_dropped
+    # Late frames are dropped rather than stretching the phase: at most one render past the budget.
+    assert virtual_clock.now <= 2.0 + 0.25
+
+
+def _consumption_steps(animator, clock, work):
+    # Plays consumption while work(now) drives the progress; returns (time, step shown) per frame.
+    frames = animator.timeline.consumption
+    shown = []
+    animator._blit = lambda frame: shown.append((clock.now, frames.index(frame)))
+    real_sleep = clock.sleep
+
+    def sleep(seconds):
+        real_sleep(seconds)
+        work(clock.now)
+
+    animator.clock._sleep = sleep
+    animator._animation_deadline = clock.now + animator.duration
+    animator._animate_consumption()
+    return shown
+
+
+def test_unknown_total_keeps_burning_until_the_work_is_done(virtual_clock):
+    progress = bfl.BurnProgress()
+    animator = _animator(virtual_clock, progress=progress)
+
+    def work(now):
+        if now < 20.0:
+            progress.record(entries=1)
+        elif not progress.snapshot().finished:
+            progress.finish()
+
+    shown = _consumption_steps(animator, virtual_clock, work)
+    frames = len(animator.timeline.consumption)
+    hold = int(bfl.UNKNOWN_TOTAL_BURN_FRACTION * frames)
+    assert shown[-1][1] == frames - 1 and shown[-1][0] >= 20.0
+    held = [step for now, step in shown if animator.duration < now < 20.0]
+    assert held and all(hold - max(bfl.UNKNOWN_TOTAL_FLICKER_OFFSETS) <= step <= hold for step in held)
+    assert len(set(held)) > 1
+
+
+def test_unknown_total_flames_stall_with_the_work(virtual_clock):
+    progress = bfl.BurnProgress()
+    animator = _animator(virtual_clock, progress=progress)
+
+    def work(now):
+        if now < 8.0:
+            progress.record(entries=1)
+        elif now >= 14.0:
+            progress.finish()
+
+    shown = _consumption_steps(animator, virtual_clock, work)
+    assert len({step for now, step in shown if 8.5 < now < 14.0}) == 1
@@ -0,0 +1,179 @@
+import os
+import threading
+import time
+
+import pytest
+
+import bfl
+
+
+class _Recorder:
+    # Records what it is handed and removes nothing; optionally waits for `gate` first.
+    outcome = "recorded"
+
+    def __init__(self, gate=None):
+        self.gate = gate
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def work_bytes(self, size):
+        return size
+
+    def __call__(self, dir_fd, name, path, size, progress):
+        if self.gate is not None:
+            self.gate.wait()
+        with self._lock:
+            self.calls.append(path)
+        progress.record(num_bytes=size)
+
+
+def _files(directory, count, data=b"abc"):
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"f{index}"
+        path.write_bytes(data)
+        paths.append(str(path))
+    return paths
+
+
+def _source(tmp_path, data):
+    path = tmp_path / "input"
+    path.write_bytes(data)
+    return open(path, "rb")
+
+
+def _burn(tmp_path, data, **kwargs):
+    with _source(tmp_path, data) as source:
+        return bfl.StreamBurner(source, **kwargs).run()
+
+
+def test_burns_delimited_paths(tmp_path):
+    paths = _files(tmp_path / "a", 3) + _files(tmp_path / "b", 2)
+    report = _burn(tmp_path, "\n".join(paths).encode() + b"\n", delimiter=b"\n", workers=2)
+    assert (report.entries, report.bytes, report.failure_count) == (5, 15, 0)
+    assert not any(os.path.exists(path) for path in paths)
+
+
+def test_reports_missing_and_special_entries(tmp_path):
+    (first,) = _files(tmp_path / "a", 1)
+    report = _burn(tmp_path, b"\0".join([first.encode(), first.encode(), b"/dev/null"]))
+    assert (report.entries, report.failure_count) == (1, 2)
+    # The repeat passes its lstat and only fails once its batch reaches a worker.
+    assert sorted(failure.error for failure in report.failures) == ["No such file or directory", "not a regular file"]
+
+
+def test_overlong_entry_spanning_reads_is_skipped(tmp_path, monkeypatch):
+    monkeypatch.setattr(bfl, "STREAM_READ_SIZE", 1000)
+    first, second = _files(tmp_path / "a", 2)
+    overlong = b"x" * 10000
+    report = _burn(tmp_path, b"\0".join([first.encode(), overlong, second.encode(), b""]))
+    assert (report.entries, report.failure_count) == (2, 1)
+    (failure,) = report.failures
+    assert failure.path == "x" * bfl.STREAM_OVERLONG_SHOWN + "..."
+    assert failure.error.startswith("path longer than")
+
+
+def test_overlong_trailing_entry_without_delimiter(tmp_path, monkeypatch):
+    monkeypatch.setattr(bfl, "STREAM_READ_SIZE", 1000)
+    (first,) = _files(tmp_path / "a", 1)
+    report = _burn(tmp_path, first.encode() + b"\0" + b"y" * 10000)
+    assert (report.entries, report.failure_count) == (1, 1)
+    assert report.failures[0].path.startswith("yyy") and report.failures[0].error.startswith("path longer than")
+
+
+def test_short_trailing_entry_without_delimiter(tmp_path):
+    first, second = _files(tmp_path / "a", 2)
+    report = _burn(tmp_path, f"{first}\0{second}".encode())
+    assert (report.entries, report.failure_count) == (2, 0)
+
+
+def test_directories_are_rejected_by_default(tmp_path):
+    _files(tmp_path / "tree" / "nested", 3)
+    report = _burn(tmp_path, str(tmp_path / "tree").encode())
+    assert report.failures[0].error == "is a directory (use -r to burn it recursively)"
+    assert (tmp_path / "tree").exists()
+
+
+def test_directories_are_burned_as_trees(tmp_path):
+    _files(tmp_path / "tree" / "nested", 3)
+    (loose,) = _files(tmp_path / "loose", 1)
+    data = f"{tmp_path / 'tree'}\0{loose}\0/\0".encode()
+    report = _burn(tmp_path, data, directories=bfl.DIRS_TREE)
+    # The tree's three files and two directories, the loose file, and a refusal for the root.
+    assert (report.entries, report.bytes, report.failure_count) == (6, 12, 1)
+    assert report.failures[0].error == "refusing to burn the root directory"
+    assert not (tmp_path / "tree").exists() and not os.path.exists(loose)
+
+
+def test_directories_as_single_entries(tmp_path):
+    _files(tmp_path / "tree", 3)
+    remover = _Recorder()
+    report = _burn(tmp_path, str(tmp_path / "tree").encode(), directories=bfl.DIRS_ENTRY, remover=remover)
+    assert (report.entries, report.failure_count) == (1, 0)
+    assert remover.calls == [str(tmp_path / "tree")]
+
+
+def test_batches_by_directory_and_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(bfl, "UNLINK_CHUNK_SIZE", 10)
+    batches = []
+    real_unlink_group = bfl._unlink_group
+
+    def unlink_group(dir_path, entries, progress, remover):
+        batches.append((dir_path, len(entries)))
+        return real_unlink_group(dir_path, entries, progress, remover)
+
+    monkeypatch.setattr(bfl, "_unlink_group", unlink_group)
+    paths = _files(tmp_path / "a", 25) + _files(tmp_path / "b", 5)
+    report = _burn(tmp_path, b"\0".join(path.encode() for path in paths), workers=3)
+    assert (report.entries, report.failure_count) == (30, 0)
+    assert sorted(batches) == sorted([(str(tmp_path / "a"), 10), (str(tmp_path / "a"), 10),
+                                      (str(tmp_path / "a"), 5), (str(tmp_path / "b"), 5)])
+
+
+def test_reader_is_held_back_by_slow_workers(tmp_path, monkeypatch):
+    # One path per directory makes every path its own batch.
+    paths = [path for index in range(200) for path in _files(tmp_path / str(index), 1)]
+    submitted = []
+    real_submit = bfl.StreamBurner._submit
+    monkeypatch.setattr(bfl.StreamBurner, "_submit", lambda self, path: (submitted.append(path), real_submit(self, path)))
+    gate = threading.Event()
+    remover = _Recorder(gate)
+    reports = []
+    with _source(tmp_path, b"\0".join(path.encode() for path in paths)) as source:
+        burner = bfl.StreamBurner(source, workers=1, remover=remover)
+        thread = threading.Thread(target=lambda: reports.append(burner.run()))
+        thread.start()
+        time.sleep(0.3)
+        # The queued batches, the one being removed and the one the reader holds.
+        assert len(submitted) <= bfl.STREAM_PENDING_BATCHES_PER_WORKER + 3
+        gate.set()
+        thread.join(10)
+    assert (reports[0].entries, reports[0].failure_count) == (200, 0)
+    assert len(remover.calls) == 200
+
+
+def test_cancel_stops_a_quiet_producer(tmp_path):
+    read_fd, write_fd = os.pipe()
+    progress = bfl.BurnProgress()
+    reports = []
+    with open(read_fd, "rb") as source:
+        thread = threading.Thread(target=lambda: reports.append(bfl.StreamBurner(source, progress=progress).run()))
+        thread.start()
+        progress.cancel()
+        thread.join(5)
+        os.close(write_fd)
+    assert not thread.is_alive()
+    assert reports[0].failures[-1] == bfl.BurnResult(bfl.STDIN_LABEL, False, bfl.CANCELLED_ERROR)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_worker_errors_do_not_block_the_reader(tmp_path, workers):
+    class Broken(_Recorder):
+        def __call__(self, dir_fd, name, path, size, progress):
+            raise RuntimeError("boom")
+
+    paths = [path for index in range(50) for path in _files(tmp_path / str(index), 1)]
+    report = _burn(tmp_path, b"\0".join(path.encode() for path in paths), workers=workers, remover=Broken())
+    assert (report.entries, report.failure_count) == (0, 50)
+    assert report.failures[0].error == "boom"
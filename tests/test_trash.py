@@ -0,0 +1,215 @@
+import json
+import os
+
+import pytest
+
+import bfl
+
+
+@pytest.fixture
+def trash_root(tmp_path, monkeypatch):
+    # Only the home trash under tmp_path is known, so nothing outside the test is restored or purged.
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    root = bfl._home_trash_root()
+    monkeypatch.setattr(bfl, "known_trash_roots", lambda: [root] if os.path.isdir(root) else [])
+    return root
+
+
+def _files(directory, count):
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"f{index}"
+        path.write_bytes(b"x" * index)
+        paths.append(str(path))
+    return paths
+
+
+def _smolder(paths):
+    targets = [bfl.BurnTarget(path, os.path.getsize(path)) for path in paths]
+    results = bfl.burn_files(targets, remover=bfl.Smolderer())
+    assert all(result.ok for result in results)
+
+
+def _index_ops(root):
+    trash = bfl.Trash(root)
+    ops = []
+    for number in trash.segments():
+        with open(trash.segment_path(number)) as segment:
+            ops.extend(json.loads(line)["op"] for line in segment)
+    return ops
+
+
+def _record(op, entry_id, **fields):
+    return dict({"op": op, "id": entry_id, "at": 1.0}, **fields)
+
+
+def test_smolder_moves_files_into_the_trash(tmp_path, trash_root):
+    paths = _files(tmp_path / "src", 3)
+    _smolder(paths)
+    assert not any(os.path.lexists(path) for path in paths)
+    entries = bfl.Trash(trash_root).live_by_path()
+    assert sorted(entries) == sorted(paths)
+    for path, entry in entries.items():
+        assert entry.kind == "file"
+        assert os.path.getsize(bfl.Trash(trash_root).payload_path(entry.id)) == int(path[-1])
+
+
+def test_smolder_refuses_the_trash_itself(tmp_path, trash_root):
+    _smolder(_files(tmp_path / "src", 1))
+    trash = bfl.Trash(trash_root)
+    payload = trash.payload_path(next(iter(trash.live_entries())))
+    result = bfl.burn_files([bfl.BurnTarget(payload, 0)], remover=bfl.Smolderer())[0]
+    assert not result.ok and result.error == "already in the trash"
+
+
+def test_restore_replays_tombstones(tmp_path, trash_root):
+    paths = _files(tmp_path / "src", 3)
+    _smolder(paths)
+    results = bfl.restore_paths([paths[0], paths[0], str(tmp_path / "never")])
+    assert [(result.ok, result.error) for result in results] == [
+        (True, None), (False, "not found in the trash"), (False, "not found in the trash")]
+    assert os.path.getsize(paths[0]) == 0
+    assert sorted(bfl.Trash(trash_root).live_by_path()) == sorted(paths[1:])
+    assert _index_ops(trash_root) == ["smolder"] * 3 + ["restore"]
+
+
+def test_restore_keeps_an_existing_file(tmp_path, trash_root):
+    paths = _files(tmp_path / "src", 2)
+    _smolder(paths)
+    with open(paths[1], "wb") as replacement:
+        replacement.write(b"new")
+    result = bfl.restore_paths([paths[1]])[0]
+    assert not result.ok and result.error == "a file already exists at the original location"
+    assert paths[1] in bfl.Trash(trash_root).live_by_path()
+
+
+def test_restore_prefers_the_latest_smolder(tmp_path, trash_root):
+    path = _files(tmp_path / "src", 2)[1]
+    _smolder([path])
+    with open(path, "wb") as second:
+        second.write(b"second")
+    _smolder([path])
+    assert bfl.restore_paths([path])[0].ok
+    with open(path, "rb") as restored:
+        assert restored.read() == b"second"
+    assert list(bfl.Trash(trash_root).live_by_path()) == [path]
+
+
+def test_purge_removes_expired_entries(tmp_path, trash_root):
+    paths = _files(tmp_path / "src", 3)
+    _smolder(paths)
+    assert bfl.purge_trash(3600) == []
+    reports = bfl.purge_trash(0, now=bfl.time.time() + 1)
+    assert [(report.trash, report.purged, report.bytes, report.failures) for report in reports] == [
+        (trash_root, 3, 3, [])]
+    assert bfl.Trash(trash_root).live_entries() == {}
+    assert os.listdir(os.path.join(trash_root, bfl.TRASH_FILES_DIR)) == []
+    assert bfl.restore_paths([paths[0]])[0].error == "not found in the trash"
+
+
+def test_purge_removes_smoldered_directories(tmp_path, trash_root):
+    directory = tmp_path / "tree"
+    _files(directory / "nested", 4)
+    _smolder([str(directory)])
+    assert bfl.Trash(trash_root).live_by_path()[str(directory)].kind == "dir"
+    report = bfl.purge_trash(0, now=bfl.time.time() + 1)[0]
+    assert report.purged == 1 and report.failures == []
+    assert os.listdir(os.path.join(trash_root, bfl.TRASH_FILES_DIR)) == []
+
+
+def test_replay_skips_a_torn_record(tmp_path, trash_root):
+    paths = _files(tmp_path / "src", 2)
+    _smolder(paths)
+    with open(os.path.join(trash_root, bfl.TRASH_INDEX_NAME), "a") as index:
+        index.write('{"op": "restore", "id"')
+    assert sorted(bfl.Trash(trash_root).live_by_path()) == sorted(paths)
+
+
+def test_segments_rotate_and_dead_ones_are_deleted(tmp_path, trash_root, monkeypatch):
+    monkeypatch.setattr(bfl, "TRASH_SEGMENT_BYTES", 1)  # Every append fills its segment.
+    paths = _files(tmp_path / "src", 4)
+    for path in paths:
+        _smolder([path])
+    trash = bfl.Trash(trash_root)
+    assert trash.segments() == [0, 1, 2, 3, 4]
+    assert bfl.restore_paths([paths[0]])[0].ok
+    # The smolder segment and the one with its tombstone are gone; no file was rewritten.
+    assert trash.segments() == [1, 2, 3, 5]
+    assert _index_ops(trash_root) == ["smolder"] * 3
+    assert sorted(trash.live_by_path()) == sorted(paths[1:])
+    assert bfl.restore_paths([paths[2]])[0].ok
+    assert os.path.exists(paths[2])
+
+
+def test_segment_with_a_needed_tombstone_is_kept(trash_root, monkeypatch):
+    monkeypatch.setattr(bfl, "TRASH_SEGMENT_BYTES", 1)
+    trash = bfl.Trash(trash_root)
+    trash.ensure()
+    a, c, d = "a" * 16, "c" * 16, "d" * 16
+    trash.append([_record("smolder", a, path="/a"), _record("smolder", c, path="/c")])
+    trash.append([_record("smolder", d, path="/d")])
+    trash.append([_record("purge", a), _record("purge", d)])
+    assert trash.drop_dead_segments() == 1
+    # Segment 2 still cancels "a", whose smolder record shares segment 0 with the live "c".
+    assert trash.segments() == [0, 2, 3]
+    assert list(trash.live_entries()) == [c]
+
+
+@pytest.mark.parametrize("entry_id", ["0123456789abcdeF", "0123456789abcde", "0123456789abcdef0", "", 7, None])
+def test_records_with_malformed_ids_are_skipped(trash_root, entry_id):
+    trash = bfl.Trash(trash_root)
+    trash.ensure()
+    trash.append([_record("smolder", entry_id, path="/gone"), _record("smolder", "0" * 16, path="/kept")])
+    assert list(trash.live_entries()) == ["0" * 16]
+    with pytest.raises(ValueError):
+        trash.payload_path(entry_id)
+
+
+@pytest.mark.parametrize("relative", [False, True])
+def test_purge_never_leaves_the_trash(tmp_path, trash_root, relative):
+    victim = tmp_path / "victim"
+    (victim / "inner").mkdir(parents=True)
+    trash = bfl.Trash(trash_root)
+    trash.ensure()
+    entry_id = os.path.relpath(str(victim), trash.files_dir) if relative else str(victim)
+    trash.append([_record("smolder", entry_id, path=str(tmp_path / "gone"), kind="dir")])
+    assert bfl.purge_trash(0, now=bfl.time.time() + 1) == []
+    assert (victim / "inner").is_dir()
+
+
+def test_trash_root_must_be_private(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    root = bfl._home_trash_root()
+    os.makedirs(root)
+    os.chmod(root, 0o755)
+    assert bfl.trash_root_problem(root) == "has mode 755 instead of 700"
+    assert root not in bfl.known_trash_roots()
+    with pytest.raises(OSError, match="refusing to use trash"):
+        bfl.Trash(root).ensure()
+    victim = tmp_path / "victim"
+    victim.write_bytes(b"x")
+    result = bfl.burn_files([bfl.BurnTarget(str(victim), 1)], remover=bfl.Smolderer())[0]
+    assert not result.ok and victim.exists()
+    os.chmod(root, 0o700)
+    assert bfl.trash_root_problem(root) is None
+    assert root in bfl.known_trash_roots()
+
+
+def test_trash_root_must_not_be_a_symlink(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    root = bfl._home_trash_root()
+    planted = tmp_path / "planted"
+    planted.mkdir(mode=0o700)
+    os.makedirs(os.path.dirname(root))
+    os.symlink(str(planted), root)
+    assert bfl.trash_root_problem(root) == "is not a directory"
+    assert root not in bfl.known_trash_roots()
+
+
+@pytest.mark.skipif(not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root to chown")
+def test_trash_root_owned_by_someone_else_is_refused(tmp_path):
+    root = tmp_path / ".bfl-trash-0"
+    root.mkdir(mode=0o700)
+    os.chown(str(root), 12345, 12345)
+    assert bfl.trash_root_problem(str(root)) == "is owned by another user"
@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+import bfl
+
+
+def _make_chain(root, depth, name, files_per_level):
+    # Built through descriptors, since the full path ends up longer than PATH_MAX.
+    os.mkdir(root)
+    fd = os.open(root, os.O_RDONLY)
+    try:
+        for _ in range(depth):
+            for index in range(files_per_level):
+                os.close(os.open(f"f{index}", os.O_WRONLY | os.O_CREAT, 0o600, dir_fd=fd))
+            os.mkdir(name, dir_fd=fd)
+            child = os.open(name, os.O_RDONLY, dir_fd=fd)
+            os.close(fd)
+            fd = child
+    finally:
+        os.close(fd)
+    return depth * (files_per_level + 1) + 1
+
+
+def test_burns_a_tree(tmp_path):
+    root = tmp_path / "tree"
+    for directory in range(5):
+        (root / str(directory) / "nested").mkdir(parents=True)
+        for index in range(300):
+            (root / str(directory) / "nested" / str(index)).write_bytes(b"xy")
+    report = bfl.TreeBurner(str(root), workers=4).run()
+    assert (report.entries, report.bytes, report.failure_count) == (1511, 3000, 0)
+    assert not root.exists()
+
+
+def test_refuses_dot_and_root():
+    assert bfl.refused_tree_root("/") == "refusing to burn the root directory"
+    assert bfl.refused_tree_root("//") == "refusing to burn the root directory"
+    assert bfl.refused_tree_root("/tmp/../") == "refusing to burn '.' or '..'"
+    assert bfl.refused_tree_root("some/dir/.") is not None
+    assert bfl.refused_tree_root("..") is not None
+    assert bfl.refused_tree_root("/tmp") is None
+
+
+def test_depth_is_not_limited_by_descriptors_or_path_max(tmp_path):
+    resource = pytest.importorskip("resource")
+    root = str(tmp_path / "deep")
+    expected = _make_chain(root, 300, "d" * 30, 2)  # About 9 KB deep.
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (64, hard))
+    try:
+        report = bfl.TreeBurner(root, workers=8).run()
+    finally:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+    assert (report.entries, report.failure_count) == (expected, 0)
+    assert not os.path.exists(root)